@@ -1,28 +1,135 @@
 # isort: dont-add-imports
 
 from datetime import date
-from importlib import metadata
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
 
 __title__ = "aiordr"
 __author__ = "Nice Aesthetics"
 __license__ = "GPLv3+"
 __copyright__ = f"Copyright {date.today().year} {__author__}"
 
-from . import exceptions
-from . import helpers
-from . import models
-from .client import *
+if TYPE_CHECKING:
+    from . import exceptions
+    from . import helpers
+    from . import models
+    from .catalog import *
+    from .client import *
+    from .dedup import *
+    from .download import *
+    from .engine import *
+    from .eta import *
+    from .health import *
+    from .history import *
+    from .httpcache import *
+    from .limiter import *
+    from .offload import *
+    from .polling import *
+    from .preflight import *
+    from .presets import *
+    from .recording import *
+    from .stream import *
+    from .sync import *
 
 __all__ = (
+    "CachedResponse",
+    "DedupEntry",
+    "DropPolicy",
+    "ETATracker",
+    "EngineConnectionError",
+    "EventPlayer",
+    "EventRecorder",
+    "EventStream",
+    "FileRateLimiter",
+    "HTTPCache",
+    "HealthMonitor",
+    "LoopStallMonitor",
+    "NativeSocket",
+    "RateCoordinator",
+    "RateLimiter",
+    "RemoteRateLimiter",
+    "RenderDedupCache",
+    "RenderDownloader",
+    "RenderEstimate",
+    "RenderHistory",
+    "RenderPhase",
+    "RenderPoller",
+    "RenderPreflight",
+    "RenderPresets",
+    "SkinCatalog",
     "exceptions",
     "helpers",
     "models",
     "ordrClient",
+    "ordrSyncClient",
 )
 
-try:
-    __version__ = metadata.version(__package__)
-except metadata.PackageNotFoundError:
-    import toml
+# Submodules are imported on first attribute access to keep `import aiordr` cheap.
+_LAZY_ATTRS: dict[str, str] = {
+    "CachedResponse": "httpcache",
+    "DedupEntry": "dedup",
+    "DeveloperModes": "client",
+    "DropPolicy": "stream",
+    "ETATracker": "eta",
+    "EngineConnectionError": "engine",
+    "EventPlayer": "recording",
+    "EventRecorder": "recording",
+    "EventStream": "stream",
+    "FileRateLimiter": "limiter",
+    "HTTPCache": "httpcache",
+    "HealthMonitor": "health",
+    "LoopStallMonitor": "offload",
+    "NativeSocket": "engine",
+    "RateCoordinator": "limiter",
+    "RateLimiter": "limiter",
+    "RemoteRateLimiter": "limiter",
+    "RenderDedupCache": "dedup",
+    "RenderDownloader": "download",
+    "RenderEstimate": "eta",
+    "RenderHistory": "history",
+    "RenderPhase": "eta",
+    "RenderPoller": "polling",
+    "RenderPreflight": "preflight",
+    "RenderPresets": "presets",
+    "SkinCatalog": "catalog",
+    "SocketEngine": "client",
+    "ordrClient": "client",
+    "ordrSyncClient": "sync",
+}
 
-    __version__ = toml.load("pyproject.toml")["tool"]["poetry"]["version"] + "dev"
+
+def _get_version() -> str:
+    from importlib import metadata
+
+    try:
+        return metadata.version(__package__)
+    except metadata.PackageNotFoundError:
+        import toml
+
+        return toml.load("pyproject.toml")["tool"]["poetry"]["version"] + "dev"
+
+
+def _import_submodule(name: str) -> Any:
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    elif name == "__version__":
+        value = _get_version()
+    else:
+        value = _import_submodule(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__, *_LAZY_ATTRS, "__version__"})
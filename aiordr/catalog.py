@@ -0,0 +1,294 @@
+"""This module contains a local, searchable skin catalog."""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import gzip
+import os
+import re
+from typing import TYPE_CHECKING
+
+import orjson
+
+from .models import Skin
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .client import ordrClient
+
+
+__all__ = ("SkinCatalog",)
+
+_INDEX_VERSION = 1
+_SKIN_FIELDS: tuple[str, ...] = tuple(
+    field.alias or name for name, field in Skin.model_fields.items()
+)
+_NORMALIZE_RE = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_skin_name(name: str) -> str:
+    """Returns the normalized search key of a skin name."""
+    return _NORMALIZE_RE.sub("", name.casefold())
+
+
+class SkinCatalog:
+    __slots__ = (
+        "_client",
+        "_path",
+        "_page_size",
+        "_skins",
+        "_by_key",
+        "_keys",
+        "_key_ids",
+        "_max_skins",
+    )
+
+    def __init__(
+        self,
+        client: ordrClient | None = None,
+        path: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        r"""Local skin catalog with offline search.
+
+        :param client: Client used to synchronize the catalog, defaults to None
+        :type client: ``Optional[aiordr.ordrClient]``
+        :param path: Path of the on-disk index, defaults to None
+        :type path: ``Optional[str]``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *page_size* (``int``) --
+                Optional, number of skins fetched per request, defaults to 100
+        """
+        self._client = client
+        self._path = path
+        self._page_size: int = kwargs.pop("page_size", 100)
+        self._skins: dict[int, Skin] = {}
+        self._by_key: dict[str, list[int]] = {}
+        self._keys: list[str] = []
+        self._key_ids: list[list[int]] = []
+        self._max_skins: int = 0
+
+        if path is not None and os.path.exists(path):
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self._skins)
+
+    def __contains__(self, skin: object) -> bool:
+        if isinstance(skin, int):
+            return skin in self._skins
+        if isinstance(skin, str):
+            return normalize_skin_name(skin) in self._by_key
+        return False
+
+    @property
+    def max_skins(self) -> int:
+        """Number of skins reported by the API during the last sync."""
+        return self._max_skins
+
+    def _rebuild(self) -> None:
+        by_key: dict[str, list[int]] = {}
+        for skin in self._skins.values():
+            for key in {
+                normalize_skin_name(skin.name),
+                normalize_skin_name(skin.presentation_name),
+            }:
+                if key:
+                    by_key.setdefault(key, []).append(skin.id)
+        for ids in by_key.values():
+            ids.sort(key=lambda x: -self._skins[x].times_used)
+        self._by_key = by_key
+        self._keys = sorted(by_key)
+        self._key_ids = [by_key[key] for key in self._keys]
+
+    def _ranked(self, ids: list[int], limit: int) -> list[Skin]:
+        unique = dict.fromkeys(ids)
+        skins = sorted(
+            (self._skins[x] for x in unique),
+            key=lambda x: -x.times_used,
+        )
+        return skins[:limit]
+
+    def get(self, skin_id: int) -> Skin | None:
+        r"""Get a skin by ID.
+
+        :param skin_id: Skin ID
+        :type skin_id: ``int``
+        :return: Skin, or None if it is unknown
+        :rtype: ``Optional[aiordr.models.skin.Skin]``
+        """
+        return self._skins.get(skin_id)
+
+    def resolve(self, skin: str | int) -> Skin | None:
+        r"""Resolve a skin ID or name to a skin.
+
+        :param skin: Skin ID or name
+        :type skin: ``Union[str, int]``
+        :return: Skin, or None if it is unknown
+        :rtype: ``Optional[aiordr.models.skin.Skin]``
+        """
+        if isinstance(skin, int):
+            return self._skins.get(skin)
+        ids = self._by_key.get(normalize_skin_name(skin))
+        if not ids:
+            return None
+        return self._skins[ids[0]]
+
+    def name_of(self, skin_id: int) -> str | None:
+        r"""Resolve a skin ID to its name.
+
+        :param skin_id: Skin ID
+        :type skin_id: ``int``
+        :return: Skin name, or None if it is unknown
+        :rtype: ``Optional[str]``
+        """
+        skin = self._skins.get(skin_id)
+        return skin.name if skin is not None else None
+
+    def search(self, query: str, limit: int = 5, fuzzy: bool = True) -> list[Skin]:
+        r"""Search the catalog locally.
+
+        Prefix matches are returned first, ordered by usage. If there are not
+        enough of them, close matches are added when ``fuzzy`` is enabled.
+
+        :param query: Search query
+        :type query: ``str``
+        :param limit: Maximum number of results, defaults to 5
+        :type limit: ``int``
+        :param fuzzy: Whether to add close matches, defaults to True
+        :type fuzzy: ``bool``
+        :return: Matching skins
+        :rtype: ``list[aiordr.models.skin.Skin]``
+        """
+        key = normalize_skin_name(query)
+        if not key:
+            return self._ranked(list(self._skins), limit)
+
+        start = bisect.bisect_left(self._keys, key)
+        end = bisect.bisect_left(self._keys, key + "\x7f", lo=start)
+        ids = [x for ids in self._key_ids[start:end] for x in ids]
+        results = self._ranked(ids, limit)
+
+        if fuzzy and len(results) < limit:
+            seen = {x.id for x in results}
+            close = difflib.get_close_matches(key, self._keys, n=limit, cutoff=0.6)
+            for match in close:
+                for skin_id in self._by_key[match]:
+                    if skin_id not in seen and len(results) < limit:
+                        seen.add(skin_id)
+                        results.append(self._skins[skin_id])
+        return results
+
+    def update(self, skins: list[Skin], max_skins: int | None = None) -> int:
+        r"""Merge skins into the catalog.
+
+        :param skins: Skins to merge
+        :type skins: ``list[aiordr.models.skin.Skin]``
+        :param max_skins: Number of skins reported by the API, defaults to None
+        :type max_skins: ``Optional[int]``
+        :return: Number of skins that were not known before
+        :rtype: ``int``
+        """
+        added = 0
+        for skin in skins:
+            if skin.id not in self._skins:
+                added += 1
+            self._skins[skin.id] = skin
+        if max_skins is not None:
+            self._max_skins = max_skins
+        self._rebuild()
+        return added
+
+    async def sync(self, full: bool = False) -> int:
+        r"""Synchronize the catalog with the API.
+
+        Pages are fetched in order until one contains no unknown skin, and
+        merged, refreshing ``times_used`` of the skins on them. If ``full``
+        is set or the catalog is empty, every page is crawled instead,
+        which also drops skins that were removed upstream.
+
+        :param full: Whether to force a full crawl, defaults to False
+        :type full: ``bool``
+        :raises: ``ValueError``: If the catalog has no client
+        :raises: ``aiordr.exceptions.APIException``: Contains status code, error message, and error code
+        :return: Number of skins that were not known before
+        :rtype: ``int``
+        """
+        if self._client is None:
+            raise ValueError("A client is required to synchronize the catalog")
+
+        before = set(self._skins)
+        incremental = bool(before) and not full
+        skins = dict(self._skins) if incremental else {}
+        page = 1
+        while True:
+            resp = await self._client.get_skins(page=page, page_size=self._page_size)
+            unknown = any(x.id not in skins for x in resp.skins)
+            skins.update((x.id, x) for x in resp.skins)
+            if not resp.skins or page * self._page_size >= resp.max_skins:
+                break
+            if incremental and not unknown:
+                break
+            page += 1
+
+        self._skins = skins
+        self._max_skins = resp.max_skins
+        self._rebuild()
+        self.save()
+        return len(skins.keys() - before)
+
+    def save(self, path: str | None = None) -> None:
+        r"""Save the catalog index to disk.
+
+        :param path: Path to save to, defaults to the catalog path
+        :type path: ``Optional[str]``
+        :return: None
+        """
+        path = path or self._path
+        if path is None:
+            return
+        data = {
+            "version": _INDEX_VERSION,
+            "max_skins": self._max_skins,
+            "fields": _SKIN_FIELDS,
+            "skins": [
+                [raw[x] for x in _SKIN_FIELDS]
+                for raw in (
+                    skin.model_dump(by_alias=True) for skin in self._skins.values()
+                )
+            ],
+        }
+        tmp = f"{path}.tmp"
+        with gzip.open(tmp, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp, path)
+
+    def load(self, path: str | None = None) -> None:
+        r"""Load the catalog index from disk.
+
+        :param path: Path to load from, defaults to the catalog path
+        :type path: ``Optional[str]``
+        :raises: ``ValueError``: If the index version is not supported
+        :return: None
+        """
+        path = path or self._path
+        if path is None:
+            return
+        with gzip.open(path, "rb") as f:
+            data = orjson.loads(f.read())
+        if data.get("version") != _INDEX_VERSION:
+            raise ValueError("Unsupported skin catalog index version")
+        fields = data["fields"]
+        self._skins = {
+            skin.id: skin
+            for skin in (
+                Skin.model_validate(dict(zip(fields, row))) for row in data["skins"]
+            )
+        }
+        self._max_skins = data["max_skins"]
+        self._rebuild()
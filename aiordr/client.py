@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import logging
 from typing import TYPE_CHECKING
 from typing import Literal
 from warnings import warn
@@ -10,12 +12,19 @@ from warnings import warn
 import aiohttp
 import orjson
 from aiolimiter import AsyncLimiter
-from socketio import AsyncClient as sio_async  # type: ignore
 
+from .dedup import RenderDedupCache
+from .download import RenderDownloader
 from .exceptions import APIException
+from .health import HealthMonitor
 from .helpers import add_param
 from .helpers import from_list
+from .helpers import read_replay
+from .httpcache import HTTPCache
+from .httpcache import default_cache_path
 from .models import ErrorCode
+from .models import FrozenRenderOptions
+from .models import Render
 from .models import RenderAddEvent
 from .models import RenderCreateResponse
 from .models import RenderFailEvent
@@ -26,14 +35,28 @@ from .models import RenderServer
 from .models import RendersResponse
 from .models import SkinCompact
 from .models import SkinsResponse
+from .offload import LoopStallMonitor
+from .offload import decode_json
+from .preflight import RenderPreflight
+from .presets import RenderPresets
+from .presets import encode_options
+from .stream import EventStream
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
     from collections.abc import Callable
+    from concurrent.futures import Executor
     from types import TracebackType
     from typing import Any
 
+    from .limiter import RateLimiter
+    from .models.base import BaseModel
+    from .polling import RenderPoller
+    from .presets import FormFields
 
-__all__ = ("DeveloperModes", "ordrClient")
+__all__ = ("DeveloperModes", "SocketEngine", "ordrClient")
+
+logger = logging.getLogger(__name__)
 
 ClientRequestType = Literal["GET", "POST", "DELETE", "PUT", "PATCH"]
 
@@ -43,7 +66,81 @@ def get_content_type(content_type: str) -> str:
     return content_type.split(";")[0]
 
 
+def decode_body(content_type: str, body: bytes) -> Any:
+    """Returns the decoded body of a successful response."""
+    if content_type == "application/json":
+        return orjson.loads(body)
+    if content_type == "text/html":
+        return body.decode("utf-8")
+    raise APIException(415, "Unhandled Content Type", ErrorCode(0))
+
+
 DeveloperModes = Literal["devmode_success", "devmode_fail", "devmode_wsfail"]
+SocketEngine = Literal["socketio", "native"]
+
+EVENT_NAMES: tuple[str, ...] = (
+    "render_added_json",
+    "render_progress_json",
+    "render_fail_json",
+    "render_done_json",
+)
+
+
+def diff_render(render: Render, progress: str | None) -> tuple[str, dict] | None:
+    """Returns the event a render would have emitted since its last known progress."""
+    if render.progress == "Done." or render.video_url.startswith("http"):
+        return "render_done_json", {
+            "renderID": render.id,
+            "videoUrl": render.video_url,
+        }
+    if render.removed or render.progress.startswith("Error"):
+        return "render_fail_json", {
+            "renderID": render.id,
+            "errorMessage": render.progress,
+            "errorCode": ErrorCode.UNKNOWN_RENDER_ERROR.value,
+        }
+    if render.progress != progress:
+        return "render_progress_json", {
+            "renderID": render.id,
+            "username": render.username,
+            "progress": render.progress,
+            "renderer": render.renderer,
+            "description": render.description,
+        }
+    return None
+
+
+_NOT_READY = (ErrorCode.SERVER_NOT_READY, ErrorCode.SERVER_NOT_READY_UNVERIFIED)
+_SUBMIT_ATTEMPTS = 3
+
+
+@functools.cache
+def _default_options() -> FrozenRenderOptions:
+    return FrozenRenderOptions()
+
+
+def _render_form(
+    data: dict[str, Any],
+    fields: FormFields,
+    replay_file: Any,
+) -> aiohttp.FormData:
+    form_data = aiohttp.FormData(fields)
+    for key, value in data.items():
+        if isinstance(value, bool):
+            value = str(value).lower()
+        form_data.add_field(key, value)
+
+    if replay_file is not None:
+        form_data.add_field("replayFile", replay_file, filename="replay.osr")
+    return form_data
+
+
+def _log_connect_error(task: asyncio.Task[None]) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Could not connect to the websocket server, retrying with the next request",
+            exc_info=task.exception(),
+        )
 
 
 class ordrClient:
@@ -51,9 +148,33 @@ class ordrClient:
         "_developer_mode",
         "_verification_key",
         "_session",
+        "_connector_options",
+        "_connect_lock",
         "_base_url",
         "_limiter",
-        "socket",
+        "_preflight",
+        "_presets",
+        "_dedup_cache",
+        "_http_cache",
+        "_owned_caches",
+        "_downloader",
+        "_offload_threshold",
+        "_executor",
+        "_stall_monitor",
+        "_handlers",
+        "_listeners",
+        "_tracked",
+        "_disconnected",
+        "_closing",
+        "_connect_task",
+        "_reconcile_limit",
+        "_reconcile_task",
+        "_reconcile_pending",
+        "_poller",
+        "_health",
+        "_socket_options",
+        "_engine",
+        "_socket",
     )
 
     def __init__(self, **kwargs: Any) -> None:
@@ -66,8 +187,40 @@ class ordrClient:
                 Optional, defaults to None
             * *verification_key* (``str``) --
                 Optional, defaults to None. If not provided, rate limits will be forced to 1 request per 5 minutes
-            * *limiter* (``tuple[int, int]``) --
-                Optional, rate limit, defaults to (1, 300) (1 requests per 5 minutes)
+            * *limiter* (``Union[Sequence[int], aiordr.limiter.RateLimiter]``) --
+                Optional, rate limit or limiter shared with other clients, defaults to (1, 300) (1 requests per 5 minutes)
+            * *preflight* (``Union[bool, aiordr.preflight.RenderPreflight]``) --
+                Optional, whether to validate render submissions locally before using a rate limit slot, defaults to False
+            * *skin_catalog* (``aiordr.catalog.SkinCatalog``) --
+                Optional, catalog used by pre-flight validation to resolve skins, defaults to None
+            * *presets* (``aiordr.presets.RenderPresets``) --
+                Optional, render option presets usable by name in ``create_render``, defaults to an empty registry
+            * *dedup_cache* (``Union[bool, str, aiordr.dedup.RenderDedupCache]``) --
+                Optional, cache used to answer duplicate render submissions locally, or the path of its on-disk store, defaults to None. A cache created from True or a path is closed by ``aclose``
+            * *http_cache* (``Union[bool, str, aiordr.httpcache.HTTPCache]``) --
+                Optional, cache of GET responses revalidated with conditional requests, or the path of its database, defaults to None. True stores it in ``aiordr.httpcache.default_cache_path()`` so it survives restarts. A cache created from True or a path is closed by ``aclose``
+            * *reconnection_attempts* (``int``) --
+                Optional, websocket reconnection attempts before giving up, defaults to 0 (unlimited)
+            * *reconnection_delay* (``tuple[float, float]``) --
+                Optional, initial and maximum reconnection backoff in seconds, defaults to (1, 30)
+            * *engine* (``SocketEngine``) --
+                Optional, websocket client, "socketio" for python-socketio or "native" for the built-in aiohttp engine, defaults to "socketio"
+            * *reconcile_limit* (``int``) --
+                Optional, maximum number of requests used to reconcile tracked renders after a reconnect, defaults to 5
+            * *polling* (``Union[bool, aiordr.polling.RenderPoller]``) --
+                Optional, whether to poll the render list while the websocket is unavailable, defaults to False
+            * *health_monitor* (``Union[bool, aiordr.health.HealthMonitor]``) --
+                Optional, monitor of render server availability that render submissions wait for, defaults to None
+            * *max_downloads* (``int``) --
+                Optional, maximum number of concurrent connections used by ``download_render``, defaults to 4
+            * *dns_cache_ttl* (``int``) --
+                Optional, seconds resolved hosts are cached for, defaults to 300
+            * *offload_threshold* (``Optional[int]``) --
+                Optional, size in bytes from which JSON responses are decoded and validated in ``executor``, defaults to 256 KiB. None disables offloading
+            * *executor* (``concurrent.futures.Executor``) --
+                Optional, thread or process pool used to decode large responses, defaults to the loop's default executor
+            * *stall_monitor* (``Union[bool, aiordr.offload.LoopStallMonitor]``) --
+                Optional, monitor measuring event loop stalls, started with the first request, defaults to None
         """
         self._developer_mode: str | None = kwargs.pop("developer_mode", None)
         self._verification_key: str | None = kwargs.pop("verification_key", None)
@@ -80,9 +233,23 @@ class ordrClient:
             self._verification_key = self._developer_mode
 
         self._session: aiohttp.ClientSession | None = None
+        self._connector_options: dict[str, Any] = {
+            "ttl_dns_cache": kwargs.pop("dns_cache_ttl", 300),
+        }
+        self._connect_lock = asyncio.Lock()
         self._base_url: str = "https://apis.issou.best"
 
-        max_rate, time_period = kwargs.pop("limiter", (1, 300))
+        limiter = kwargs.pop("limiter", (1, 300))
+        if hasattr(limiter, "__aenter__"):
+            max_rate, time_period = limiter.max_rate, limiter.time_period
+        else:
+            try:
+                max_rate, time_period = limiter
+            except (TypeError, ValueError):
+                raise TypeError(
+                    "limiter must be a (max_rate, time_period) pair or a rate limiter",
+                ) from None
+            limiter = None
         if (max_rate / time_period) > 1:
             warn(
                 "You are running at an insanely high rate limit. Doing so may result in your account being banned.",
@@ -91,13 +258,254 @@ class ordrClient:
         if not self._verification_key:
             max_rate = 1
             time_period = 300
+            limiter = None
+
+        if limiter is None:
+            limiter = AsyncLimiter(max_rate=max_rate, time_period=time_period)
+        self._limiter: RateLimiter = limiter
+
+        preflight = kwargs.pop("preflight", False)
+        skin_catalog = kwargs.pop("skin_catalog", None)
+        if preflight is True:
+            preflight = RenderPreflight(skin_catalog=skin_catalog)
+        self._preflight: RenderPreflight | None = preflight or None
+
+        self._presets: RenderPresets = kwargs.pop("presets", None) or RenderPresets()
+
+        # Caches created here are closed along with the client.
+        self._owned_caches: list[RenderDedupCache | HTTPCache] = []
+        dedup_cache = kwargs.pop("dedup_cache", None)
+        if dedup_cache is True or isinstance(dedup_cache, str):
+            dedup_cache = RenderDedupCache(
+                path=None if dedup_cache is True else dedup_cache,
+            )
+            self._owned_caches.append(dedup_cache)
+        self._dedup_cache: RenderDedupCache | None = (
+            None if dedup_cache is False else dedup_cache
+        )
 
-        self._limiter: AsyncLimiter = AsyncLimiter(
-            max_rate=max_rate,
-            time_period=time_period,
+        http_cache = kwargs.pop("http_cache", None)
+        if http_cache is True:
+            http_cache = default_cache_path()
+        if isinstance(http_cache, str):
+            http_cache = HTTPCache(http_cache)
+            self._owned_caches.append(http_cache)
+        self._http_cache: HTTPCache | None = None if http_cache is False else http_cache
+
+        self._downloader = RenderDownloader(
+            self._get_session,
+            max_connections=kwargs.pop("max_downloads", 4),
         )
 
-        self.socket = sio_async()
+        self._offload_threshold: int | None = kwargs.pop(
+            "offload_threshold",
+            256 * 1024,
+        )
+        self._executor: Executor | None = kwargs.pop("executor", None)
+        stall_monitor = kwargs.pop("stall_monitor", None)
+        if stall_monitor is True:
+            stall_monitor = LoopStallMonitor()
+        self._stall_monitor: LoopStallMonitor | None = stall_monitor or None
+
+        self._tracked: dict[int, tuple[str, str | None]] = {}
+        self._disconnected: bool = False
+        self._closing: bool = False
+        self._connect_task: asyncio.Task[None] | None = None
+        self._reconcile_limit: int = kwargs.pop("reconcile_limit", 5)
+        self._reconcile_task: asyncio.Task[None] | None = None
+        self._reconcile_pending: bool = False
+
+        polling = kwargs.pop("polling", False)
+        if polling is True:
+            from .polling import RenderPoller
+
+            polling = RenderPoller(self)
+        self._poller: RenderPoller | None = polling or None
+
+        health = kwargs.pop("health_monitor", None)
+        if health is True:
+            health = HealthMonitor(self)
+        self._health: HealthMonitor | None = health or None
+
+        delay, delay_max = kwargs.pop("reconnection_delay", (1, 30))
+        self._socket_options: dict[str, Any] = {
+            "reconnection_attempts": kwargs.pop("reconnection_attempts", 0),
+            "reconnection_delay": delay,
+            "reconnection_delay_max": delay_max,
+        }
+        self._engine: SocketEngine = kwargs.pop("engine", "socketio")
+        self._socket: Any = None
+        self._handlers: dict[str, Callable[[dict], Awaitable[Any]]] = {}
+        self._listeners: list[Callable[[str, dict], Any]] = []
+
+    @property
+    def socket(self) -> Any:
+        """The websocket client, created (and its engine imported) on first use."""
+        if self._socket is None:
+            if self._engine == "native":
+                from .engine import NativeSocket as AsyncClient
+            else:
+                from socketio import AsyncClient  # type: ignore
+
+            socket = AsyncClient(**self._socket_options)
+            socket.on("connect", self._on_connect)
+            socket.on("disconnect", self._on_disconnect)
+            for event in EVENT_NAMES:
+                socket.on(event, functools.partial(self._on_event, event))
+            self._socket = socket
+        return self._socket
+
+    @property
+    def presets(self) -> RenderPresets:
+        """The render option presets usable by name in ``create_render``."""
+        return self._presets
+
+    @property
+    def health_monitor(self) -> HealthMonitor | None:
+        """The render server health monitor, if enabled."""
+        return self._health
+
+    @property
+    def stall_monitor(self) -> LoopStallMonitor | None:
+        """The event loop stall monitor, if enabled."""
+        return self._stall_monitor
+
+    def _uses_socket(self) -> bool:
+        return self._socket is not None or bool(self._handlers) or bool(self._listeners)
+
+    def _connect_soon(self) -> None:
+        # Handlers registered after the first request would otherwise only
+        # connect the websocket with the next request.
+        if self._session is None or self._session.closed or self._closing:
+            return
+        if self._socket is not None and self._socket.connected:
+            return
+        if self._connect_task is not None and not self._connect_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._connect_task = loop.create_task(self.connect())
+        self._connect_task.add_done_callback(_log_connect_error)
+
+    async def _on_connect(self) -> None:
+        if self._poller is not None:
+            self._poller.stop()
+        if not self._disconnected:
+            return
+        self._disconnected = False
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            self._reconcile_pending = True
+            return
+        self._reconcile_task = asyncio.create_task(self._reconcile())
+
+    async def _on_disconnect(self, *args: Any) -> None:
+        self._disconnected = True
+        if self._poller is not None and not self._closing:
+            self._poller.start()
+
+    async def _reconcile(self) -> None:
+        self._reconcile_pending = True
+        while self._reconcile_pending:
+            self._reconcile_pending = False
+            budget = self._reconcile_limit
+            by_username: dict[str, list[int]] = {}
+            for render_id, (username, _) in self._tracked.items():
+                by_username.setdefault(username, []).append(render_id)
+
+            for username, render_ids in by_username.items():
+                if budget <= 0:
+                    break
+                budget -= 1
+                try:
+                    resp = await self.get_render_list(
+                        page_size=max(len(render_ids), 10),
+                        ordr_username=username,
+                    )
+                except APIException:
+                    continue
+                renders = {x.id: x for x in resp.renders}
+                for render_id in render_ids:
+                    render = renders.get(render_id)
+                    if render is None and budget > 0:
+                        budget -= 1
+                        try:
+                            resp = await self.get_render_list(render_id=render_id)
+                        except APIException:
+                            continue
+                        render = next(iter(resp.renders), None)
+                    tracked = self._tracked.get(render_id)
+                    if render is None or tracked is None:
+                        continue
+                    change = diff_render(render, tracked[1])
+                    if change is not None:
+                        await self._on_event(*change)
+
+    async def _on_event(self, event: str, data: dict) -> Any:
+        for listener in self._listeners:
+            try:
+                listener(event, data)
+            except Exception:
+                logger.exception("Listener %r failed on %s", listener, event)
+
+        render_id = data.get("renderID")
+        if render_id in self._tracked:
+            if event == "render_progress_json":
+                self._tracked[render_id] = (
+                    self._tracked[render_id][0],
+                    data["progress"],
+                )
+            elif event in ("render_done_json", "render_fail_json"):
+                del self._tracked[render_id]
+
+        if self._dedup_cache is not None:
+            if event == "render_done_json":
+                self._dedup_cache.set_video_url(data["renderID"], data["videoUrl"])
+            elif event == "render_fail_json":
+                self._dedup_cache.discard_render(data["renderID"])
+
+        handler = self._handlers.get(event)
+        if handler is not None:
+            return await handler(data)
+        return None
+
+    def add_listener(self, listener: Callable[[str, dict], Any]) -> None:
+        r"""Adds a listener called with the name and raw payload of every event.
+
+        Listeners are called synchronously before payload validation, so they
+        should not block. Their exceptions are logged without stopping the
+        other listeners and the handler. If the client has already made a request, the
+        websocket is connected in the background.
+
+        :param listener: Listener to add
+        :type listener: ``Callable[[str, dict], Any]``
+        :return: None
+        """
+        self._listeners.append(listener)
+        self._connect_soon()
+
+    def remove_listener(self, listener: Callable[[str, dict], Any]) -> None:
+        r"""Removes a listener added with ``add_listener``.
+
+        :param listener: Listener to remove
+        :type listener: ``Callable[[str, dict], Any]``
+        :return: None
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def events(self, **kwargs: Any) -> EventStream:
+        r"""Returns an async iterator over events, to be used as:
+        async with client.events(types=[RenderFinishEvent]) as stream:
+            async for event in stream:
+
+        :param \**kwargs:
+            See ``aiordr.stream.EventStream``
+        :return: Event stream
+        :rtype: ``aiordr.stream.EventStream``
+        """
+        return EventStream(self, **kwargs)
 
     def on_render_added(self, func: Callable) -> Callable:
         r"""Returns a callable that is called when a render is added, to be used as:
@@ -109,7 +517,8 @@ class ordrClient:
         async def wrapper(data: dict) -> Any:
             return await func(RenderAddEvent.model_validate(data))
 
-        self.socket.on("render_added_json", wrapper)
+        self._handlers["render_added_json"] = wrapper
+        self._connect_soon()
         return wrapper
 
     def on_render_progress(self, func: Callable) -> Callable:
@@ -122,7 +531,8 @@ class ordrClient:
         async def wrapper(data: dict) -> Any:
             return await func(RenderProgressEvent.model_validate(data))
 
-        self.socket.on("render_progress_json", wrapper)
+        self._handlers["render_progress_json"] = wrapper
+        self._connect_soon()
         return wrapper
 
     def on_render_fail(self, func: Callable) -> Callable:
@@ -135,7 +545,8 @@ class ordrClient:
         async def wrapper(data: dict) -> Any:
             return await func(RenderFailEvent.model_validate(data))
 
-        self.socket.on("render_fail_json", wrapper)
+        self._handlers["render_fail_json"] = wrapper
+        self._connect_soon()
         return wrapper
 
     def on_render_finish(self, func: Callable) -> Callable:
@@ -148,12 +559,15 @@ class ordrClient:
         async def wrapper(data: dict) -> Any:
             return await func(RenderFinishEvent.model_validate(data))
 
-        self.socket.on("render_done_json", wrapper)
+        self._handlers["render_done_json"] = wrapper
+        self._connect_soon()
         return wrapper
 
     async def __aenter__(self) -> ordrClient:
-        self._session = aiohttp.ClientSession()
-        await self.connect()
+        self._closing = False
+        await self._get_session()
+        if self._uses_socket():
+            await self.connect()
         return self
 
     async def __aexit__(
@@ -164,27 +578,71 @@ class ordrClient:
     ) -> None:
         await self.aclose()
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        # No await between the check and the assignment, so concurrent first
+        # calls cannot create several sessions.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+            )
+        return self._session
+
+    async def _decode(
+        self,
+        content_type: str,
+        body: bytes,
+        model: type[BaseModel] | None = None,
+    ) -> Any:
+        threshold = self._offload_threshold
+        if (
+            threshold is None
+            or len(body) < threshold
+            or content_type != "application/json"
+        ):
+            data = decode_body(content_type, body)
+            return data if model is None else model.model_validate(data)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, decode_json, body, model)
+
     async def _request(
         self,
         request_type: ClientRequestType,
         *args: Any,
+        model: type[BaseModel] | None = None,
         **kwargs: Any,
     ) -> Any:
-        if not self.socket.connected:
-            await self.connect()
-        if self._session is None:
-            self._session = aiohttp.ClientSession()
+        if self._stall_monitor is not None:
+            self._stall_monitor.start()
+        if self._uses_socket() and not self.socket.connected:
+            if self._poller is None or not self._poller.running:
+                await self.connect()
+        session = await self._get_session()
 
         req: dict[str, Callable] = {
-            "GET": self._session.get,
-            "POST": self._session.post,
-            "DELETE": self._session.delete,
-            "PUT": self._session.put,
-            "PATCH": self._session.patch,
+            "GET": session.get,
+            "POST": session.post,
+            "DELETE": session.delete,
+            "PUT": session.put,
+            "PATCH": session.patch,
         }
 
+        cache = self._http_cache if request_type == "GET" else None
+        key = ""
+        cached = None
+        if cache is not None:
+            key = cache.make_key(args[0], kwargs.get("params"))
+            cached = cache.get(key)
+            if cached is not None:
+                if cached.fresh:
+                    cache.touch(key)
+                    return await self._decode(cached.content_type, cached.body, model)
+                kwargs["headers"] = {**kwargs.get("headers", {}), **cached.validators()}
+
         async with self._limiter:
             async with req[request_type](*args, **kwargs) as resp:
+                if resp.status == 304 and cache is not None and cached is not None:
+                    cache.refresh(key, resp.headers)
+                    return await self._decode(cached.content_type, cached.body, model)
                 body = await resp.read()
                 content_type = get_content_type(resp.headers.get("content-type", ""))
                 if resp.status not in (200, 201):
@@ -195,11 +653,13 @@ class ordrClient:
                         json.get("message", ""),
                         ErrorCode(error_code),
                     )
-                if content_type == "application/json":
-                    return orjson.loads(body)
-                if content_type == "text/html":
-                    return body.decode("utf-8")
-                raise APIException(415, "Unhandled Content Type", ErrorCode(0))
+                status = resp.status
+                headers = resp.headers
+
+        data = await self._decode(content_type, body, model)
+        if cache is not None and status == 200:
+            cache.store(key, headers, content_type, body)
+        return data
 
     async def get_custom_skin(self, skin_id: int) -> SkinCompact:
         r"""Get custom skin information.
@@ -211,12 +671,12 @@ class ordrClient:
         :rtype: ``aiordr.models.skin.SkinCompact``
         """
         params = {"id": skin_id}
-        json = await self._request(
+        return await self._request(
             "GET",
             f"{self._base_url}/ordr/skins/custom",
             params=params,
+            model=SkinCompact,
         )
-        return SkinCompact.model_validate(json)
 
     async def get_skins(
         self,
@@ -246,12 +706,12 @@ class ordrClient:
             "pageSize": page_size,
         }
         add_param(params, kwargs, "search")
-        json = await self._request(
+        return await self._request(
             "GET",
             f"{self._base_url}/ordr/skins",
             params=params,
+            model=SkinsResponse,
         )
-        return SkinsResponse.model_validate(json)
 
     async def get_render_list(
         self,
@@ -296,11 +756,12 @@ class ordrClient:
         add_param(params, kwargs, "no_bots", "nobots")
         add_param(params, kwargs, "link")
         add_param(params, kwargs, "beatmapset_id", "beatmapsetid")
-        json = await self._request(
+        return await self._request(
             "GET",
             f"{self._base_url}/ordr/renders",
+            params=params,
+            model=RendersResponse,
         )
-        return RendersResponse.model_validate(json)
 
     async def get_server_list(self) -> list[RenderServer]:
         r"""Get the list of available servers.
@@ -355,11 +816,17 @@ class ordrClient:
                 Optional, replay URL, used if replay_file is not provided
             * *render_options* (``aiordr.models.render.RenderOptions``) --
                 Optional, render options
+            * *preset* (``str``) --
+                Optional, name of a preset registered in ``presets``, used instead of render_options
             * *custom_skin* (``bool``) --
                 Optional, whether the provided skin is a custom skin ID (default: false)
+            * *dedup* (``bool``) --
+                Optional, whether to answer duplicate submissions from the dedup cache, if one is configured (default: true)
 
         :raises: ``aiordr.exceptions.APIException``: Contains status code, error message, and error code
+        :raises: ``aiordr.exceptions.PreflightException``: If pre-flight validation is enabled and fails
         :raises: ``TypeError``: If render_options is not a RenderOptions object
+        :raises: ``KeyError``: If the preset is not registered
         :return: Render create response
         :rtype: ``aiordr.models.render.RenderCreateResponse``
         """
@@ -374,50 +841,209 @@ class ordrClient:
         if self._verification_key:
             data["verificationKey"] = self._verification_key
 
-        if "render_options" not in kwargs:
-            kwargs["render_options"] = RenderOptions()
+        preset = kwargs.pop("preset", None)
+        if preset is not None:
+            if "render_options" in kwargs:
+                raise ValueError("Only one of preset or render_options can be provided")
+            kwargs["render_options"] = self._presets.get(preset)
+        elif "render_options" not in kwargs:
+            kwargs["render_options"] = _default_options()
         options: RenderOptions = kwargs["render_options"]
         if not isinstance(options, RenderOptions):
             raise TypeError("render_options must be a RenderOptions object")
+        fields = (
+            self._presets.fields(preset)
+            if preset is not None
+            else encode_options(options)
+        )
 
-        data.update(options.model_dump(exclude_defaults=True, by_alias=True))
-        data["resolution"] = options.resolution.value
+        dedup_cache = self._dedup_cache if kwargs.pop("dedup", True) else None
+        replay_file = kwargs.get("replay_file")
+        needs_replay = self._preflight is not None or dedup_cache is not None
+        if needs_replay and replay_file is not None:
+            if not isinstance(replay_file, bytes) and not replay_file.seekable():
+                kwargs["replay_file"] = read_replay(replay_file)
+
+        if self._preflight is not None:
+            self._preflight.check(username, skin, **kwargs)
+
+        if dedup_cache is not None:
+            key = dedup_cache.make_key(
+                skin,
+                options,
+                replay=(
+                    read_replay(kwargs["replay_file"])
+                    if "replay_file" in kwargs
+                    else None
+                ),
+                replay_url=kwargs.get("replay_url"),
+                custom_skin=kwargs.get("custom_skin", False),
+            )
+            return await dedup_cache.run(
+                key,
+                functools.partial(self._submit_render, data, fields, kwargs),
+            )
+        return await self._submit_render(data, fields, kwargs)
 
+    async def _submit_render(
+        self,
+        data: dict[str, Any],
+        fields: FormFields,
+        kwargs: dict[str, Any],
+    ) -> RenderCreateResponse:
         add_param(data, kwargs, "replay_url", "replayURL")
         add_param(data, kwargs, "custom_skin", "customSkin")
 
-        form_data = aiohttp.FormData()
-        for key, value in data.items():
-            if isinstance(value, bool):
-                value = str(value).lower()
-            form_data.add_field(key, value)
-
-        if "replay_file" in kwargs:
-            form_data.add_field(
-                "replayFile",
-                kwargs["replay_file"],
-                filename="replay.osr",
-            )
+        replay_file = kwargs.get("replay_file")
+        attempts = _SUBMIT_ATTEMPTS if self._health is not None else 1
+        if attempts > 1 and replay_file is not None:
+            # Retried submissions send the replay again.
+            replay_file = read_replay(replay_file)
+        for attempt in range(1, attempts + 1):
+            if self._health is not None:
+                await self._health.wait_until_ready(check=False)
+            try:
+                json = await self._request(
+                    "POST",
+                    f"{self._base_url}/ordr/renders",
+                    data=_render_form(data, fields, replay_file),
+                )
+                break
+            except APIException as e:
+                if (
+                    self._health is None
+                    or e.error_code not in _NOT_READY
+                    or attempt == attempts
+                ):
+                    raise
+                self._health.mark_unavailable()
+        resp = RenderCreateResponse.model_validate(json)
+        self._tracked[resp.render_id] = (data["username"], None)
+        if self._poller is not None:
+            self._poller.wake()
+        return resp
+
+    async def download_render(
+        self,
+        render: RenderFinishEvent | Render | str,
+        path: str,
+        **kwargs: Any,
+    ) -> str:
+        r"""Download a rendered video to disk.
 
-        json = await self._request(
-            "POST",
-            f"{self._base_url}/ordr/renders",
-            data=form_data,
-        )
-        return RenderCreateResponse.model_validate(json)
+        The video is streamed in chunks, resumed with HTTP ranges after
+        failures and split into parallel segments if it is large.
+        Connections are shared with the client and capped across downloads.
+
+        :param render: Finish event, render or video URL
+        :type render: ``Union[aiordr.models.events.RenderFinishEvent, aiordr.models.render.Render, str]``
+        :param path: Destination path
+        :type path: ``str``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *progress* (``Callable[[int, Optional[int]], Any]``) --
+                Optional, called with the downloaded and total sizes in bytes
+
+        :raises: ``aiohttp.ClientError``: If the download fails after every retry
+        :return: Destination path
+        :rtype: ``str``
+        """
+        url = render if isinstance(render, str) else render.video_url
+        return await self._downloader.download(url, path, kwargs.get("progress"))
+
+    async def wait_until_ready(self, timeout: float | None = None) -> None:
+        r"""Waits until a render server is available to take submissions.
+
+        Servers are checked if they never were. Starts a health monitor if
+        the client has none, after which render submissions also wait for it.
+
+        :param timeout: Maximum time to wait in seconds, defaults to None
+        :type timeout: ``Optional[float]``
+        :raises: ``asyncio.TimeoutError``: If no server is available in time
+        :return: None
+        """
+        if self._health is None:
+            self._health = HealthMonitor(self)
+        await self._health.wait_until_ready(timeout)
 
     async def connect(self) -> None:
-        r"""Connects to the websocket server.
+        r"""Connects to the websocket server, if it is not connected yet.
+
+        Concurrent calls share a single connection attempt. If polling is
+        enabled and the connection fails, the client polls instead and keeps
+        retrying the connection in the background.
+
+        :raises: ``socketio.exceptions.ConnectionError``: If the connection fails and polling is disabled
+        :raises: ``aiordr.engine.EngineConnectionError``: Instead of the above, with the native engine
+        :return: None
+        """
+        if self._engine == "native":
+            from .engine import EngineConnectionError as SocketConnectionError
+        else:
+            from socketio.exceptions import ConnectionError as SocketConnectionError  # type: ignore
+
+        self._closing = False
+        async with self._connect_lock:
+            if self.socket.connected:
+                return
+            try:
+                await self.socket.connect(url=self._base_url, socketio_path="/ordr/ws")
+            except SocketConnectionError:
+                if self._poller is None:
+                    raise
+                self._poller.start(reconnect=True)
+
+    async def warmup(self, connections: int = 4, **kwargs: Any) -> None:
+        r"""Prepares the client for traffic.
+
+        Resolves the API host, opens a pool of keep-alive connections and
+        connects to the websocket server, concurrently. The warm-up requests
+        are ``HEAD`` requests to the API root and do not use the rate limit.
+
+        :param connections: Number of connections to open, defaults to 4
+        :type connections: ``int``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *socket* (``bool``) --
+                Optional, whether to connect to the websocket server, defaults to whether event handlers or listeners are registered
 
         :return: None
         """
-        await self.socket.connect(url=self._base_url, socketio_path="/ordr/ws")
+        session = await self._get_session()
+
+        async def open_connection() -> None:
+            async with session.head(self._base_url) as resp:
+                await resp.read()
+
+        tasks = [open_connection() for _ in range(connections)]
+        if kwargs.pop("socket", self._uses_socket()):
+            tasks.append(self.connect())
+        await asyncio.gather(*tasks)
 
     async def aclose(self) -> None:
-        r"""Closes the client.
+        r"""Closes the client, along with the caches it created.
 
         :return: None
         """
+        # The disconnect hook would otherwise start polling again.
+        self._closing = True
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+        if self._socket is not None:
+            await self._socket.disconnect()
+        if self._reconcile_task is not None:
+            self._reconcile_task.cancel()
+        if self._poller is not None:
+            await self._poller.aclose()
+        if self._health is not None:
+            await self._health.aclose()
+        if self._stall_monitor is not None:
+            self._stall_monitor.stop()
         if self._session is not None:
             await self._session.close()
-        await self.socket.disconnect()
+        for cache in self._owned_caches:
+            cache.close()
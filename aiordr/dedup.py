@@ -0,0 +1,288 @@
+"""This module contains a content-hash cache for deduplicating render submissions."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+from .models import RenderCreateResponse
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from typing import Any
+
+    from .models import RenderOptions
+
+
+__all__ = (
+    "DedupEntry",
+    "RenderDedupCache",
+)
+
+
+def normalize_replay_url(url: str) -> str:
+    """Returns a canonical form of a replay URL."""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/") or "/",
+            query,
+            "",
+        ),
+    )
+
+
+class DedupEntry:
+    __slots__ = ("render_id", "video_url")
+
+    def __init__(self, render_id: int, video_url: str | None = None) -> None:
+        """A known render for a replay.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :param video_url: URL of the rendered video, if it finished
+        :type video_url: ``Optional[str]``
+        """
+        self.render_id = render_id
+        self.video_url = video_url
+
+    def __repr__(self) -> str:
+        return f"DedupEntry(render_id={self.render_id!r}, video_url={self.video_url!r})"
+
+
+class RenderDedupCache:
+    __slots__ = ("_entries", "_renders", "_inflight", "_maxsize", "_db", "_lock")
+
+    def __init__(self, maxsize: int = 1024, path: str | None = None) -> None:
+        r"""Bounded cache mapping replay content and render options to renders.
+
+        Entries are kept in an in-memory LRU. If ``path`` is provided, they
+        are also persisted to an SQLite database bounded to the same size,
+        which can be used from any thread, e.g. by ``aiordr.ordrSyncClient``.
+
+        :param maxsize: Maximum number of entries, defaults to 1024
+        :type maxsize: ``int``
+        :param path: Path of the on-disk store, defaults to None
+        :type path: ``Optional[str]``
+        """
+        self._entries: OrderedDict[str, DedupEntry] = OrderedDict()
+        self._renders: dict[int, str] = {}
+        self._inflight: dict[str, asyncio.Future[RenderCreateResponse]] = {}
+        self._maxsize = maxsize
+        self._db: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+        if path is not None:
+            import sqlite3
+
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS renders ("
+                "key TEXT PRIMARY KEY, render_id INTEGER, video_url TEXT, used REAL)",
+            )
+            rows = self._db.execute(
+                "SELECT key, render_id, video_url FROM renders ORDER BY used DESC LIMIT ?",
+                (maxsize,),
+            ).fetchall()
+            for key, render_id, video_url in reversed(rows):
+                self._entries[key] = DedupEntry(render_id, video_url)
+                self._renders[render_id] = key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        skin: str | int,
+        options: RenderOptions,
+        replay: bytes | None = None,
+        replay_url: str | None = None,
+        custom_skin: bool = False,
+    ) -> str:
+        r"""Builds the cache key of a submission.
+
+        :param skin: Skin ID or name
+        :type skin: ``Union[str, int]``
+        :param options: Render options
+        :type options: ``aiordr.models.render.RenderOptions``
+        :param replay: Replay data, defaults to None
+        :type replay: ``Optional[bytes]``
+        :param replay_url: Replay URL, used if replay is not provided
+        :type replay_url: ``Optional[str]``
+        :param custom_skin: Whether the skin is a custom skin ID, defaults to False
+        :type custom_skin: ``bool``
+        :raises: ``ValueError``: If neither replay nor replay_url is provided
+        :return: Cache key
+        :rtype: ``str``
+        """
+        digest = hashlib.sha256()
+        if replay is not None:
+            digest.update(b"file\0")
+            digest.update(replay)
+        elif replay_url is not None:
+            digest.update(b"url\0")
+            digest.update(normalize_replay_url(replay_url).encode("utf-8"))
+        else:
+            raise ValueError("Either replay or replay_url must be provided")
+        digest.update(f"\0{skin}\0{custom_skin:d}\0".encode())
+        digest.update(
+            options.model_dump_json(exclude_defaults=True, by_alias=True).encode(),
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> DedupEntry | None:
+        r"""Get the entry of a key.
+
+        :param key: Cache key
+        :type key: ``str``
+        :return: Entry, or None if the key is unknown
+        :rtype: ``Optional[aiordr.dedup.DedupEntry]``
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if self._db is not None:
+                    with self._db:
+                        self._db.execute(
+                            "UPDATE renders SET used = ? WHERE key = ?",
+                            (time.time(), key),
+                        )
+        return entry
+
+    def get_render(self, render_id: int) -> DedupEntry | None:
+        r"""Get the entry of a render.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :return: Entry, or None if the render is unknown
+        :rtype: ``Optional[aiordr.dedup.DedupEntry]``
+        """
+        key = self._renders.get(render_id)
+        return self._entries.get(key) if key is not None else None
+
+    def put(self, key: str, render_id: int, video_url: str | None = None) -> None:
+        r"""Store a render for a key, evicting the least recently used entries.
+
+        :param key: Cache key
+        :type key: ``str``
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :param video_url: URL of the rendered video, defaults to None
+        :type video_url: ``Optional[str]``
+        :return: None
+        """
+        with self._lock:
+            self._entries[key] = DedupEntry(render_id, video_url)
+            self._entries.move_to_end(key)
+            self._renders[render_id] = key
+            evicted = []
+            while len(self._entries) > self._maxsize:
+                old_key, old = self._entries.popitem(last=False)
+                self._renders.pop(old.render_id, None)
+                evicted.append((old_key,))
+
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?)",
+                        (key, render_id, video_url, time.time()),
+                    )
+                    self._db.executemany("DELETE FROM renders WHERE key = ?", evicted)
+
+    def set_video_url(self, render_id: int, video_url: str) -> None:
+        r"""Record the video URL of a finished render.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :param video_url: URL of the rendered video
+        :type video_url: ``str``
+        :return: None
+        """
+        entry = self.get_render(render_id)
+        if entry is None:
+            return
+        entry.video_url = video_url
+        with self._lock:
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "UPDATE renders SET video_url = ? WHERE render_id = ?",
+                        (video_url, render_id),
+                    )
+
+    def discard_render(self, render_id: int) -> None:
+        r"""Remove the entry of a render, e.g. because it failed.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :return: None
+        """
+        with self._lock:
+            key = self._renders.pop(render_id, None)
+            if key is None:
+                return
+            self._entries.pop(key, None)
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM renders WHERE key = ?", (key,))
+
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[RenderCreateResponse]],
+    ) -> RenderCreateResponse:
+        r"""Answer a submission from the cache, or submit it once.
+
+        Concurrent calls with the same key share a single submission.
+
+        :param key: Cache key
+        :type key: ``str``
+        :param factory: Callable performing the submission
+        :type factory: ``Callable[[], Awaitable[aiordr.models.render.RenderCreateResponse]]``
+        :return: Render create response
+        :rtype: ``aiordr.models.render.RenderCreateResponse``
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return RenderCreateResponse(
+                message="Render already exists",
+                render_id=entry.render_id,
+            )
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._on_done, key))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: str, task: asyncio.Future[Any]) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.put(key, task.result().render_id)
+
+    def close(self) -> None:
+        r"""Closes the on-disk store.
+
+        :return: None
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
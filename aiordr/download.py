@@ -0,0 +1,271 @@
+"""This module contains a streaming, resumable downloader for rendered videos."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from typing import IO
+    from typing import Any
+
+    ProgressCallback = Callable[[int, int | None], Any]
+
+
+__all__ = ("RenderDownloader",)
+
+
+class _Progress:
+    __slots__ = ("done", "total", "callback")
+
+    def __init__(self, done: int, total: int | None, callback: ProgressCallback | None):
+        self.done = done
+        self.total = total
+        self.callback = callback
+
+    def advance(self, size: int) -> None:
+        self.done += size
+        if self.callback is not None:
+            self.callback(self.done, self.total)
+
+
+class _Segment:
+    __slots__ = ("start", "end", "offset")
+
+    def __init__(self, start: int, end: int | None, offset: int) -> None:
+        self.start = start
+        self.end = end
+        self.offset = offset
+
+
+def _write(f: IO[bytes], chunk: bytes) -> None:
+    f.write(chunk)
+    f.flush()
+
+
+def _save_state(state_path: str, total: int, segments: list[_Segment]) -> None:
+    data = orjson.dumps(
+        {
+            "total": total,
+            "segments": [[x.start, x.end, x.offset] for x in segments],
+        },
+    )
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "wb") as state_file:
+        state_file.write(data)
+    os.replace(tmp_path, state_path)
+
+
+class RenderDownloader:
+    __slots__ = (
+        "_session",
+        "_semaphore",
+        "_chunk_size",
+        "_segments",
+        "_segment_threshold",
+        "_retries",
+    )
+
+    def __init__(
+        self,
+        session: Callable[[], Awaitable[aiohttp.ClientSession]],
+        **kwargs: Any,
+    ) -> None:
+        r"""Downloads files to disk in chunks, resuming interrupted transfers.
+
+        :param session: Coroutine function returning the session to use
+        :type session: ``Callable[[], Awaitable[aiohttp.ClientSession]]``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *max_connections* (``int``) --
+                Optional, maximum number of connections across all downloads, defaults to 4
+            * *chunk_size* (``int``) --
+                Optional, size of the chunks read and written, defaults to 1 MiB
+            * *segments* (``int``) --
+                Optional, number of ranged segments downloaded in parallel for large files, defaults to 4
+            * *segment_threshold* (``int``) --
+                Optional, minimum file size downloaded in segments, defaults to 64 MiB
+            * *retries* (``int``) --
+                Optional, attempts per connection before giving up, defaults to 5
+        """
+        self._session = session
+        self._semaphore = asyncio.Semaphore(kwargs.pop("max_connections", 4))
+        self._chunk_size: int = kwargs.pop("chunk_size", 1024 * 1024)
+        self._segments: int = kwargs.pop("segments", 4)
+        self._segment_threshold: int = kwargs.pop("segment_threshold", 64 * 1024 * 1024)
+        self._retries: int = kwargs.pop("retries", 5)
+
+    async def download(
+        self,
+        url: str,
+        path: str,
+        progress: ProgressCallback | None = None,
+    ) -> str:
+        r"""Downloads a file.
+
+        Data is written to ``path + ".part"`` and renamed once complete. If a
+        partial file exists, the download resumes from it.
+
+        :param url: URL of the file
+        :type url: ``str``
+        :param path: Destination path
+        :type path: ``str``
+        :param progress: Callable receiving the downloaded and total sizes, defaults to None
+        :type progress: ``Optional[Callable[[int, Optional[int]], Any]]``
+        :raises: ``aiohttp.ClientError``: If the download fails after every retry
+        :return: Destination path
+        :rtype: ``str``
+        """
+        part = f"{path}.part"
+        state_path = f"{part}.json"
+        session = await self._session()
+
+        total, ranges = await self._probe(session, url)
+        if ranges and total is not None and self._segments > 1:
+            if os.path.exists(state_path) or total >= self._segment_threshold:
+                await self._download_segments(
+                    session,
+                    url,
+                    part,
+                    state_path,
+                    total,
+                    progress,
+                )
+                os.replace(part, path)
+                return path
+
+        if not ranges and os.path.exists(part):
+            os.remove(part)
+        await self._download_stream(session, url, part, total, progress)
+        os.replace(part, path)
+        return path
+
+    async def _probe(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+    ) -> tuple[int | None, bool]:
+        async with self._semaphore:
+            async with session.head(url, allow_redirects=True) as resp:
+                resp.raise_for_status()
+                length = resp.headers.get("Content-Length")
+                ranges = resp.headers.get("Accept-Ranges", "") == "bytes"
+                return (int(length) if length is not None else None), ranges
+
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        f: IO[bytes],
+        segment: _Segment,
+        progress: _Progress,
+        checkpoint: Callable[[], None] | None = None,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        for attempt in range(self._retries):
+            if segment.end is not None and segment.offset > segment.end:
+                return
+            headers = {}
+            if segment.offset or segment.end is not None:
+                end = "" if segment.end is None else segment.end
+                headers["Range"] = f"bytes={segment.offset}-{end}"
+            try:
+                async with self._semaphore:
+                    async with session.get(url, headers=headers) as resp:
+                        if resp.status == 416:
+                            return
+                        resp.raise_for_status()
+                        if headers and resp.status != 206:
+                            raise aiohttp.ClientPayloadError("Range not honoured")
+                        f.seek(segment.offset)
+                        async for chunk in resp.content.iter_chunked(self._chunk_size):
+                            # Offsets only cover flushed data, so saved state stays valid.
+                            await loop.run_in_executor(None, _write, f, chunk)
+                            segment.offset += len(chunk)
+                            progress.advance(len(chunk))
+                            if checkpoint is not None:
+                                checkpoint()
+                return
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self._retries - 1:
+                    raise
+                await asyncio.sleep(min(2**attempt, 30))
+
+    async def _download_stream(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        part: str,
+        total: int | None,
+        progress: ProgressCallback | None,
+    ) -> None:
+        start = os.path.getsize(part) if os.path.exists(part) else 0
+        with open(part, "ab" if start else "wb") as f:
+            await self._fetch(
+                session,
+                url,
+                f,
+                _Segment(0, None, start),
+                _Progress(start, total, progress),
+            )
+
+    async def _download_segments(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        part: str,
+        state_path: str,
+        total: int,
+        progress: ProgressCallback | None,
+    ) -> None:
+        state: list[_Segment] | None = None
+        if os.path.exists(state_path) and os.path.exists(part):
+            with open(state_path, "rb") as state_file:
+                try:
+                    saved = orjson.loads(state_file.read())
+                except orjson.JSONDecodeError:
+                    saved = {}
+            if saved.get("total") == total:
+                state = [_Segment(*x) for x in saved["segments"]]
+        if state is None:
+            size = -(-total // self._segments)
+            state = [
+                _Segment(start, min(start + size, total) - 1, start)
+                for start in range(0, total, size)
+            ]
+            with open(part, "wb") as part_file:
+                part_file.truncate(total)
+            _save_state(state_path, total, state)
+
+        done = sum(x.offset - x.start for x in state)
+        tracker = _Progress(done, total, progress)
+        saved_at = time.monotonic()
+
+        def checkpoint() -> None:
+            # Saved at most once a second, so a killed download resumes.
+            nonlocal saved_at
+            now = time.monotonic()
+            if now - saved_at >= 1:
+                saved_at = now
+                _save_state(state_path, total, state)
+
+        async def run(segment: _Segment) -> None:
+            with open(part, "r+b") as part_file:
+                await self._fetch(session, url, part_file, segment, tracker, checkpoint)
+
+        try:
+            await asyncio.gather(*(run(x) for x in state))
+        except BaseException:
+            _save_state(state_path, total, state)
+            raise
+        if os.path.exists(state_path):
+            os.remove(state_path)
@@ -0,0 +1,247 @@
+"""This module contains a minimal websocket engine for the o!rdr event stream.
+
+It speaks the subset of Engine.IO v4 and Socket.IO v5 used by ``/ordr/ws``:
+a websocket transport, the default namespace, pings and text events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+from urllib.parse import urlunsplit
+
+import aiohttp
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from typing import Any
+
+
+__all__ = (
+    "EngineConnectionError",
+    "NativeSocket",
+)
+
+logger = logging.getLogger(__name__)
+
+
+class EngineConnectionError(ConnectionError):
+    """Raised when the websocket connection cannot be established."""
+
+
+def build_url(url: str, socketio_path: str) -> str:
+    """Returns the Engine.IO websocket URL of a server."""
+    parts = urlsplit(url)
+    scheme = {"https": "wss", "http": "ws"}.get(parts.scheme, parts.scheme)
+    path = f"{parts.path.rstrip('/')}/{socketio_path.strip('/')}/"
+    return urlunsplit((scheme, parts.netloc, path, "EIO=4&transport=websocket", ""))
+
+
+class NativeSocket:
+    __slots__ = (
+        "connected",
+        "_handlers",
+        "_session",
+        "_ws",
+        "_task",
+        "_url",
+        "_closing",
+        "_ping_timeout",
+        "_reconnection_attempts",
+        "_reconnection_delay",
+        "_reconnection_delay_max",
+    )
+
+    def __init__(self, **kwargs: Any) -> None:
+        r"""Websocket client receiving Socket.IO events, used with ``engine="native"``.
+
+        It exposes the part of ``socketio.AsyncClient`` used by
+        ``aiordr.ordrClient``: ``on``, ``connect``, ``disconnect`` and
+        ``connected``. Event handlers are awaited in the order events arrive,
+        so long-running work should be moved to tasks to keep answering pings.
+        Exceptions raised by handlers are logged, as python-socketio does.
+
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *reconnection_attempts* (``int``) --
+                Optional, reconnection attempts before giving up, defaults to 0 (unlimited)
+            * *reconnection_delay* (``float``) --
+                Optional, initial reconnection backoff in seconds, defaults to 1
+            * *reconnection_delay_max* (``float``) --
+                Optional, maximum reconnection backoff in seconds, defaults to 5
+        """
+        self.connected = False
+        self._handlers: dict[str, Callable[..., Awaitable[Any]]] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._url = ""
+        self._closing = False
+        self._ping_timeout = 45.0
+        self._reconnection_attempts: int = kwargs.pop("reconnection_attempts", 0)
+        self._reconnection_delay: float = kwargs.pop("reconnection_delay", 1)
+        self._reconnection_delay_max: float = kwargs.pop("reconnection_delay_max", 5)
+
+    def on(self, event: str, handler: Callable[..., Awaitable[Any]]) -> None:
+        r"""Registers the handler of an event.
+
+        :param event: Event name, or ``connect``/``disconnect``
+        :type event: ``str``
+        :param handler: Coroutine function called with the event payload
+        :type handler: ``Callable[..., Awaitable[Any]]``
+        :return: None
+        """
+        self._handlers[event] = handler
+
+    async def connect(self, url: str, socketio_path: str = "socket.io") -> None:
+        r"""Connects to a server.
+
+        :param url: URL of the server
+        :type url: ``str``
+        :param socketio_path: Path of the Socket.IO endpoint, defaults to "socket.io"
+        :type socketio_path: ``str``
+        :raises: ``aiordr.engine.EngineConnectionError``: If the connection fails
+        :return: None
+        """
+        self._url = build_url(url, socketio_path)
+        self._closing = False
+        await self._open()
+        self._task = asyncio.create_task(self._run())
+
+    async def disconnect(self) -> None:
+        r"""Disconnects from the server and stops reconnecting.
+
+        :return: None
+        """
+        self._closing = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        ws = self._ws
+        if ws is not None and not ws.closed:
+            try:
+                await ws.send_str("41")
+            except (aiohttp.ClientError, ConnectionError):
+                pass
+            await ws.close()
+        self._ws = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self.connected:
+            self.connected = False
+            await self._trigger("disconnect")
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse) -> str:
+        msg = await ws.receive(timeout=self._ping_timeout)
+        if msg.type is not aiohttp.WSMsgType.TEXT:
+            raise EngineConnectionError(f"Unexpected websocket message: {msg.type!r}")
+        return msg.data
+
+    async def _open(self) -> None:
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        try:
+            ws = await self._session.ws_connect(self._url, autoping=True)
+            try:
+                packet = await self._receive(ws)
+                if not packet.startswith("0"):
+                    raise EngineConnectionError(f"Unexpected handshake: {packet!r}")
+                handshake = orjson.loads(packet[1:])
+                self._ping_timeout = (
+                    handshake.get("pingInterval", 25000)
+                    + handshake.get("pingTimeout", 20000)
+                ) / 1000
+                await ws.send_str("40")
+                packet = await self._receive(ws)
+                while packet == "2":
+                    await ws.send_str("3")
+                    packet = await self._receive(ws)
+                if not packet.startswith("40"):
+                    raise EngineConnectionError(f"Connection refused: {packet!r}")
+            except BaseException:
+                await ws.close()
+                raise
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise EngineConnectionError(str(e)) from e
+        self._ws = ws
+        self.connected = True
+        await self._trigger("connect")
+
+    async def _trigger(self, event: str, *args: Any) -> None:
+        handler = self._handlers.get(event)
+        if handler is None:
+            return
+        try:
+            await handler(*args)
+        except Exception:
+            logger.exception("Error in the %r event handler", event)
+
+    async def _dispatch(self, packet: str) -> None:
+        # Socket.IO EVENT packets on the default namespace: 2[<ack id>]["name", data]
+        start = packet.find("[", 1)
+        if start < 0:
+            return
+        try:
+            payload = orjson.loads(packet[start:])
+        except orjson.JSONDecodeError:
+            logger.warning("Ignoring malformed packet: %.200r", packet)
+            return
+        if not payload or not isinstance(payload[0], str):
+            return
+        await self._trigger(payload[0], *payload[1:])
+
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        while True:
+            try:
+                packet = await self._receive(ws)
+            except (EngineConnectionError, asyncio.TimeoutError):
+                return
+            kind = packet[:1]
+            if kind == "2":
+                await ws.send_str("3")
+            elif kind == "4":
+                if packet[1:2] == "2":
+                    await self._dispatch(packet[1:])
+                elif packet[1:2] in ("1", "4"):
+                    return
+            elif kind == "1":
+                return
+
+    async def _run(self) -> None:
+        while not self._closing:
+            assert self._ws is not None
+            try:
+                await self._read(self._ws)
+            except Exception:
+                logger.exception("Unexpected error on the websocket connection")
+            await self._ws.close()
+            self.connected = False
+            if self._closing:
+                return
+            await self._trigger("disconnect")
+
+            attempt = 0
+            delay = self._reconnection_delay
+            while not self.connected:
+                attempt += 1
+                if (
+                    self._reconnection_attempts
+                    and attempt > self._reconnection_attempts
+                ):
+                    return
+                await asyncio.sleep(delay * (0.5 + random.random()))
+                delay = min(delay * 2, self._reconnection_delay_max)
+                try:
+                    await self._open()
+                except EngineConnectionError:
+                    continue
+                except Exception:
+                    logger.exception("Unexpected error while reconnecting")
@@ -0,0 +1,374 @@
+"""This module contains render progress parsing and completion time estimates."""
+
+from __future__ import annotations
+
+import functools
+import re
+import time
+from enum import Enum
+from enum import unique
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+    from .client import ordrClient
+
+
+__all__ = (
+    "ETATracker",
+    "RenderEstimate",
+    "RenderPhase",
+    "parse_progress",
+)
+
+
+@unique
+class RenderPhase(str, Enum):
+    QUEUED = "queued"
+    PREPARING = "preparing"
+    RENDERING = "rendering"
+    FINALIZING = "finalizing"
+    UPLOADING = "uploading"
+    DONE = "done"
+    FAILED = "failed"
+    UNKNOWN = "unknown"
+
+
+_PERCENT = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_PHASES: tuple[tuple[re.Pattern[str], RenderPhase], ...] = (
+    (re.compile(r"^done", re.IGNORECASE), RenderPhase.DONE),
+    (re.compile(r"^error|fail", re.IGNORECASE), RenderPhase.FAILED),
+    (re.compile(r"queue|waiting", re.IGNORECASE), RenderPhase.QUEUED),
+    (re.compile(r"upload", re.IGNORECASE), RenderPhase.UPLOADING),
+    (re.compile(r"finali[sz]|encod", re.IGNORECASE), RenderPhase.FINALIZING),
+    (
+        re.compile(r"prepar|download|start|process", re.IGNORECASE),
+        RenderPhase.PREPARING,
+    ),
+    (re.compile(r"render", re.IGNORECASE), RenderPhase.RENDERING),
+)
+_TAIL_PHASES = (RenderPhase.FINALIZING, RenderPhase.UPLOADING)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_progress(progress: str) -> tuple[RenderPhase, float | None]:
+    r"""Parses a progress string, e.g. ``"Rendering... 45%"``.
+
+    :param progress: Progress string of a render
+    :type progress: ``str``
+    :return: Phase and percentage, if the string contains one
+    :rtype: ``tuple[aiordr.eta.RenderPhase, Optional[float]]``
+    """
+    match = _PERCENT.search(progress)
+    percent = min(float(match.group(1)), 100.0) if match is not None else None
+    for pattern, phase in _PHASES:
+        if pattern.search(progress):
+            return phase, percent
+    if percent is not None:
+        return RenderPhase.RENDERING, percent
+    return RenderPhase.UNKNOWN, None
+
+
+class RenderEstimate:
+    __slots__ = ("render_id", "renderer", "phase", "percent", "eta")
+
+    def __init__(
+        self,
+        render_id: int,
+        renderer: str | None,
+        phase: RenderPhase,
+        percent: float | None,
+        eta: float | None,
+    ) -> None:
+        r"""Estimate of a render's completion.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :param renderer: Name of the render server
+        :type renderer: ``Optional[str]``
+        :param phase: Current phase
+        :type phase: ``aiordr.eta.RenderPhase``
+        :param percent: Rendering percentage, if known
+        :type percent: ``Optional[float]``
+        :param eta: Seconds until the video is available, if it can be estimated
+        :type eta: ``Optional[float]``
+        """
+        self.render_id = render_id
+        self.renderer = renderer
+        self.phase = phase
+        self.percent = percent
+        self.eta = eta
+
+    def __repr__(self) -> str:
+        return (
+            f"RenderEstimate(render_id={self.render_id!r}, phase={self.phase!r}, "
+            f"percent={self.percent!r}, eta={self.eta!r})"
+        )
+
+
+class _RendererStats:
+    __slots__ = ("rate", "tail", "total")
+
+    def __init__(self) -> None:
+        self.rate: float | None = None
+        self.tail: float | None = None
+        self.total: float | None = None
+
+
+class _RenderState:
+    __slots__ = (
+        "renderer",
+        "phase",
+        "percent",
+        "rate",
+        "sampled",
+        "rendering_since",
+        "tail_since",
+        "reported",
+    )
+
+    def __init__(self) -> None:
+        self.renderer: str | None = None
+        self.phase = RenderPhase.UNKNOWN
+        self.percent: float | None = None
+        self.rate: float | None = None
+        self.sampled: tuple[float, float] | None = None
+        self.rendering_since: float | None = None
+        self.tail_since: float | None = None
+        self.reported: tuple[RenderPhase, float | None] | None = None
+
+
+def _smooth(old: float | None, new: float, alpha: float) -> float:
+    return new if old is None else old + alpha * (new - old)
+
+
+class ETATracker:
+    __slots__ = (
+        "_renders",
+        "_renderers",
+        "_alpha",
+        "_clock",
+        "_max_renders",
+        "_clients",
+    )
+
+    def __init__(self, **kwargs: Any) -> None:
+        r"""Estimates when renders finish from their progress events.
+
+        The rendering speed of each render is smoothed across its progress
+        events and blended with the speed of its render server, learned from
+        previous renders along with the time they spend finalizing and
+        uploading.
+
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *alpha* (``float``) --
+                Optional, weight of new samples in the moving averages, defaults to 0.3
+            * *clock* (``Callable[[], float]``) --
+                Optional, monotonic clock in seconds, defaults to ``time.monotonic``
+            * *max_renders* (``int``) --
+                Optional, number of unfinished renders tracked before the oldest are dropped, defaults to 10000
+        """
+        self._renders: dict[int, _RenderState] = {}
+        self._renderers: dict[str, _RendererStats] = {}
+        self._alpha: float = kwargs.pop("alpha", 0.3)
+        self._clock: Callable[[], float] = kwargs.pop("clock", time.monotonic)
+        self._max_renders: int = kwargs.pop("max_renders", 10000)
+        self._clients: list[ordrClient] = []
+
+    def attach(self, client: ordrClient) -> None:
+        r"""Tracks the events of a client.
+
+        :param client: Client to track
+        :type client: ``aiordr.ordrClient``
+        :return: None
+        """
+        client.add_listener(self.update)
+        self._clients.append(client)
+
+    def detach(self) -> None:
+        r"""Stops tracking the events of every attached client.
+
+        :return: None
+        """
+        for client in self._clients:
+            client.remove_listener(self.update)
+        self._clients.clear()
+
+    def _stats(self, renderer: str) -> _RendererStats:
+        stats = self._renderers.get(renderer)
+        if stats is None:
+            stats = self._renderers[renderer] = _RendererStats()
+        return stats
+
+    def _state(self, render_id: int) -> _RenderState:
+        state = self._renders.get(render_id)
+        if state is None:
+            state = self._renders[render_id] = _RenderState()
+            if len(self._renders) > self._max_renders:
+                del self._renders[next(iter(self._renders))]
+        return state
+
+    def update(self, event: str, data: dict) -> None:
+        r"""Updates the estimates with an event. Used as a client listener.
+
+        :param event: Event name
+        :type event: ``str``
+        :param data: Raw event payload
+        :type data: ``dict``
+        :return: None
+        """
+        render_id = data.get("renderID")
+        if render_id is None:
+            return
+        now = self._clock()
+        if event == "render_added_json":
+            self._state(render_id)
+        elif event == "render_progress_json":
+            self._progress(render_id, data, now)
+        elif event == "render_done_json":
+            self._finish(render_id, now)
+        elif event == "render_fail_json":
+            self._renders.pop(render_id, None)
+
+    def _progress(self, render_id: int, data: dict, now: float) -> None:
+        state = self._state(render_id)
+        state.renderer = data.get("renderer") or state.renderer
+        phase, percent = parse_progress(data.get("progress", ""))
+
+        if phase is RenderPhase.RENDERING and percent is not None:
+            if state.rendering_since is None:
+                state.rendering_since = now
+            if state.sampled is not None and percent > state.sampled[1]:
+                then, previous = state.sampled
+                if now > then:
+                    state.rate = _smooth(
+                        state.rate,
+                        (percent - previous) / (now - then),
+                        self._alpha,
+                    )
+            if state.sampled is None or percent != state.sampled[1]:
+                state.sampled = (now, percent)
+            state.percent = percent
+        elif phase in _TAIL_PHASES:
+            if state.tail_since is None:
+                state.tail_since = now
+                state.percent = 100.0
+                if state.rate is not None and state.renderer is not None:
+                    stats = self._stats(state.renderer)
+                    stats.rate = _smooth(stats.rate, state.rate, self._alpha)
+
+        state.phase = phase
+
+    def _finish(self, render_id: int, now: float) -> None:
+        state = self._renders.pop(render_id, None)
+        if state is None or state.renderer is None:
+            return
+        stats = self._stats(state.renderer)
+        if state.tail_since is not None:
+            stats.tail = _smooth(stats.tail, now - state.tail_since, self._alpha)
+        if state.rendering_since is not None:
+            stats.total = _smooth(
+                stats.total,
+                now - state.rendering_since,
+                self._alpha,
+            )
+        if state.tail_since is None and state.rate is not None:
+            stats.rate = _smooth(stats.rate, state.rate, self._alpha)
+
+    def _eta(self, state: _RenderState, now: float) -> float | None:
+        stats = self._renderers.get(state.renderer) if state.renderer else None
+        tail = stats.tail if stats is not None else None
+
+        if state.phase in _TAIL_PHASES:
+            if tail is None or state.tail_since is None:
+                return None
+            return max(tail - (now - state.tail_since), 0.0)
+        if state.phase is RenderPhase.RENDERING and state.percent is not None:
+            rate = state.rate
+            if rate is None and stats is not None:
+                rate = stats.rate
+            if not rate:
+                return None
+            elapsed = now - state.sampled[0] if state.sampled is not None else 0.0
+            remaining = (100.0 - state.percent) / rate - elapsed
+            return max(remaining, 0.0) + (tail or 0.0)
+        if stats is not None and stats.total is not None:
+            return stats.total
+        return None
+
+    def estimate(self, render_id: int) -> RenderEstimate | None:
+        r"""Returns the current estimate of a render.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :return: Estimate, or None if the render is not being tracked
+        :rtype: ``Optional[aiordr.eta.RenderEstimate]``
+        """
+        state = self._renders.get(render_id)
+        if state is None:
+            return None
+        return RenderEstimate(
+            render_id,
+            state.renderer,
+            state.phase,
+            state.percent,
+            self._eta(state, self._clock()),
+        )
+
+    def eta(self, render_id: int) -> float | None:
+        r"""Returns the number of seconds until a render's video is available.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :return: Seconds, or None if it cannot be estimated
+        :rtype: ``Optional[float]``
+        """
+        state = self._renders.get(render_id)
+        return self._eta(state, self._clock()) if state is not None else None
+
+    def needs_refresh(self, render_id: int, tolerance: float = 10.0) -> bool:
+        r"""Whether a displayed estimate of a render is out of date.
+
+        True when the phase changed or the predicted completion time moved by
+        more than ``tolerance`` since the last call that returned True.
+        Displays can then show a completion time and only be updated when
+        this returns True, instead of on every progress event.
+
+        :param render_id: ID of the render
+        :type render_id: ``int``
+        :param tolerance: Allowed drift of the completion time in seconds, defaults to 10
+        :type tolerance: ``float``
+        :return: Whether to refresh
+        :rtype: ``bool``
+        """
+        state = self._renders.get(render_id)
+        if state is None:
+            return False
+        now = self._clock()
+        eta = self._eta(state, now)
+        finish = now + eta if eta is not None else None
+        if state.reported is not None and state.reported[0] is state.phase:
+            previous = state.reported[1]
+            if finish is None and previous is None:
+                return False
+            if finish is not None and previous is not None:
+                if abs(finish - previous) <= tolerance:
+                    return False
+        state.reported = (state.phase, finish)
+        return True
+
+    def renderer_rate(self, renderer: str) -> float | None:
+        r"""Returns the learned rendering speed of a render server.
+
+        :param renderer: Name of the render server
+        :type renderer: ``str``
+        :return: Percent per second, or None if unknown
+        :rtype: ``Optional[float]``
+        """
+        stats = self._renderers.get(renderer)
+        return stats.rate if stats is not None else None
@@ -6,7 +6,10 @@ from __future__ import annotations
 
 from .models import ErrorCode
 
-__all__ = ("APIException",)
+__all__ = (
+    "APIException",
+    "PreflightException",
+)
 
 
 class APIException(Exception):
@@ -33,3 +36,15 @@ class APIException(Exception):
         :rtype: str
         """
         return self.args[0]
+
+
+class PreflightException(APIException):
+    """Raised when a render submission fails local pre-flight validation.
+
+    It is raised before the request is sent, so no rate limit slot is used.
+    The status code is always 400 and the error code mirrors the one the API
+    would have returned.
+    """
+
+    def __init__(self, message: str, error_code: ErrorCode) -> None:
+        super().__init__(400, message, error_code)
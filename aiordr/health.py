@@ -0,0 +1,208 @@
+"""This module contains a monitor of render server availability."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .client import ordrClient
+    from .models import RenderServer
+
+
+__all__ = ("HealthMonitor",)
+
+logger = logging.getLogger(__name__)
+
+
+def is_available(server: RenderServer) -> bool:
+    """Whether a render server can take a render right away."""
+    return (
+        server.enabled
+        and server.power != "OFFLINE"
+        and server.status.casefold().startswith("idle")
+    )
+
+
+class HealthMonitor:
+    __slots__ = (
+        "_client",
+        "_min_interval",
+        "_max_interval",
+        "_interval",
+        "_budget",
+        "_ready",
+        "_refused",
+        "_check_task",
+        "_task",
+        "online_count",
+        "servers",
+        "checked_at",
+    )
+
+    def __init__(self, client: ordrClient, **kwargs: Any) -> None:
+        r"""Tracks whether render servers are available to take submissions.
+
+        Servers are assumed available until a check or a submission refused
+        with ``SERVER_NOT_READY`` shows otherwise. Only then are they checked
+        in the background, more slowly the longer they stay unavailable and
+        never using more than ``budget`` of the client's rate limit, and
+        submissions wait until they are available again. No checks are made
+        while servers are available, so they do not compete with submissions.
+
+        A check only requests the online server count, unless a submission
+        was refused while servers were online; the server list is then
+        requested until one of them is idle.
+
+        :param client: Client to check with
+        :type client: ``aiordr.ordrClient``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *interval* (``tuple[float, float]``) --
+                Optional, initial and maximum interval between checks while unavailable in seconds, defaults to (10, 120)
+            * *budget* (``float``) --
+                Optional, fraction of the rate limit used for checks, defaults to 0.25
+        """
+        self._client = client
+        self._min_interval, self._max_interval = kwargs.pop("interval", (10, 120))
+        self._interval: float = self._min_interval
+        self._budget: float = kwargs.pop("budget", 0.25)
+        self._ready: asyncio.Event | None = None
+        self._refused = False
+        self._check_task: asyncio.Task[bool] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.online_count: int | None = None
+        """Number of online servers at the last check."""
+        self.servers: list[RenderServer] = []
+        """Servers at the last check that requested them."""
+        self.checked_at: float | None = None
+        """Monotonic time of the last check."""
+
+    @property
+    def ready(self) -> bool:
+        """Whether submissions can be sent, i.e. servers are not known to be unavailable."""
+        return self._ready is None or self._ready.is_set()
+
+    @property
+    def running(self) -> bool:
+        """Whether servers are being checked in the background."""
+        return self._task is not None and not self._task.done()
+
+    def _event(self) -> asyncio.Event:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+            self._ready.set()
+        return self._ready
+
+    def start(self) -> None:
+        r"""Checks in the background until servers are available, if it is
+        not running yet.
+
+        :return: None
+        """
+        if not self.running:
+            self._interval = self._min_interval
+            self._task = asyncio.create_task(self._run())
+
+    async def aclose(self) -> None:
+        r"""Stops checking.
+
+        :return: None
+        """
+        for task in (self._task, self._check_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._check_task = None
+
+    async def check(self) -> bool:
+        r"""Checks the servers now. Concurrent calls share a single check.
+
+        :return: Whether servers are available
+        :rtype: ``bool``
+        """
+        if self._check_task is None or self._check_task.done():
+            self._check_task = asyncio.create_task(self._check())
+        return await asyncio.shield(self._check_task)
+
+    async def _check(self) -> bool:
+        count = await self._client.get_server_online_count()
+        self.online_count = count
+        if count and self._refused:
+            self.servers = await self._client.get_server_list()
+            ready = any(is_available(x) for x in self.servers)
+        else:
+            ready = bool(count)
+        self.checked_at = time.monotonic()
+
+        ready_event = self._event()
+        if ready:
+            self._refused = False
+            ready_event.set()
+        else:
+            ready_event.clear()
+            self.start()
+        return ready
+
+    def mark_unavailable(self) -> None:
+        r"""Marks the servers as unavailable and checks them in the
+        background, e.g. after a submission was refused with
+        ``SERVER_NOT_READY``.
+
+        :return: None
+        """
+        self._refused = True
+        self._event().clear()
+        self.start()
+
+    async def wait_until_ready(
+        self,
+        timeout: float | None = None,
+        check: bool = True,
+    ) -> None:
+        r"""Waits until servers are available.
+
+        :param timeout: Maximum time to wait in seconds, defaults to None
+        :type timeout: ``Optional[float]``
+        :param check: Whether to check the servers first if they never were, defaults to True
+        :type check: ``bool``
+        :raises: ``asyncio.TimeoutError``: If no server is available in time
+        :raises: ``aiordr.exceptions.APIException``: If the first check fails
+        :return: None
+        """
+        await asyncio.wait_for(self._wait(check and self.checked_at is None), timeout)
+
+    async def _wait(self, check: bool) -> None:
+        if check:
+            await self.check()
+        ready_event = self._event()
+        if not ready_event.is_set():
+            self.start()
+            await ready_event.wait()
+
+    def _next_interval(self) -> float:
+        interval = self._interval
+        self._interval = min(self._interval * 2, self._max_interval)
+        limiter = self._client._limiter
+        requests = 2 if self._refused and self.online_count else 1
+        floor = requests * limiter.time_period / limiter.max_rate / self._budget
+        return max(interval, floor)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._next_interval())
+            try:
+                if await self.check():
+                    return
+            except Exception:
+                logger.exception("Could not check the render servers")
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import IO
     from typing import Any
     from typing import TypeVar
 
@@ -16,6 +17,7 @@ if TYPE_CHECKING:
 __all__ = (
     "add_param",
     "from_list",
+    "read_replay",
 )
 
 
@@ -64,3 +66,20 @@ def add_param(
         params[param_name or key] = value
         return True
     return False
+
+
+def read_replay(replay: IO[bytes] | bytes) -> bytes:
+    r"""Reads replay bytes without consuming the file.
+
+    :param replay: Replay file or data
+    :type replay: ``Union[typing.IO, bytes]``
+    :return: Replay data
+    :rtype: ``bytes``
+    """
+    if isinstance(replay, (bytes, bytearray, memoryview)):
+        return bytes(replay)
+    position = replay.tell() if replay.seekable() else None
+    data = replay.read()
+    if position is not None:
+        replay.seek(position)
+    return data
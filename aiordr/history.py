@@ -0,0 +1,284 @@
+"""This module contains a columnar store for render history analytics.
+
+It requires ``numpy``, available with the ``history`` extra.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from .models import RendersResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+    from typing import Any
+
+    from .models import Render
+
+
+__all__ = ("RenderHistory",)
+
+INT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "map_id",
+    "render_total_time",
+    "upload_total_time",
+    "map_length",
+    "global_volume",
+    "music_volume",
+    "hitsound_volume",
+)
+TIME_COLUMNS: tuple[str, ...] = (
+    "date",
+    "render_start_time",
+    "render_end_time",
+    "upload_end_time",
+)
+BOOL_COLUMNS: tuple[str, ...] = (
+    "is_bot",
+    "is_verified",
+    "removed",
+    "motion_blur",
+)
+STRING_COLUMNS: tuple[str, ...] = (
+    "renderer",
+    "skin",
+    "replay_mods",
+    "username",
+    "replay_username",
+)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for RenderHistory, install aiordr[history]",
+        )
+
+
+class RenderHistory:
+    __slots__ = ("_columns", "_size", "_categories", "_codes", "_ids")
+
+    def __init__(self, capacity: int = 1024) -> None:
+        r"""Columnar store of render history.
+
+        Numeric fields are kept in NumPy arrays, timestamps as milliseconds
+        since the epoch and strings as dictionary-encoded codes.
+
+        :param capacity: Number of renders allocated up front, defaults to 1024
+        :type capacity: ``int``
+        :raises: ``ImportError``: If numpy is not installed
+        """
+        _require_numpy()
+        self._size = 0
+        self._columns: dict[str, Any] = {}
+        for name in INT_COLUMNS + TIME_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=np.int64)
+        for name in BOOL_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=np.bool_)
+        for name in STRING_COLUMNS:
+            self._columns[name] = np.zeros(capacity, dtype=np.int32)
+        self._categories: dict[str, list[str]] = {x: [] for x in STRING_COLUMNS}
+        self._codes: dict[str, dict[str, int]] = {x: {} for x in STRING_COLUMNS}
+        self._ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._columns["id"])
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            self._columns[name] = grown
+
+    def _encode(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._categories[name].append(value)
+        return code
+
+    def append(self, renders: RendersResponse | Iterable[Render]) -> int:
+        r"""Appends renders, skipping the ones already stored.
+
+        :param renders: Page of renders or renders
+        :type renders: ``Union[aiordr.models.render.RendersResponse, Iterable[aiordr.models.render.Render]]``
+        :return: Number of renders appended
+        :rtype: ``int``
+        """
+        items = renders.renders if isinstance(renders, RendersResponse) else renders
+        new = [x for x in items if x.id not in self._ids]
+        if not new:
+            return 0
+        start = self._size
+        end = start + len(new)
+        self._reserve(end)
+
+        columns = self._columns
+        for name in INT_COLUMNS:
+            columns[name][start:end] = [getattr(x, name) for x in new]
+        for name in TIME_COLUMNS:
+            columns[name][start:end] = [
+                int(getattr(x, name).timestamp() * 1000) for x in new
+            ]
+        for name in BOOL_COLUMNS:
+            columns[name][start:end] = [getattr(x, name) for x in new]
+        for name in STRING_COLUMNS:
+            columns[name][start:end] = [
+                self._encode(name, getattr(x, name)) for x in new
+            ]
+
+        self._ids.update(x.id for x in new)
+        self._size = end
+        return len(new)
+
+    def column(self, name: str) -> Any:
+        r"""Returns a read-only view of a column.
+
+        String columns contain codes, see ``categories``.
+
+        :param name: Column name
+        :type name: ``str``
+        :raises: ``KeyError``: If the column does not exist
+        :return: Column values
+        :rtype: ``numpy.ndarray``
+        """
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def categories(self, name: str) -> list[str]:
+        r"""Returns the values of a string column, indexed by code.
+
+        :param name: Column name
+        :type name: ``str``
+        :return: Values
+        :rtype: ``list[str]``
+        """
+        return list(self._categories[name])
+
+    def group_mean(self, value: str, by: str) -> dict[str, float]:
+        r"""Mean of a column grouped by a string column.
+
+        :param value: Column to average, e.g. ``render_total_time``
+        :type value: ``str``
+        :param by: String column to group by, e.g. ``renderer``
+        :type by: ``str``
+        :return: Mean per group
+        :rtype: ``dict[str, float]``
+        """
+        codes = self.column(by)
+        size = len(self._categories[by])
+        counts = np.bincount(codes, minlength=size)
+        sums = np.bincount(codes, weights=self.column(value), minlength=size)
+        return {
+            name: float(sums[i] / counts[i])
+            for i, name in enumerate(self._categories[by])
+            if counts[i]
+        }
+
+    def group_count(self, by: str) -> dict[str, int]:
+        r"""Number of renders per value of a string column.
+
+        :param by: String column to group by
+        :type by: ``str``
+        :return: Count per group
+        :rtype: ``dict[str, int]``
+        """
+        counts = np.bincount(self.column(by), minlength=len(self._categories[by]))
+        return {
+            name: int(counts[i])
+            for i, name in enumerate(self._categories[by])
+            if counts[i]
+        }
+
+    def percentile(
+        self,
+        value: str,
+        q: float | Iterable[float],
+        by: str | None = None,
+    ) -> Any:
+        r"""Percentiles of a column, optionally grouped by a string column.
+
+        :param value: Column, e.g. ``upload_total_time``
+        :type value: ``str``
+        :param q: Percentile or percentiles, between 0 and 100
+        :type q: ``Union[float, Iterable[float]]``
+        :param by: String column to group by, defaults to None
+        :type by: ``Optional[str]``
+        :return: Percentiles, or percentiles per group if ``by`` is given
+        :rtype: ``Union[numpy.ndarray, dict[str, numpy.ndarray]]``
+        """
+        values = self.column(value)
+        q = np.asarray(q, dtype=np.float64)
+        if by is None:
+            return np.percentile(values, q)
+
+        codes = self.column(by)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(self._categories[by]) + 1))
+        result = {}
+        for i, name in enumerate(self._categories[by]):
+            group = values[order[bounds[i] : bounds[i + 1]]]
+            if len(group):
+                result[name] = np.percentile(group, q)
+        return result
+
+    def histogram(self, value: str, bins: int | Sequence[float] = 10) -> Any:
+        r"""Distribution of a column, e.g. ``map_length``.
+
+        :param value: Column name
+        :type value: ``str``
+        :param bins: Number of bins or bin edges, defaults to 10
+        :type bins: ``Union[int, Sequence[float]]``
+        :return: Counts and bin edges
+        :rtype: ``tuple[numpy.ndarray, numpy.ndarray]``
+        """
+        return np.histogram(self.column(value), bins=bins)
+
+    def save(self, path: str) -> None:
+        r"""Saves the store to a compressed ``.npz`` file.
+
+        :param path: Destination path
+        :type path: ``str``
+        :return: None
+        """
+        arrays = {name: self.column(name) for name in self._columns}
+        for name in STRING_COLUMNS:
+            arrays[f"{name}__categories"] = np.array(self._categories[name], dtype=str)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> RenderHistory:
+        r"""Loads a store saved with ``save``.
+
+        :param path: Path of the file
+        :type path: ``str``
+        :return: Render history
+        :rtype: ``aiordr.history.RenderHistory``
+        """
+        with np.load(path) as data:
+            size = len(data["id"])
+            history = cls(capacity=max(size, 1))
+            for name in history._columns:
+                history._columns[name][:size] = data[name]
+            for name in STRING_COLUMNS:
+                categories = [str(x) for x in data[f"{name}__categories"]]
+                history._categories[name] = categories
+                history._codes[name] = {x: i for i, x in enumerate(categories)}
+        history._size = size
+        history._ids = set(history._columns["id"][:size].tolist())
+        return history
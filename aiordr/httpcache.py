@@ -0,0 +1,318 @@
+"""This module contains a persistent HTTP response cache with conditional revalidation."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
+
+if TYPE_CHECKING:
+    import sqlite3
+    from collections.abc import Mapping
+    from typing import Any
+
+
+__all__ = (
+    "CachedResponse",
+    "HTTPCache",
+    "default_cache_path",
+)
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+_NO_STORE = re.compile(r"(?:^|,)\s*no-store\b", re.IGNORECASE)
+
+
+def default_cache_path() -> str:
+    r"""Returns the database path used by ``ordrClient(http_cache=True)``.
+
+    :return: ``aiordr/http.sqlite`` in ``$XDG_CACHE_HOME``, or ``~/.cache`` if it is not set
+    :rtype: ``str``
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(root, "aiordr", "http.sqlite")
+
+
+class CachedResponse:
+    __slots__ = ("etag", "last_modified", "content_type", "body", "expires")
+
+    def __init__(
+        self,
+        etag: str | None,
+        last_modified: str | None,
+        content_type: str,
+        body: bytes,
+        expires: float = 0.0,
+    ) -> None:
+        r"""A stored response.
+
+        :param etag: Value of the ``ETag`` header
+        :type etag: ``Optional[str]``
+        :param last_modified: Value of the ``Last-Modified`` header
+        :type last_modified: ``Optional[str]``
+        :param content_type: Content type of the body
+        :type content_type: ``str``
+        :param body: Raw body
+        :type body: ``bytes``
+        :param expires: Time until which the response is fresh, defaults to 0
+        :type expires: ``float``
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.body = body
+        self.expires = expires
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the response can be used without revalidation."""
+        return self.expires > time.time()
+
+    def validators(self) -> dict[str, str]:
+        r"""Returns the headers of a conditional request for the response.
+
+        :return: Request headers
+        :rtype: ``dict[str, str]``
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    __slots__ = ("_db", "_lock", "_max_size", "_size")
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        r"""Cache of GET responses stored in an SQLite database.
+
+        Only responses carrying an ``ETag`` or ``Last-Modified`` header are
+        stored. They are revalidated with conditional requests, unless a
+        ``Cache-Control: max-age`` keeps them fresh. Least recently used
+        responses are evicted once the bodies exceed ``max_size``. The cache
+        can be used from any thread, e.g. by ``aiordr.ordrSyncClient``.
+
+        :param path: Path of the database, created along with its directory if missing, defaults to an in-memory database
+        :type path: ``str``
+        :param max_size: Maximum total size of the stored bodies in bytes, defaults to 64 MiB
+        :type max_size: ``int``
+        """
+        import sqlite3
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._max_size = max_size
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = sqlite3.connect(
+            path,
+            check_same_thread=False,
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, content_type TEXT, "
+            "body BLOB, size INTEGER, expires REAL, used REAL)",
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used ON responses (used)",
+        )
+        self._size: int = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses",
+        ).fetchone()[0]
+        self._evict()
+
+    def __len__(self) -> int:
+        with self._lock:
+            db = self._connection
+            return db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            raise RuntimeError("HTTPCache is closed")
+        return self._db
+
+    @property
+    def size(self) -> int:
+        """Total size of the stored bodies in bytes."""
+        return self._size
+
+    @staticmethod
+    def make_key(url: str, params: Mapping[str, Any] | None = None) -> str:
+        r"""Builds the cache key of a request.
+
+        :param url: Request URL
+        :type url: ``str``
+        :param params: Query parameters, defaults to None
+        :type params: ``Optional[Mapping[str, Any]]``
+        :return: Cache key
+        :rtype: ``str``
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        r"""Get the stored response of a key.
+
+        :param key: Cache key
+        :type key: ``str``
+        :return: Response, or None if the key is unknown
+        :rtype: ``Optional[aiordr.httpcache.CachedResponse]``
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, content_type, body, expires "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(*row)
+
+    def store(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+        content_type: str,
+        body: bytes,
+    ) -> bool:
+        r"""Store a response, if its headers allow revalidating it.
+
+        :param key: Cache key
+        :type key: ``str``
+        :param headers: Response headers
+        :type headers: ``Mapping[str, str]``
+        :param content_type: Content type of the body
+        :type content_type: ``str``
+        :param body: Raw body
+        :type body: ``bytes``
+        :return: Whether the response was stored
+        :rtype: ``bool``
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        cache_control = headers.get("Cache-Control", "")
+        if etag is None and last_modified is None:
+            return False
+        if _NO_STORE.search(cache_control) or len(body) > self._max_size:
+            return False
+
+        now = time.time()
+        with self._lock:
+            db = self._connection
+            with db:
+                old = db.execute(
+                    "SELECT size FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        etag,
+                        last_modified,
+                        content_type,
+                        body,
+                        len(body),
+                        now + _max_age(cache_control),
+                        now,
+                    ),
+                )
+            self._size += len(body) - (old[0] if old is not None else 0)
+            self._evict()
+        return True
+
+    def refresh(self, key: str, headers: Mapping[str, str]) -> None:
+        r"""Record a successful revalidation (``304 Not Modified``) of a response.
+
+        :param key: Cache key
+        :type key: ``str``
+        :param headers: Headers of the ``304`` response
+        :type headers: ``Mapping[str, str]``
+        :return: None
+        """
+        now = time.time()
+        cache_control = headers.get("Cache-Control", "")
+        with self._lock, self._connection as db:
+            db.execute(
+                "UPDATE responses SET used = ?, expires = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE key = ?",
+                (
+                    now,
+                    now + _max_age(cache_control),
+                    headers.get("ETag"),
+                    headers.get("Last-Modified"),
+                    key,
+                ),
+            )
+
+    def touch(self, key: str) -> None:
+        r"""Mark a response as recently used.
+
+        :param key: Cache key
+        :type key: ``str``
+        :return: None
+        """
+        with self._lock, self._connection as db:
+            db.execute(
+                "UPDATE responses SET used = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+    def discard(self, key: str) -> None:
+        r"""Remove a response.
+
+        :param key: Cache key
+        :type key: ``str``
+        :return: None
+        """
+        with self._lock:
+            db = self._connection
+            with db:
+                row = db.execute(
+                    "SELECT size FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._size -= row[0]
+
+    def _evict(self) -> None:
+        if self._size <= self._max_size:
+            return
+        db = self._connection
+        evicted = []
+        with db:
+            for key, size in db.execute(
+                "SELECT key, size FROM responses ORDER BY used",
+            ).fetchall():
+                if self._size <= self._max_size:
+                    break
+                evicted.append((key,))
+                self._size -= size
+            db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def close(self) -> None:
+        r"""Closes the database.
+
+        :return: None
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _max_age(cache_control: str) -> int:
+    match = _MAX_AGE.search(cache_control)
+    return int(match.group(1)) if match is not None else 0
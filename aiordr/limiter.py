@@ -0,0 +1,296 @@
+"""This module contains rate limiters shared between processes.
+
+Both limiters hand out request slots in arrival order: a request reserves
+the next free slot of a shared schedule, then waits for it. At most
+``max_rate`` slots fall within any ``time_period``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import struct
+import time
+from typing import TYPE_CHECKING
+from typing import Protocol
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Any
+
+
+__all__ = (
+    "FileRateLimiter",
+    "RateCoordinator",
+    "RateLimiter",
+    "RemoteRateLimiter",
+)
+
+_SLOT = struct.Struct("<d")
+
+
+class RateLimiter(Protocol):
+    """Interface of the limiters accepted by ``aiordr.ordrClient``."""
+
+    max_rate: int
+    time_period: float
+
+    async def __aenter__(self) -> Any: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> Any: ...
+
+
+def reserve(slots: list[float], now: float, max_rate: int, time_period: float) -> float:
+    """Reserves the next slot of a schedule and returns the time it starts.
+
+    ``slots`` holds the start times of the last ``max_rate`` slots and is
+    updated in place. A slot starts at least ``time_period`` after the slot
+    ``max_rate`` places before it, so no window holds more than ``max_rate``.
+    """
+    start = now
+    if len(slots) >= max_rate:
+        start = max(now, slots[-max_rate] + time_period)
+    if slots:
+        start = max(start, slots[-1])
+    slots.append(start)
+    del slots[:-max_rate]
+    return start
+
+
+class FileRateLimiter:
+    __slots__ = ("max_rate", "time_period", "_path")
+
+    def __init__(self, path: str, max_rate: int = 1, time_period: float = 300) -> None:
+        r"""Rate limiter shared by the processes of a host through a locked file.
+
+        Every process using the same ``path`` must use the same rate.
+
+        :param path: Path of the state file, created if needed
+        :type path: ``str``
+        :param max_rate: Number of requests allowed per time period, defaults to 1
+        :type max_rate: ``int``
+        :param time_period: Time period in seconds, defaults to 300
+        :type time_period: ``float``
+        :raises: ``RuntimeError``: If file locks are not supported on this platform
+        """
+        if fcntl is None:
+            raise RuntimeError("FileRateLimiter requires fcntl file locks")
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._path = path
+
+    def _reserve(self) -> float:
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            data = os.pread(fd, _SLOT.size * self.max_rate, 0)
+            data = data[: len(data) - len(data) % _SLOT.size]
+            slots = [x[0] for x in _SLOT.iter_unpack(data)]
+            now = time.time()
+            start = reserve(slots, now, self.max_rate, self.time_period)
+            os.pwrite(fd, b"".join(_SLOT.pack(x) for x in slots), 0)
+            return start - now
+        finally:
+            os.close(fd)
+
+    async def acquire(self) -> None:
+        r"""Waits for a request slot.
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        delay = await loop.run_in_executor(None, self._reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+
+class RateCoordinator:
+    __slots__ = ("max_rate", "time_period", "_slots", "_server")
+
+    def __init__(self, max_rate: int = 1, time_period: float = 300) -> None:
+        r"""Server handing out request slots to ``RemoteRateLimiter`` clients.
+
+        Slots are scheduled on the coordinator's clock, so clients do not
+        need synchronized clocks. Run it with ``python -m aiordr.limiter``.
+
+        :param max_rate: Number of requests allowed per time period, defaults to 1
+        :type max_rate: ``int``
+        :param time_period: Time period in seconds, defaults to 300
+        :type time_period: ``float``
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._slots: list[float] = []
+        self._server: asyncio.Server | None = None
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        writer.write(f"{self.max_rate} {self.time_period}\n".encode())
+        try:
+            while await reader.readline():
+                now = time.monotonic()
+                start = reserve(self._slots, now, self.max_rate, self.time_period)
+                writer.write(f"{start - now}\n".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        r"""Starts listening.
+
+        :param host: Address to listen on, defaults to "127.0.0.1"
+        :type host: ``str``
+        :param port: Port to listen on, defaults to a free port
+        :type port: ``int``
+        :return: Address and port listened on
+        :rtype: ``tuple[str, int]``
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        r"""Starts listening and serves until cancelled.
+
+        :param host: Address to listen on, defaults to "127.0.0.1"
+        :type host: ``str``
+        :param port: Port to listen on, defaults to a free port
+        :type port: ``int``
+        :return: None
+        """
+        await self.start(host, port)
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        r"""Stops listening.
+
+        :return: None
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+class RemoteRateLimiter:
+    __slots__ = ("max_rate", "time_period", "_host", "_port", "_lock", "_stream")
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        r"""Rate limiter taking request slots from a ``RateCoordinator``.
+
+        ``max_rate`` and ``time_period`` are those of the coordinator once
+        connected, and (1, 300) before.
+
+        :param host: Address of the coordinator, defaults to "127.0.0.1"
+        :type host: ``str``
+        :param port: Port of the coordinator, defaults to 8765
+        :type port: ``int``
+        """
+        self.max_rate: int = 1
+        self.time_period: float = 300
+        self._host = host
+        self._port = port
+        self._lock = asyncio.Lock()
+        self._stream: tuple[asyncio.StreamReader, asyncio.StreamWriter] | None = None
+
+    async def _reserve(self) -> float:
+        async with self._lock:
+            for attempt in range(2):
+                if self._stream is None:
+                    reader, writer = await asyncio.open_connection(
+                        self._host,
+                        self._port,
+                    )
+                    max_rate, time_period = (await reader.readline()).split()
+                    self.max_rate = int(max_rate)
+                    self.time_period = float(time_period)
+                    self._stream = reader, writer
+                reader, writer = self._stream
+                try:
+                    writer.write(b"\n")
+                    await writer.drain()
+                    line = await reader.readline()
+                    if not line:
+                        raise ConnectionResetError
+                    return float(line)
+                except ConnectionError:
+                    self._stream = None
+                    writer.close()
+                    if attempt:
+                        raise
+        raise AssertionError  # pragma: no cover
+
+    async def acquire(self) -> None:
+        r"""Waits for a request slot.
+
+        :raises: ``ConnectionError``: If the coordinator cannot be reached
+        :return: None
+        """
+        delay = await self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        r"""Closes the connection to the coordinator.
+
+        :return: None
+        """
+        if self._stream is not None:
+            writer = self._stream[1]
+            self._stream = None
+            writer.close()
+            await writer.wait_closed()
+
+
+def main() -> None:  # pragma: no cover
+    parser = argparse.ArgumentParser(description="o!rdr rate limit coordinator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-rate", type=int, default=1)
+    parser.add_argument("--time-period", type=float, default=300)
+    args = parser.parse_args()
+    coordinator = RateCoordinator(args.max_rate, args.time_period)
+    asyncio.run(coordinator.serve_forever(args.host, args.port))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -2,9 +2,68 @@
 
 # isort: dont-add-imports
 
-from .base import *
-from .errorcode import *
-from .events import *
-from .render import *
-from .renderserver import *
-from .skin import *
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .base import *
+    from .compact import *
+    from .errorcode import *
+    from .events import *
+    from .render import *
+    from .renderserver import *
+    from .skin import *
+
+# Model modules are imported on first attribute access to keep imports cheap,
+# along with any other submodule accessed as an attribute.
+_LAZY_ATTRS: dict[str, str] = {
+    "BaseModel": "base",
+    "FrozenModel": "base",
+    "CompactRecord": "compact",
+    "CompactRender": "compact",
+    "CompactSkin": "compact",
+    "StringPool": "compact",
+    "ErrorCode": "errorcode",
+    "RenderAddEvent": "events",
+    "RenderBaseEvent": "events",
+    "RenderFailEvent": "events",
+    "RenderFinishEvent": "events",
+    "RenderProgressEvent": "events",
+    "FrozenRenderOptions": "render",
+    "Render": "render",
+    "RenderCreateResponse": "render",
+    "RenderOptions": "render",
+    "RenderResolution": "render",
+    "RendersResponse": "render",
+    "RenderServer": "renderserver",
+    "RenderServerOptions": "renderserver",
+    "Skin": "skin",
+    "SkinCompact": "skin",
+    "SkinsResponse": "skin",
+}
+
+__all__ = tuple(sorted(_LAZY_ATTRS))
+
+
+def _import_submodule(name: str) -> Any:
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __getattr__(name: str) -> Any:
+    value: Any
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(f".{_LAZY_ATTRS[name]}", __name__), name)
+    else:
+        value = _import_submodule(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
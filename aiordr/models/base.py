@@ -14,7 +14,7 @@ __all__ = (
 
 
 class BaseModel(pydantic.BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     @classmethod
     def model_validate_file(cls, path: str) -> BaseModel:
@@ -31,4 +31,4 @@ class BaseModel(pydantic.BaseModel):
 
 
 class FrozenModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, frozen=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True)
@@ -0,0 +1,276 @@
+"""
+This module contains memory-compact, read-only representations of models.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from .render import Render
+from .skin import Skin
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .base import BaseModel
+
+
+__all__ = (
+    "CompactRecord",
+    "CompactRender",
+    "CompactSkin",
+    "StringPool",
+)
+
+_URL_SUFFIXES = ("url", "link", "path", "preview")
+
+
+class StringPool:
+    __slots__ = ("_strings",)
+
+    def __init__(self) -> None:
+        """Pool of strings shared between compact records."""
+        self._strings: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, value: str) -> str:
+        r"""Returns the pooled instance of a string.
+
+        :param value: String to intern
+        :type value: ``str``
+        :return: Pooled string
+        :rtype: ``str``
+        """
+        return self._strings.setdefault(value, value)
+
+    def clear(self) -> None:
+        r"""Empties the pool. Strings referenced by records stay alive.
+
+        :return: None
+        """
+        self._strings.clear()
+
+
+DEFAULT_POOL = StringPool()
+
+
+def _parse_datetime(value: str) -> datetime:
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class _Field:
+    __slots__ = ("name", "alias", "kind", "index", "default", "type")
+
+    def __init__(
+        self,
+        name: str,
+        alias: str,
+        kind: str,
+        index: int,
+        default: Any,
+        type_: Any,
+    ) -> None:
+        self.name = name
+        self.alias = alias
+        self.kind = kind
+        self.index = index
+        self.default = default
+        self.type = type_
+
+
+def _build_layout(model: type[BaseModel]) -> dict[str, _Field]:
+    layout: dict[str, _Field] = {}
+    index = flag = 0
+    for name, info in model.model_fields.items():
+        annotation = info.annotation
+        default = None if info.is_required() else info.get_default()
+        if isinstance(default, Enum):
+            default = default.value
+        if annotation is bool:
+            layout[name] = _Field(name, info.alias or name, "bool", flag, default, bool)
+            flag += 1
+            continue
+        if annotation is datetime:
+            kind = "datetime"
+        elif isinstance(annotation, type) and issubclass(annotation, Enum):
+            kind = "enum"
+        elif annotation is str and name.endswith(_URL_SUFFIXES):
+            kind = "url"
+        elif annotation is str:
+            kind = "str"
+        else:
+            kind = "value"
+        layout[name] = _Field(
+            name,
+            info.alias or name,
+            kind,
+            index,
+            default,
+            annotation,
+        )
+        index += 2 if kind == "url" else 1
+    return layout
+
+
+class CompactRecord:
+    """Base class of compact records.
+
+    Values are stored in a single tuple, booleans in a bitmask and strings in
+    a shared ``StringPool``. URLs are split into a pooled prefix and their
+    last path segment, and datetimes are parsed on access.
+    """
+
+    __slots__ = ("_values", "_flags")
+
+    _model: ClassVar[type[BaseModel]]
+    _layout: ClassVar[dict[str, _Field]]
+
+    _values: tuple[Any, ...]
+    _flags: int
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._layout = _build_layout(cls._model)
+
+    def __init__(self, data: dict[str, Any], pool: StringPool | None = None) -> None:
+        r"""Builds a record from a raw API payload, without validation.
+
+        :param data: Raw payload, as returned by the API
+        :type data: ``dict[str, Any]``
+        :param pool: String pool, defaults to a pool shared by every record
+        :type pool: ``Optional[aiordr.models.compact.StringPool]``
+        """
+        intern = (pool or DEFAULT_POOL).intern
+        values: list[Any] = []
+        flags = 0
+        for field in self._layout.values():
+            value = data.get(field.alias, field.default)
+            kind = field.kind
+            if kind == "bool":
+                if value:
+                    flags |= 1 << field.index
+            elif kind == "url":
+                split = value.rfind("/") + 1
+                values.append(intern(value[:split]))
+                values.append(value[split:])
+            elif kind == "str" or kind == "datetime" or kind == "enum":
+                values.append(intern(value) if isinstance(value, str) else value)
+            else:
+                values.append(value)
+        object.__setattr__(self, "_values", tuple(values))
+        object.__setattr__(self, "_flags", flags)
+
+    def __getattr__(self, name: str) -> Any:
+        field = self._layout.get(name)
+        if field is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}",
+            )
+        kind = field.kind
+        if kind == "bool":
+            return bool(self._flags >> field.index & 1)
+        value = self._values[field.index]
+        if kind == "url":
+            return value + self._values[field.index + 1]
+        if kind == "datetime":
+            return _parse_datetime(value)
+        if kind == "enum":
+            return field.type(value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__!r} object is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values == other._values and self._flags == other._flags
+
+    def __hash__(self) -> int:
+        return hash((self._values, self._flags))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in list(self._layout)[:3]
+        )
+        return f"{type(self).__name__}({fields}, ...)"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.to_dict(),)
+
+    @classmethod
+    def from_model(cls, model: BaseModel, pool: StringPool | None = None) -> Any:
+        r"""Builds a record from a model.
+
+        :param model: Model to convert
+        :type model: ``aiordr.models.base.BaseModel``
+        :param pool: String pool, defaults to a pool shared by every record
+        :type pool: ``Optional[aiordr.models.compact.StringPool]``
+        :return: Compact record
+        :rtype: ``aiordr.models.compact.CompactRecord``
+        """
+        return cls(model.model_dump(mode="json", by_alias=True), pool)
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Returns the raw payload of the record, keyed by alias.
+
+        :return: Raw payload
+        :rtype: ``dict[str, Any]``
+        """
+        data = {}
+        for name, field in self._layout.items():
+            value = getattr(self, name)
+            if field.kind == "datetime":
+                value = self._values[field.index]
+            elif field.kind == "enum":
+                value = value.value
+            data[field.alias] = value
+        return data
+
+    def to_model(self) -> Any:
+        r"""Converts the record to its full model.
+
+        :return: Model
+        :rtype: ``aiordr.models.base.BaseModel``
+        """
+        return self._model.model_validate(self.to_dict())
+
+
+class CompactRender(CompactRecord):
+    """Compact, read-only counterpart of ``aiordr.models.render.Render``."""
+
+    __slots__ = ()
+    _model = Render
+
+    def to_model(self) -> Render:
+        r"""Converts the record to a render.
+
+        :return: Render
+        :rtype: ``aiordr.models.render.Render``
+        """
+        return Render.model_validate(self.to_dict())
+
+
+class CompactSkin(CompactRecord):
+    """Compact, read-only counterpart of ``aiordr.models.skin.Skin``."""
+
+    __slots__ = ()
+    _model = Skin
+
+    def to_model(self) -> Skin:
+        r"""Converts the record to a skin.
+
+        :return: Skin
+        :rtype: ``aiordr.models.skin.Skin``
+        """
+        return Skin.model_validate(self.to_dict())
@@ -7,11 +7,13 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
+from pydantic import ConfigDict
 from pydantic import Field
 
 from .base import BaseModel
 
 __all__ = (
+    "FrozenRenderOptions",
     "Render",
     "RenderCreateResponse",
     "RenderOptions",
@@ -79,6 +81,10 @@ class RenderOptions(BaseModel):
     play_nightcore_samples: bool = Field(alias="playNightcoreSamples", default=True)
 
 
+class FrozenRenderOptions(RenderOptions):
+    model_config = ConfigDict(populate_by_name=True, frozen=True, defer_build=True)
+
+
 class Render(RenderOptions):
     id: int = Field(alias="renderID")
     date: datetime
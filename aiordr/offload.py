@@ -0,0 +1,105 @@
+"""This module contains helpers keeping heavy work off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .models.base import BaseModel
+
+
+__all__ = ("LoopStallMonitor",)
+
+
+def decode_json(body: bytes, model: type[BaseModel] | None = None) -> Any:
+    """Decodes a JSON body and validates it, in the caller's thread or process."""
+    data = orjson.loads(body)
+    return data if model is None else model.model_validate(data)
+
+
+class LoopStallMonitor:
+    __slots__ = (
+        "_interval",
+        "_threshold",
+        "_task",
+        "stalls",
+        "stall_time",
+        "max_stall",
+    )
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.02) -> None:
+        r"""Measures how long the event loop is blocked.
+
+        A task wakes up every ``interval`` seconds; any delay past the
+        scheduled wake-up longer than ``threshold`` is counted as a stall.
+
+        :param interval: Seconds between measurements, defaults to 0.1
+        :type interval: ``float``
+        :param threshold: Minimum delay counted as a stall in seconds, defaults to 0.02
+        :type threshold: ``float``
+        """
+        self._interval = interval
+        self._threshold = threshold
+        self._task: asyncio.Task[None] | None = None
+        self.stalls: int = 0
+        """Number of stalls."""
+        self.stall_time: float = 0.0
+        """Total stall time in seconds."""
+        self.max_stall: float = 0.0
+        """Longest stall in seconds."""
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        r"""Starts measuring on the running loop, if it is not running yet.
+
+        :return: None
+        """
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        r"""Stops measuring.
+
+        :return: None
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self) -> None:
+        r"""Resets the measurements.
+
+        :return: None
+        """
+        self.stalls = 0
+        self.stall_time = 0.0
+        self.max_stall = 0.0
+
+    def record(self, delay: float) -> None:
+        r"""Records a delay of the event loop.
+
+        :param delay: Delay in seconds
+        :type delay: ``float``
+        :return: None
+        """
+        if delay < self._threshold:
+            return
+        self.stalls += 1
+        self.stall_time += delay
+        self.max_stall = max(self.max_stall, delay)
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self._interval
+            await asyncio.sleep(self._interval)
+            self.record(time.perf_counter() - expected)
@@ -0,0 +1,267 @@
+"""This module contains a polling fallback for when the websocket is unavailable."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from .client import diff_render
+from .exceptions import APIException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    from .client import ordrClient
+    from .models import Render
+
+
+__all__ = ("RenderPoller",)
+
+logger = logging.getLogger(__name__)
+
+
+class RenderPoller:
+    __slots__ = (
+        "_client",
+        "_usernames",
+        "_seen",
+        "_min_interval",
+        "_max_interval",
+        "_interval",
+        "_budget",
+        "_reconnect_interval",
+        "_reconnect",
+        "_active",
+        "_wake",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        client: ordrClient,
+        usernames: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        r"""Polls the render list and dispatches the changes as events.
+
+        Tracked renders and the renders of watched usernames are grouped so
+        that each username costs a single request per poll. Changes are
+        dispatched through the client, so they reach the same handlers,
+        listeners and streams as websocket events.
+
+        The interval drops to its minimum whenever a poll finds changes and
+        doubles otherwise, and never uses more than ``budget`` of the
+        client's rate limit.
+
+        :param client: Client to poll with
+        :type client: ``aiordr.ordrClient``
+        :param usernames: Usernames whose renders are watched, defaults to None
+        :type usernames: ``Optional[Iterable[str]]``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *interval* (``tuple[float, float]``) --
+                Optional, minimum and maximum interval between polls in seconds, defaults to (5, 120)
+            * *budget* (``float``) --
+                Optional, fraction of the rate limit used for polling, defaults to 0.5
+            * *reconnect_interval* (``float``) --
+                Optional, interval between websocket connection attempts in seconds, defaults to 60
+        """
+        self._client = client
+        self._usernames: set[str] = set(usernames or ())
+        self._seen: dict[str, dict[int, str | None]] = {}
+        self._min_interval, self._max_interval = kwargs.pop("interval", (5, 120))
+        self._interval: float = self._min_interval
+        self._budget: float = kwargs.pop("budget", 0.5)
+        self._reconnect_interval: float = kwargs.pop("reconnect_interval", 60)
+        self._reconnect = False
+        self._active = False
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the poller is running."""
+        return self._active and self._task is not None and not self._task.done()
+
+    def watch(self, username: str) -> None:
+        r"""Watches the renders of a username.
+
+        :param username: Username of the user who ordered the renders
+        :type username: ``str``
+        :return: None
+        """
+        self._usernames.add(username)
+        self.wake()
+
+    def unwatch(self, username: str) -> None:
+        r"""Stops watching the renders of a username.
+
+        :param username: Username of the user who ordered the renders
+        :type username: ``str``
+        :return: None
+        """
+        self._usernames.discard(username)
+        self._seen.pop(username, None)
+
+    def start(self, reconnect: bool = False) -> None:
+        r"""Starts polling, if it is not running yet.
+
+        :param reconnect: Whether to also retry connecting the websocket, defaults to False
+        :type reconnect: ``bool``
+        :return: None
+        """
+        if self._client._closing:
+            return
+        self._reconnect = self._reconnect or reconnect
+        if self.running:
+            return
+        self._active = True
+        self._interval = self._min_interval
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        r"""Stops polling after the current poll.
+
+        :return: None
+        """
+        self._active = False
+        self._reconnect = False
+        self.wake()
+
+    def wake(self) -> None:
+        r"""Polls immediately, e.g. after a render was created.
+
+        :return: None
+        """
+        if self._wake is not None:
+            self._wake.set()
+
+    async def aclose(self) -> None:
+        r"""Stops polling and waits for the poller to exit.
+
+        :return: None
+        """
+        self.stop()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _diff_watched(
+        self,
+        username: str,
+        renders: list[Render],
+    ) -> list[tuple[str, dict]]:
+        seen = self._seen.get(username)
+        current: dict[int, str | None] = {}
+        changes = []
+        for render in renders:
+            terminal = diff_render(render, render.progress) is not None
+            if seen is not None and render.id not in self._client._tracked:
+                previous = seen.get(render.id, "")
+                if previous is None:
+                    terminal = True
+                else:
+                    if render.id not in seen:
+                        changes.append(("render_added_json", {"renderID": render.id}))
+                    change = diff_render(render, previous)
+                    if change is not None:
+                        changes.append(change)
+            current[render.id] = None if terminal else render.progress
+        self._seen[username] = current
+        return changes
+
+    async def poll(self) -> tuple[int, int]:
+        r"""Polls once.
+
+        :return: Number of requests made and number of events dispatched
+        :rtype: ``tuple[int, int]``
+        """
+        client = self._client
+        by_username: dict[str, list[int]] = {x: [] for x in self._usernames}
+        for render_id, (username, _) in client._tracked.items():
+            by_username.setdefault(username, []).append(render_id)
+
+        requests = events = 0
+        for username, render_ids in by_username.items():
+            requests += 1
+            try:
+                resp = await client.get_render_list(
+                    page_size=max(len(render_ids), 10),
+                    ordr_username=username,
+                )
+            except APIException:
+                continue
+
+            changes = []
+            if username in self._usernames:
+                changes = self._diff_watched(username, resp.renders)
+            renders = {x.id: x for x in resp.renders}
+            for render_id in render_ids:
+                render = renders.get(render_id)
+                if render is None:
+                    requests += 1
+                    try:
+                        lookup = await client.get_render_list(render_id=render_id)
+                    except APIException:
+                        continue
+                    render = next(iter(lookup.renders), None)
+                tracked = client._tracked.get(render_id)
+                if render is None or tracked is None:
+                    continue
+                change = diff_render(render, tracked[1])
+                if change is not None:
+                    changes.append(change)
+
+            for change in changes:
+                await client._on_event(*change)
+            events += len(changes)
+        return requests, events
+
+    def _next_interval(self, requests: int, events: int) -> float:
+        if events:
+            self._interval = self._min_interval
+        else:
+            self._interval = min(self._interval * 2, self._max_interval)
+        limiter = self._client._limiter
+        floor = requests * limiter.time_period / limiter.max_rate / self._budget
+        return max(self._interval, floor)
+
+    async def _run(self) -> None:
+        assert self._wake is not None
+        last_connect = time.monotonic()
+        while self._active:
+            self._wake.clear()
+            try:
+                if self._reconnect and not self._client.socket.connected:
+                    if time.monotonic() - last_connect >= self._reconnect_interval:
+                        last_connect = time.monotonic()
+                        await self._client.connect()
+                        if not self._active:
+                            break
+
+                if self._usernames or self._client._tracked:
+                    delay = self._next_interval(*await self.poll())
+                else:
+                    delay = self._reconnect_interval
+            except Exception:
+                logger.exception("Could not poll the render list")
+                # Backs off as if the poll found no changes.
+                delay = self._next_interval(1, 0)
+            if not self._active:
+                break
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
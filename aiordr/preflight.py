@@ -0,0 +1,231 @@
+"""This module contains local pre-flight validation for render submissions."""
+
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING
+
+from .exceptions import PreflightException
+from .helpers import read_replay
+from .models import ErrorCode
+from .models import RenderOptions
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .catalog import SkinCatalog
+
+
+__all__ = ("RenderPreflight",)
+
+MODE_STANDARD = 0
+MOD_AUTOPLAY = 1 << 11
+MOD_CINEMA = 1 << 22
+
+_OPTION_BOUNDS: dict[str, tuple[float, float]] = {
+    "global_volume": (0, 100),
+    "music_volume": (0, 100),
+    "hitsound_volume": (0, 100),
+    "intro_bg_dim": (0, 100),
+    "ingame_bg_dim": (0, 100),
+    "break_bg_dim": (0, 100),
+    "cursor_size": (0.5, 2.0),
+}
+_HITS = struct.Struct("<6HiHBi")
+_TIMESTAMP = struct.Struct("<qi")
+
+
+def _read_uleb128(data: bytes, offset: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+def _read_string(data: bytes, offset: int) -> tuple[str, int]:
+    marker = data[offset]
+    offset += 1
+    if marker == 0x00:
+        return "", offset
+    if marker != 0x0B:
+        raise ValueError("Invalid string marker")
+    length, offset = _read_uleb128(data, offset)
+    end = offset + length
+    if end > len(data):
+        raise ValueError("String out of bounds")
+    return data[offset:end].decode("utf-8"), end
+
+
+class RenderPreflight:
+    __slots__ = ("_skin_catalog", "_max_replay_size", "_max_username_length")
+
+    def __init__(self, **kwargs: Any) -> None:
+        r"""Local checks run before a render submission uses a rate limit slot.
+
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *skin_catalog* (``aiordr.catalog.SkinCatalog``) --
+                Optional, catalog used to resolve skins, defaults to None (skins are not checked)
+            * *max_replay_size* (``int``) --
+                Optional, maximum replay size in bytes, defaults to 10 MiB
+            * *max_username_length* (``int``) --
+                Optional, maximum username length, defaults to 32
+        """
+        self._skin_catalog: SkinCatalog | None = kwargs.pop("skin_catalog", None)
+        self._max_replay_size: int = kwargs.pop("max_replay_size", 10 * 1024 * 1024)
+        self._max_username_length: int = kwargs.pop("max_username_length", 32)
+
+    def check_options(self, options: RenderOptions) -> None:
+        r"""Checks that render options are within the bounds accepted by the API.
+
+        :param options: Render options
+        :type options: ``aiordr.models.render.RenderOptions``
+        :raises: ``aiordr.exceptions.PreflightException``: If an option is out of range
+        :return: None
+        """
+        for name, (low, high) in _OPTION_BOUNDS.items():
+            value = getattr(options, name)
+            if not low <= value <= high:
+                alias = RenderOptions.model_fields[name].alias
+                raise PreflightException(
+                    f"{alias} must be between {low} and {high}",
+                    ErrorCode.NO_ERROR,
+                )
+
+    def check_skin(self, skin: str | int, custom_skin: bool = False) -> None:
+        r"""Checks that the skin exists.
+
+        Custom skins are only checked to be an ID. Other skins are resolved
+        against the skin catalog, if one was provided and it is not empty.
+
+        :param skin: Skin ID or name
+        :type skin: ``Union[str, int]``
+        :param custom_skin: Whether the skin is a custom skin ID, defaults to False
+        :type custom_skin: ``bool``
+        :raises: ``aiordr.exceptions.PreflightException``: If the skin is invalid
+        :return: None
+        """
+        if custom_skin:
+            if not str(skin).isdigit():
+                raise PreflightException(
+                    "Custom skin must be a skin ID",
+                    ErrorCode.INVALID_CUSTOM_SKIN,
+                )
+            return
+        if not self._skin_catalog:
+            return
+        if isinstance(skin, str) and skin.isdigit():
+            skin = int(skin)
+        if self._skin_catalog.resolve(skin) is None:
+            raise PreflightException(f"Unknown skin {skin}", ErrorCode.INVALID_SKIN)
+
+    def check_replay(self, data: bytes) -> None:
+        r"""Checks the size and header of an ``.osr`` replay.
+
+        :param data: Replay data
+        :type data: ``bytes``
+        :raises: ``aiordr.exceptions.PreflightException``: If the replay would be rejected
+        :return: None
+        """
+        if not data:
+            raise PreflightException("Replay file is empty", ErrorCode.BAD_REPLAY_FILE)
+        if len(data) > self._max_replay_size:
+            raise PreflightException(
+                "Replay file is too large",
+                ErrorCode.BAD_REPLAY_FILE,
+            )
+        if data[0] != MODE_STANDARD:
+            raise PreflightException(
+                "Only osu!standard replays are supported",
+                ErrorCode.INVALID_GAMEMODE,
+            )
+
+        try:
+            offset = 5
+            beatmap_md5, offset = _read_string(data, offset)
+            player, offset = _read_string(data, offset)
+            _, offset = _read_string(data, offset)
+            mods = _HITS.unpack_from(data, offset)[-1]
+            offset += _HITS.size
+            _, offset = _read_string(data, offset)
+            _, length = _TIMESTAMP.unpack_from(data, offset)
+            offset += _TIMESTAMP.size
+        except (IndexError, ValueError, struct.error):
+            raise PreflightException(
+                "Replay header could not be parsed",
+                ErrorCode.BAD_REPLAY_FILE,
+            ) from None
+
+        if len(beatmap_md5) != 32:
+            raise PreflightException(
+                "Replay has no beatmap hash",
+                ErrorCode.BAD_REPLAY_FILE,
+            )
+        if not player:
+            raise PreflightException(
+                "Replay has no player name",
+                ErrorCode.REPLAY_INVALID_USERNAME,
+            )
+        if mods & (MOD_AUTOPLAY | MOD_CINEMA):
+            raise PreflightException(
+                "Autoplay replays are not supported",
+                ErrorCode.REPLAY_AUTO_MODE,
+            )
+        if length <= 0:
+            raise PreflightException(
+                "Replay has no input data",
+                ErrorCode.NO_REPLAY_INPUT_DATA,
+            )
+        if offset + length > len(data):
+            raise PreflightException(
+                "Replay input data is truncated",
+                ErrorCode.REPLAY_FILE_CORRUPTED,
+            )
+
+    def check(self, username: str, skin: str | int, **kwargs: Any) -> None:
+        r"""Runs every check on a render submission.
+
+        Takes the same arguments as ``aiordr.ordrClient.create_render``.
+
+        :param username: Username of the user who ordered the render
+        :type username: ``str``
+        :param skin: Skin ID or name
+        :type skin: ``Union[str, int]``
+        :raises: ``aiordr.exceptions.PreflightException``: If the submission would be rejected
+        :return: None
+        """
+        if not username:
+            raise PreflightException("username is missing", ErrorCode.FIELD_MISSING)
+        if len(username) > self._max_username_length:
+            raise PreflightException(
+                f"username must be at most {self._max_username_length} characters",
+                ErrorCode.NO_ERROR,
+            )
+        if skin is None or skin == "":
+            raise PreflightException("skin is missing", ErrorCode.FIELD_MISSING)
+
+        options = kwargs.get("render_options")
+        if options is not None:
+            self.check_options(options)
+        self.check_skin(skin, kwargs.get("custom_skin", False))
+
+        if "replay_file" in kwargs:
+            self.check_replay(read_replay(kwargs["replay_file"]))
+        elif "replay_url" in kwargs:
+            url = kwargs["replay_url"]
+            if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+                raise PreflightException(
+                    "Replay URL must be an HTTP(S) URL",
+                    ErrorCode.INVALID_REPLAY_URL,
+                )
+        else:
+            raise PreflightException(
+                "replayFile or replayURL is missing",
+                ErrorCode.FIELD_MISSING,
+            )
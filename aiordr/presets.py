@@ -0,0 +1,131 @@
+"""This module contains named render option presets and their form encoding."""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+from .models import FrozenRenderOptions
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .models import RenderOptions
+
+
+__all__ = (
+    "RenderPresets",
+    "encode_options",
+)
+
+FormFields = tuple[tuple[str, str], ...]
+
+
+def _encode(options: RenderOptions) -> FormFields:
+    data = options.model_dump(exclude_defaults=True, by_alias=True)
+    data["resolution"] = options.resolution.value
+    return tuple(
+        (key, ("true" if value else "false") if type(value) is bool else str(value))
+        for key, value in data.items()
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_frozen(options: FrozenRenderOptions) -> FormFields:
+    return _encode(options)
+
+
+def encode_options(options: RenderOptions) -> FormFields:
+    r"""Encodes render options as the form fields of a render submission.
+
+    Only options differing from their defaults are sent, along with the
+    resolution. The fields of frozen options are cached.
+
+    :param options: Render options
+    :type options: ``aiordr.models.render.RenderOptions``
+    :return: Field names and values
+    :rtype: ``tuple[tuple[str, str], ...]``
+    """
+    if isinstance(options, FrozenRenderOptions):
+        return _encode_frozen(options)
+    return _encode(options)
+
+
+class RenderPresets:
+    __slots__ = ("_presets",)
+
+    def __init__(self, presets: dict[str, RenderOptions] | None = None) -> None:
+        r"""Registry of named render options, encoded once when registered.
+
+        :param presets: Presets to register, defaults to None
+        :type presets: ``Optional[dict[str, aiordr.models.render.RenderOptions]]``
+        """
+        self._presets: dict[str, tuple[FrozenRenderOptions, FormFields]] = {}
+        for name, options in (presets or {}).items():
+            self.register(name, options)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._presets
+
+    def __len__(self) -> int:
+        return len(self._presets)
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the registered presets."""
+        return list(self._presets)
+
+    def register(
+        self,
+        name: str,
+        options: RenderOptions | None = None,
+        **kwargs: Any,
+    ) -> FrozenRenderOptions:
+        r"""Registers a preset, replacing any preset with the same name.
+
+        :param name: Name of the preset
+        :type name: ``str``
+        :param options: Options to start from, defaults to the default options
+        :type options: ``Optional[aiordr.models.render.RenderOptions]``
+        :param \**kwargs:
+            Options overriding ``options``, by field name
+        :return: Frozen options of the preset
+        :rtype: ``aiordr.models.render.FrozenRenderOptions``
+        """
+        data = options.model_dump() if options is not None else {}
+        data.update(kwargs)
+        frozen = FrozenRenderOptions.model_validate(data)
+        self._presets[name] = (frozen, encode_options(frozen))
+        return frozen
+
+    def unregister(self, name: str) -> None:
+        r"""Removes a preset.
+
+        :param name: Name of the preset
+        :type name: ``str``
+        :raises: ``KeyError``: If the preset is not registered
+        :return: None
+        """
+        del self._presets[name]
+
+    def get(self, name: str) -> FrozenRenderOptions:
+        r"""Returns the options of a preset.
+
+        :param name: Name of the preset
+        :type name: ``str``
+        :raises: ``KeyError``: If the preset is not registered
+        :return: Frozen options of the preset
+        :rtype: ``aiordr.models.render.FrozenRenderOptions``
+        """
+        return self._presets[name][0]
+
+    def fields(self, name: str) -> FormFields:
+        r"""Returns the encoded form fields of a preset.
+
+        :param name: Name of the preset
+        :type name: ``str``
+        :raises: ``KeyError``: If the preset is not registered
+        :return: Field names and values
+        :rtype: ``tuple[tuple[str, str], ...]``
+        """
+        return self._presets[name][1]
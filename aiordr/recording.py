@@ -0,0 +1,212 @@
+"""This module contains tools to record and replay websocket events."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import Any
+
+    from .client import ordrClient
+
+
+__all__ = (
+    "EventPlayer",
+    "EventRecorder",
+)
+
+
+class EventRecorder:
+    __slots__ = (
+        "_path",
+        "_batch_size",
+        "_flush_interval",
+        "_buffer",
+        "_file",
+        "_executor",
+        "_pending",
+        "_flush_task",
+        "_client",
+    )
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        r"""Records raw websocket events to a gzip compressed JSONL file.
+
+        Recording only appends to an in-memory buffer. Serialization,
+        compression and writes happen in batches on a background thread.
+
+        :param path: Path of the recording
+        :type path: ``str``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *batch_size* (``int``) --
+                Optional, number of events written per batch, defaults to 256
+            * *flush_interval* (``float``) --
+                Optional, seconds between flushes of partial batches, defaults to 1.0
+        """
+        self._path = path
+        self._batch_size: int = kwargs.pop("batch_size", 256)
+        self._flush_interval: float = kwargs.pop("flush_interval", 1.0)
+        self._buffer: list[tuple[float, str, dict]] = []
+        self._file: gzip.GzipFile | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: set[asyncio.Future[None]] = set()
+        self._flush_task: asyncio.Task[None] | None = None
+        self._client: ordrClient | None = None
+
+    async def __aenter__(self) -> EventRecorder:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    def attach(self, client: ordrClient) -> None:
+        r"""Starts recording the events of a client.
+
+        :param client: Client to record
+        :type client: ``aiordr.ordrClient``
+        :return: None
+        """
+        if self._file is None:
+            self._file = gzip.open(self._path, "ab")
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self._client = client
+        client.add_listener(self.record)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def record(self, event: str, data: dict) -> None:
+        r"""Records an event.
+
+        :param event: Event name
+        :type event: ``str``
+        :param data: Raw event payload
+        :type data: ``dict``
+        :return: None
+        """
+        self._buffer.append((time.time(), event, data))
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        r"""Schedules a write of the buffered events.
+
+        :return: None
+        """
+        if not self._buffer or self._executor is None:
+            return
+        batch, self._buffer = self._buffer, []
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._write,
+            batch,
+        )
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _write(self, batch: list[tuple[float, str, dict]]) -> None:
+        if self._file is None:
+            return
+        self._file.write(
+            b"".join(
+                orjson.dumps(
+                    {"t": t, "event": event, "data": data},
+                    option=orjson.OPT_APPEND_NEWLINE,
+                )
+                for t, event, data in batch
+            ),
+        )
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            self.flush()
+
+    async def aclose(self) -> None:
+        r"""Stops recording and writes the remaining events.
+
+        :return: None
+        """
+        if self._client is not None:
+            self._client.remove_listener(self.record)
+            self._client = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self.flush()
+        if self._pending:
+            await asyncio.gather(*self._pending)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class EventPlayer:
+    __slots__ = ("_path", "_speed")
+
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        r"""Replays a recording made with ``EventRecorder``.
+
+        :param path: Path of the recording
+        :type path: ``str``
+        :param speed: Playback speed multiplier, 0 plays as fast as possible, defaults to 1.0
+        :type speed: ``float``
+        """
+        self._path = path
+        self._speed = speed
+
+    def events(self) -> list[tuple[float, str, dict]]:
+        r"""Reads the recorded events.
+
+        :return: Recorded events as (timestamp, event name, raw payload)
+        :rtype: ``list[tuple[float, str, dict]]``
+        """
+        events = []
+        with gzip.open(self._path, "rb") as f:
+            for line in f:
+                record = orjson.loads(line)
+                events.append((record["t"], record["event"], record["data"]))
+        return events
+
+    async def play(self, client: ordrClient) -> int:
+        r"""Feeds the recorded events to the handlers of a client.
+
+        No connection is made, events go directly to the ``on_render_*``
+        handlers and listeners of the client.
+
+        :param client: Client to feed the events to
+        :type client: ``aiordr.ordrClient``
+        :return: Number of events played
+        :rtype: ``int``
+        """
+        loop = asyncio.get_running_loop()
+        events = await loop.run_in_executor(None, self.events)
+        if not events:
+            return 0
+
+        first = events[0][0]
+        start = loop.time()
+        for t, event, data in events:
+            if self._speed > 0:
+                delay = start + (t - first) / self._speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            await client._on_event(event, data)
+        return len(events)
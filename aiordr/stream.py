@@ -0,0 +1,191 @@
+"""This module contains filtered async iterators over websocket events."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING
+from typing import Literal
+
+from .models import RenderAddEvent
+from .models import RenderFailEvent
+from .models import RenderFinishEvent
+from .models import RenderProgressEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+    from typing import Any
+
+    from .client import ordrClient
+    from .models import RenderBaseEvent
+
+
+__all__ = (
+    "DropPolicy",
+    "EventStream",
+)
+
+DropPolicy = Literal["drop_oldest", "drop_newest"]
+
+EVENT_MODELS: dict[str, type[RenderBaseEvent]] = {
+    "render_added_json": RenderAddEvent,
+    "render_progress_json": RenderProgressEvent,
+    "render_fail_json": RenderFailEvent,
+    "render_done_json": RenderFinishEvent,
+}
+_EVENT_NAMES: dict[type[RenderBaseEvent], str] = {
+    model: name for name, model in EVENT_MODELS.items()
+}
+
+
+class EventStream:
+    __slots__ = (
+        "_client",
+        "_types",
+        "_render_ids",
+        "_usernames",
+        "_username_ids",
+        "_buffer",
+        "_maxsize",
+        "_drop_policy",
+        "_waiter",
+        "_closed",
+        "dropped",
+    )
+
+    def __init__(
+        self,
+        client: ordrClient,
+        types: Iterable[str | type[RenderBaseEvent]] | None = None,
+        render_ids: Iterable[int] | None = None,
+        usernames: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        r"""Async iterator over the events of a client.
+
+        Filters are applied to the raw payloads, so events that do not match
+        are never validated. Filters are combined with a logical AND.
+
+        :param client: Client to receive events from
+        :type client: ``aiordr.ordrClient``
+        :param types: Event names or event models to receive, defaults to all
+        :type types: ``Optional[Iterable[Union[str, type[aiordr.models.events.RenderBaseEvent]]]]``
+        :param render_ids: Render IDs to receive events for, defaults to all
+        :type render_ids: ``Optional[Iterable[int]]``
+        :param usernames: Usernames of the users who ordered the renders, defaults to all
+        :type usernames: ``Optional[Iterable[str]]``
+        :param \**kwargs:
+            See below
+
+        :Keyword Arguments:
+            * *maxsize* (``int``) --
+                Optional, number of events buffered, defaults to 100
+            * *drop_policy* (``aiordr.stream.DropPolicy``) --
+                Optional, which event is dropped when the buffer is full, defaults to "drop_oldest"
+        """
+        self._client = client
+        self._types: set[str] | None = (
+            None
+            if types is None
+            else {x if isinstance(x, str) else _EVENT_NAMES[x] for x in types}
+        )
+        self._render_ids: set[int] | None = (
+            None if render_ids is None else set(render_ids)
+        )
+        self._usernames: set[str] | None = (
+            None if usernames is None else {x.casefold() for x in usernames}
+        )
+        self._username_ids: set[int] = set()
+        self._maxsize: int = kwargs.pop("maxsize", 100)
+        self._drop_policy: DropPolicy = kwargs.pop("drop_policy", "drop_oldest")
+        self._buffer: deque[tuple[str, dict]] = deque()
+        self._waiter: asyncio.Future[None] | None = None
+        self._closed = False
+        self.dropped: int = 0
+        """Number of events dropped because the buffer was full."""
+
+        client.add_listener(self._push)
+
+    def __aiter__(self) -> EventStream:
+        return self
+
+    async def __anext__(self) -> RenderBaseEvent:
+        while not self._buffer:
+            if self._closed:
+                raise StopAsyncIteration
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        event, data = self._buffer.popleft()
+        return EVENT_MODELS[event].model_validate(data)
+
+    async def __aenter__(self) -> EventStream:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _matches_username(
+        self,
+        usernames: set[str],
+        event: str,
+        render_id: int,
+        username: str | None,
+    ) -> bool:
+        if username is None:
+            tracked = self._client._tracked.get(render_id)
+            username = tracked[0] if tracked is not None else None
+        if username is not None and username.casefold() in usernames:
+            matched = True
+        else:
+            matched = render_id in self._username_ids
+        if event in ("render_done_json", "render_fail_json"):
+            self._username_ids.discard(render_id)
+        elif matched:
+            self._username_ids.add(render_id)
+        return matched
+
+    def _matches(self, event: str, data: dict) -> bool:
+        render_id = data.get("renderID", 0)
+        if self._render_ids is not None and render_id not in self._render_ids:
+            return False
+        if self._usernames is not None and not self._matches_username(
+            self._usernames,
+            event,
+            render_id,
+            data.get("username"),
+        ):
+            return False
+        return self._types is None or event in self._types
+
+    def _push(self, event: str, data: dict) -> None:
+        if self._closed or event not in EVENT_MODELS or not self._matches(event, data):
+            return
+        if len(self._buffer) >= self._maxsize:
+            self.dropped += 1
+            if self._drop_policy == "drop_newest":
+                return
+            self._buffer.popleft()
+        self._buffer.append((event, data))
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    def close(self) -> None:
+        r"""Stops receiving events. Buffered events can still be consumed.
+
+        :return: None
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._client.remove_listener(self._push)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
@@ -0,0 +1,270 @@
+"""This module contains a blocking client for synchronous code."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+from typing import TYPE_CHECKING
+
+from .client import ordrClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Coroutine
+    from types import TracebackType
+    from typing import Any
+    from typing import TypeVar
+
+    from .models import RenderCreateResponse
+    from .models import RenderServer
+    from .models import RendersResponse
+    from .models import SkinCompact
+    from .models import SkinsResponse
+
+    T = TypeVar("T")
+
+
+__all__ = ("ordrSyncClient",)
+
+logger = logging.getLogger(__name__)
+
+
+def _log_callback_error(future: Future[Any]) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Error in an event callback", exc_info=future.exception())
+
+
+class ordrSyncClient:
+    __slots__ = ("_loop", "_thread", "_client", "_executor", "_timeout")
+
+    def __init__(self, **kwargs: Any) -> None:
+        r"""Blocking o!rdr API client.
+
+        Runs a single ``aiordr.ordrClient`` on a dedicated event loop thread,
+        so its session, websocket connection and rate limiter are shared by
+        every calling thread. Event callbacks run on a thread pool.
+
+        :param \**kwargs:
+            See below, other keyword arguments are passed to ``aiordr.ordrClient``
+
+        :Keyword Arguments:
+            * *max_workers* (``int``) --
+                Optional, number of threads running event callbacks, defaults to the ``ThreadPoolExecutor`` default
+            * *timeout* (``float``) --
+                Optional, seconds to wait for a call to complete before cancelling it, defaults to None (no timeout)
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=kwargs.pop("max_workers", None),
+            thread_name_prefix="aiordr-callback",
+        )
+        self._timeout: float | None = kwargs.pop("timeout", None)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="aiordr-loop",
+            daemon=True,
+        )
+        self._thread.start()
+        self._client: ordrClient = self._call(self._create_client(kwargs))
+
+    @staticmethod
+    async def _create_client(kwargs: dict[str, Any]) -> ordrClient:
+        return ordrClient(**kwargs)
+
+    def __enter__(self) -> ordrSyncClient:
+        self.connect()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def client(self) -> ordrClient:
+        """The asynchronous client running on the loop thread."""
+        return self._client
+
+    def _call(self, coro: Coroutine[Any, Any, T]) -> T:
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("Blocking calls cannot be made from the loop thread")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(self._timeout)
+        except TimeoutError:
+            # Otherwise the call keeps running, e.g. still submitting a render.
+            future.cancel()
+            raise
+
+    def _register(self, register: Callable, func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def callback(event: Any) -> None:
+            self._executor.submit(func, event).add_done_callback(_log_callback_error)
+
+        self._loop.call_soon_threadsafe(register, callback)
+        return func
+
+    def on_render_added(self, func: Callable) -> Callable:
+        r"""Registers a callable that is called on a worker thread when a render is added.
+
+        :param func: Callable taking an ``aiordr.models.events.RenderAddEvent``
+        :type func: ``Callable``
+        :return: The callable
+        :rtype: ``Callable``
+        """
+        return self._register(self._client.on_render_added, func)
+
+    def on_render_progress(self, func: Callable) -> Callable:
+        r"""Registers a callable that is called on a worker thread when a render is updated.
+
+        :param func: Callable taking an ``aiordr.models.events.RenderProgressEvent``
+        :type func: ``Callable``
+        :return: The callable
+        :rtype: ``Callable``
+        """
+        return self._register(self._client.on_render_progress, func)
+
+    def on_render_fail(self, func: Callable) -> Callable:
+        r"""Registers a callable that is called on a worker thread when a render fails.
+
+        :param func: Callable taking an ``aiordr.models.events.RenderFailEvent``
+        :type func: ``Callable``
+        :return: The callable
+        :rtype: ``Callable``
+        """
+        return self._register(self._client.on_render_fail, func)
+
+    def on_render_finish(self, func: Callable) -> Callable:
+        r"""Registers a callable that is called on a worker thread when a render finishes.
+
+        :param func: Callable taking an ``aiordr.models.events.RenderFinishEvent``
+        :type func: ``Callable``
+        :return: The callable
+        :rtype: ``Callable``
+        """
+        return self._register(self._client.on_render_finish, func)
+
+    def get_custom_skin(self, skin_id: int) -> SkinCompact:
+        r"""Get custom skin information. See ``aiordr.ordrClient.get_custom_skin``.
+
+        :param skin_id: Skin ID
+        :type skin_id: ``int``
+        :return: Skin information
+        :rtype: ``aiordr.models.skin.SkinCompact``
+        """
+        return self._call(self._client.get_custom_skin(skin_id))
+
+    def get_skins(
+        self,
+        page: int = 1,
+        page_size: int = 5,
+        **kwargs: Any,
+    ) -> SkinsResponse:
+        r"""Get custom skins. See ``aiordr.ordrClient.get_skins``.
+
+        :param page: Page number
+        :type page: ``int``
+        :param page_size: Page size
+        :type page_size: ``int``
+        :return: Skins
+        :rtype: ``aiordr.models.skins.SkinsResponse``
+        """
+        return self._call(self._client.get_skins(page, page_size, **kwargs))
+
+    def get_render_list(
+        self,
+        page: int = 1,
+        page_size: int = 5,
+        **kwargs: Any,
+    ) -> RendersResponse:
+        r"""Get render list. See ``aiordr.ordrClient.get_render_list``.
+
+        :param page: Page number
+        :type page: ``int``
+        :param page_size: Page size
+        :type page_size: ``int``
+        :return: Renders
+        :rtype: ``aiordr.models.renders.RendersResponse``
+        """
+        return self._call(self._client.get_render_list(page, page_size, **kwargs))
+
+    def get_server_list(self) -> list[RenderServer]:
+        r"""Get the list of available servers. See ``aiordr.ordrClient.get_server_list``.
+
+        :return: List of servers
+        :rtype: ``list[aiordr.models.server.RenderServer]``
+        """
+        return self._call(self._client.get_server_list())
+
+    def get_server_online_count(self) -> int:
+        r"""Get the number of online servers. See ``aiordr.ordrClient.get_server_online_count``.
+
+        :return: Number of online servers
+        :rtype: ``int``
+        """
+        return self._call(self._client.get_server_online_count())
+
+    def create_render(
+        self,
+        username: str,
+        skin: str | int,
+        **kwargs: Any,
+    ) -> RenderCreateResponse:
+        r"""Create a render. See ``aiordr.ordrClient.create_render``.
+
+        :param username: Username of the user who ordered the render
+        :type username: ``str``
+        :param skin: Skin ID or name
+        :type skin: ``Union[str, int]``
+        :return: Render create response
+        :rtype: ``aiordr.models.render.RenderCreateResponse``
+        """
+        return self._call(self._client.create_render(username, skin, **kwargs))
+
+    def connect(self) -> None:
+        r"""Connects to the websocket server.
+
+        :return: None
+        """
+        self._call(self._client.connect())
+
+    def warmup(self, connections: int = 4, **kwargs: Any) -> None:
+        r"""Prepares the client for traffic. See ``aiordr.ordrClient.warmup``.
+
+        :param connections: Number of connections to open, defaults to 4
+        :type connections: ``int``
+        :return: None
+        """
+        self._call(self._client.warmup(connections, **kwargs))
+
+    def wait_until_ready(self, timeout: float | None = None) -> None:
+        r"""Waits until a render server is available. See ``aiordr.ordrClient.wait_until_ready``.
+
+        :param timeout: Maximum time to wait in seconds, defaults to None
+        :type timeout: ``Optional[float]``
+        :raises: ``asyncio.TimeoutError``: If no server is available in time
+        :return: None
+        """
+        self._call(self._client.wait_until_ready(timeout))
+
+    def close(self) -> None:
+        r"""Closes the client, its loop thread and callback threads.
+
+        :return: None
+        """
+        if not self._loop.is_closed():
+            try:
+                self._call(self._client.aclose())
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+        self._executor.shutdown()
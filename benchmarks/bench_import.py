@@ -0,0 +1,49 @@
+"""Measures the cold import time of aiordr.
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "import aiordr": "import aiordr",
+    "ordrClient()": "import aiordr; aiordr.ordrClient()",
+    "ordrClient() + socket": "import aiordr; aiordr.ordrClient().socket",
+    "validate Render": (
+        "import aiordr, orjson;"
+        "aiordr.models.RendersResponse.model_validate_json("
+        "open('tests/data/render_list.json', 'rb').read())"
+    ),
+}
+
+
+def measure(code: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        script = f"import time; t = time.perf_counter(); {code}; print(time.perf_counter() - t)"
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+    return timings
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in CASES.items():
+        timings = measure(code, runs)
+        print(
+            f"{name:<24} median {statistics.median(timings):8.2f} ms"
+            f"  min {min(timings):8.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
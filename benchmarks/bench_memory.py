@@ -0,0 +1,84 @@
+"""Compares the memory used by Render models and CompactRender records.
+
+Usage: python benchmarks/bench_memory.py [count]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from aiordr.models import CompactRender
+from aiordr.models import Render
+from aiordr.models import StringPool
+
+RENDERERS = [f"renderer {i}" for i in range(50)]
+SKINS = [f"skin_{i}" for i in range(200)]
+MODS = ["", "HD", "HDDT", "HR", "HDHR", "DT", "NF"]
+
+
+def make_payloads(count: int) -> list[dict[str, Any]]:
+    with open("tests/data/render_list.json", "rb") as f:
+        template = orjson.loads(f.read())["renders"][0]
+    payloads = []
+    for i in range(count):
+        payload = dict(template)
+        # Round-trip through JSON so every string is a distinct object, as in API responses.
+        payload.update(
+            orjson.loads(
+                orjson.dumps(
+                    {
+                        "renderID": i,
+                        "renderer": RENDERERS[i % len(RENDERERS)],
+                        "skin": SKINS[i % len(SKINS)],
+                        "replayMods": MODS[i % len(MODS)],
+                        "username": f"user{i % 1000}",
+                        "progress": "Done.",
+                        "videoUrl": f"https://link.issou.best/{i:06x}",
+                        "replayFilePath": f"https://dl.issou.best/ordr/replays/{i}.osr",
+                        "title": f"player{i} | artist - title [diff]",
+                        "description": f"Player: player{i}, Map: artist - title [diff]",
+                    },
+                ),
+            ),
+        )
+        payloads.append(payload)
+    return payloads
+
+
+def measure(build: Callable[[], list[Any]]) -> tuple[int, list[Any]]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, objects
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    Render.model_validate(make_payloads(1)[0])
+
+    models_size, _ = measure(
+        lambda: [Render.model_validate(x) for x in make_payloads(count)],
+    )
+    pool = StringPool()
+    compact_size, _ = measure(
+        lambda: [CompactRender(x, pool) for x in make_payloads(count)],
+    )
+
+    print(f"{count} renders")
+    print(f"Render         {models_size / count:10.0f} bytes/render")
+    print(f"CompactRender  {compact_size / count:10.0f} bytes/render")
+    print(f"ratio          {models_size / compact_size:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
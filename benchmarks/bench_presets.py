@@ -0,0 +1,87 @@
+"""Compares the cost of encoding render options for each submission.
+
+Usage: python benchmarks/bench_presets.py [submissions]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+
+import aiohttp
+
+from aiordr.models import RenderOptions
+from aiordr.models import RenderResolution
+from aiordr.presets import RenderPresets
+
+OPTIONS = RenderOptions(
+    resolution=RenderResolution.HD_1080,
+    music_volume=30,
+    show_pp_counter=False,
+    cursor_size=1.2,
+    skip_intro=False,
+)
+
+
+def job(i: int) -> dict[str, str]:
+    return {"username": f"user{i}", "skin": "default", "replayURL": f"url/{i}"}
+
+
+def per_submission(i: int) -> aiohttp.FormData:
+    # Encoding done by create_render before presets.
+    data: dict = job(i)
+    data.update(OPTIONS.model_dump(exclude_defaults=True, by_alias=True))
+    data["resolution"] = OPTIONS.resolution.value
+    form_data = aiohttp.FormData()
+    for key, value in data.items():
+        if isinstance(value, bool):
+            value = str(value).lower()
+        form_data.add_field(key, value)
+    return form_data
+
+
+presets = RenderPresets({"hd": OPTIONS})
+
+
+def preset(i: int) -> aiohttp.FormData:
+    form_data = aiohttp.FormData(presets.fields("hd"))
+    for key, value in job(i).items():
+        form_data.add_field(key, value)
+    return form_data
+
+
+def options_only(i: int) -> dict:
+    data = OPTIONS.model_dump(exclude_defaults=True, by_alias=True)
+    data["resolution"] = OPTIONS.resolution.value
+    return {k: str(v).lower() if isinstance(v, bool) else v for k, v in data.items()}
+
+
+def preset_only(i: int) -> tuple:
+    return presets.fields("hd")
+
+
+def measure(func: Callable[[int], object], count: int, repeat: int = 5) -> float:
+    # Best of several runs, to leave out interference from other processes.
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(count):
+            func(i)
+        timings.append((time.perf_counter() - start) / count * 1e6)
+    return min(timings)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    for name, func in (
+        ("form: model_dump", per_submission),
+        ("form: preset", preset),
+        ("options only: model_dump", options_only),
+        ("options only: preset", preset_only),
+    ):
+        print(f"{name:<28} {measure(func, count):8.2f} us/submission")
+
+
+if __name__ == "__main__":
+    main()
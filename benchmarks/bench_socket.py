@@ -0,0 +1,76 @@
+"""Compares the per-message cost of the socket engines against a local stand-in server.
+
+Usage: python benchmarks/bench_socket.py [count]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from aiohttp.test_utils import TestServer
+from socketio import AsyncClient
+
+from aiordr.engine import NativeSocket
+from tests.classes import EngineIOServer
+
+PROGRESS = {
+    "renderID": 1234,
+    "username": "username",
+    "progress": "Rendering... 45%",
+    "renderer": "sunset",
+    "description": "Player: player, Map: artist - title [diff] by mapper",
+}
+
+
+async def run(socket: Any, url: str, count: int, **kwargs: Any) -> tuple[float, int]:
+    done = asyncio.Event()
+    received = 0
+
+    async def on_progress(data: dict) -> None:
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    socket.on("render_progress_json", on_progress)
+    tracemalloc.start()
+    start = time.process_time()
+    await socket.connect(url, socketio_path="/ordr/ws", **kwargs)
+    await done.wait()
+    elapsed = time.process_time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    await socket.disconnect()
+    return elapsed, peak
+
+
+async def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    server = EngineIOServer([("render_progress_json", PROGRESS)], repeat=count)
+    async with TestServer(server.app) as test_server:
+        url = str(test_server.make_url("")).rstrip("/")
+        results = {
+            "python-socketio": await run(
+                AsyncClient(),
+                url,
+                count,
+                transports=["websocket"],
+            ),
+            "native": await run(NativeSocket(), url, count),
+        }
+
+    # Includes the stand-in server, which runs in the same process.
+    print(f"{count} events")
+    for name, (elapsed, peak) in results.items():
+        print(
+            f"{name:16} {elapsed / count * 1e6:8.1f} us/event CPU"
+            f"  {peak / 1024:8.0f} KiB peak",
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
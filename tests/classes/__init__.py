@@ -1,4 +1,5 @@
 # isort: dont-add-imports
 
 
+from .eioserver import EngineIOServer
 from .mock import MockResponse
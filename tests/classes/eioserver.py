@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import orjson
+from aiohttp import web
+
+HANDSHAKE = "0" + orjson.dumps(
+    {
+        "sid": "engine",
+        "upgrades": [],
+        "pingInterval": 25000,
+        "pingTimeout": 20000,
+        "maxPayload": 1000000,
+    },
+).decode("utf-8")
+
+
+class EngineIOServer:
+    """Stand-in for /ordr/ws, speaking Engine.IO v4 over websockets only."""
+
+    def __init__(self, events: list[tuple[str, dict]], repeat: int = 1) -> None:
+        self.packets = [
+            "42" + orjson.dumps([name, data]).decode("utf-8") for name, data in events
+        ]
+        self.repeat = repeat
+        self.connections = 0
+        self.sockets: list[web.WebSocketResponse] = []
+        self.app = web.Application()
+        self.app.router.add_get("/ordr/ws/", self.handler)
+
+    async def handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        self.sockets.append(ws)
+        await ws.send_str(HANDSHAKE)
+        async for msg in ws:
+            if msg.data.startswith("40"):
+                await ws.send_str('40{"sid":"socket"}')
+                await ws.send_str("2")
+                for _ in range(self.repeat):
+                    for packet in self.packets:
+                        await ws.send_str(packet)
+            elif msg.data.startswith("41"):
+                break
+        self.sockets.remove(ws)
+        return ws
+
+    async def drop(self) -> None:
+        for ws in list(self.sockets):
+            await ws.send_str("41")
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+import aiordr
+
+
+@pytest.fixture
+def client() -> aiordr.ordrClient:
+    return aiordr.ordrClient(developer_mode="devmode_success")
+
+
+@pytest.fixture
+def skins() -> bytes:
+    with open("tests/data/multiple_skin.json", "rb") as f:
+        data = f.read()
+    return data
+
+
+@pytest.fixture
+def render_servers() -> bytes:
+    with open("tests/data/multiple_render_server.json", "rb") as f:
+        data = f.read()
+    return data
+
+
+@pytest.fixture
+def render_add() -> bytes:
+    with open("tests/data/render_add.json", "rb") as f:
+        data = f.read()
+    return data
+
+
+@pytest.fixture
+def render_list() -> bytes:
+    with open("tests/data/render_list.json", "rb") as f:
+        data = f.read()
+    return data
+
+
+@pytest.fixture
+def skin_custom() -> bytes:
+    with open("tests/data/single_skin_custom.json", "rb") as f:
+        data = f.read()
+    return data
+
+
+@pytest.fixture
+def server_onlinecount() -> bytes:
+    with open("tests/data/server_onlinecount.txt", "rb") as f:
+        data = f.read()
+    return data
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+import aiordr
+
+
+@pytest.fixture
+def skins_response(skins: bytes) -> aiordr.models.SkinsResponse:
+    data = orjson.loads(skins)
+    data["maxSkins"] = len(data["skins"])
+    return aiordr.models.SkinsResponse.model_validate(data)
+
+
+class TestSkinCatalog:
+    @pytest.mark.asyncio
+    async def test_sync_incremental(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        skins_response: aiordr.models.SkinsResponse,
+        tmp_path,
+    ) -> None:
+        get_skins = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_skins",
+            mocker.AsyncMock(return_value=skins_response),
+        )
+        catalog = aiordr.SkinCatalog(client, str(tmp_path / "skins.json.gz"))
+        assert await catalog.sync() == 100
+        assert len(catalog) == 100
+        assert get_skins.await_count == 1
+
+        assert await catalog.sync() == 0
+        assert get_skins.await_count == 2
+
+        loaded = aiordr.SkinCatalog(path=str(tmp_path / "skins.json.gz"))
+        assert len(loaded) == 100
+        assert loaded.name_of(1) == "-atmosphere-"
+
+    @pytest.mark.asyncio
+    async def test_sync_pages(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        skins_response: aiordr.models.SkinsResponse,
+    ) -> None:
+        skins = skins_response.skins
+        catalog = aiordr.SkinCatalog(client, page_size=10)
+        catalog.update(skins[10:], 100)
+        used = skins[10].model_copy(update={"times_used": 10**9})
+
+        async def get_skins(page: int, page_size: int) -> aiordr.models.SkinsResponse:
+            page_skins = skins[(page - 1) * page_size : page * page_size]
+            if page == 2:
+                page_skins = [used, *page_skins[1:]]
+            return aiordr.models.SkinsResponse(
+                message="",
+                skins=page_skins,
+                max_skins=100,
+            )
+
+        mock = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_skins",
+            mocker.AsyncMock(side_effect=get_skins),
+        )
+        assert await catalog.sync() == 10
+        assert mock.await_count == 2
+        assert catalog.get(used.id).times_used == 10**9
+
+        assert await catalog.sync(full=True) == 0
+        assert mock.await_count == 12
+
+    def test_search(self, skins_response: aiordr.models.SkinsResponse) -> None:
+        catalog = aiordr.SkinCatalog()
+        catalog.update(skins_response.skins, skins_response.max_skins)
+
+        results = catalog.search("aesthetic", limit=3)
+        assert [x.name for x in results] == [
+            "aesthetic_1_3_2",
+            "aesthetic_vazurlane1_0",
+            "aesthetic_1_3_1",
+        ]
+        assert catalog.search("chitandaa", limit=1)[0].name.startswith("chitanda")
+        assert catalog.resolve("- a t m o s p h e r e -").id == 1
+        assert "Azer2018" in catalog
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 import aiordr
 
 from .classes import MockResponse
 
 
-@pytest.fixture
-def client() -> aiordr.ordrClient:
-    return aiordr.ordrClient(developer_mode="devmode_success")
-
-
 @pytest.fixture
 def client_fail() -> aiordr.ordrClient:
     return aiordr.ordrClient(developer_mode="devmode_fail")
@@ -22,41 +21,6 @@ def client_wsfail() -> aiordr.ordrClient:
     return aiordr.ordrClient(developer_mode="devmode_wsfail")
 
 
-@pytest.fixture
-def skins() -> bytes:
-    with open("tests/data/multiple_skin.json", "rb") as f:
-        data = f.read()
-    return data
-
-
-@pytest.fixture
-def render_servers() -> bytes:
-    with open("tests/data/multiple_render_server.json", "rb") as f:
-        data = f.read()
-    return data
-
-
-@pytest.fixture
-def render_add() -> bytes:
-    with open("tests/data/render_add.json", "rb") as f:
-        data = f.read()
-    return data
-
-
-@pytest.fixture
-def skin_custom() -> bytes:
-    with open("tests/data/single_skin_custom.json", "rb") as f:
-        data = f.read()
-    return data
-
-
-@pytest.fixture
-def server_onlinecount() -> bytes:
-    with open("tests/data/server_onlinecount.txt", "rb") as f:
-        data = f.read()
-    return data
-
-
 class TestClient:
     @pytest.mark.asyncio
     async def test_get_skins(
@@ -111,3 +75,109 @@ class TestClient:
             mocker.patch("aiohttp.ClientSession.get", return_value=resp)
             data = await client.get_custom_skin(1)
             assert isinstance(data, aiordr.models.SkinCompact)
+
+
+class TestReconnect:
+    @pytest.mark.asyncio
+    async def test_reconcile(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        render_list: bytes,
+    ) -> None:
+        finished = []
+        progressed = []
+
+        @client.on_render_finish
+        async def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            finished.append(event)
+
+        @client.on_render_progress
+        async def on_render_progress(
+            event: aiordr.models.RenderProgressEvent,
+        ) -> None:
+            progressed.append(event)
+
+        get_render_list = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_render_list",
+            mocker.AsyncMock(
+                return_value=aiordr.models.RendersResponse.model_validate_json(
+                    render_list,
+                ),
+            ),
+        )
+        client._tracked[1234] = ("username", None)
+        client._tracked[1235] = ("username", None)
+
+        await client._on_disconnect()
+        await client._on_connect()
+        await client._reconcile_task
+
+        assert get_render_list.await_count == 1
+        assert [x.render_id for x in finished] == [1234]
+        assert [x.progress for x in progressed] == ["Rendering... 45%"]
+        assert list(client._tracked) == [1235]
+
+
+class TestInitialization:
+    @pytest.mark.asyncio
+    async def test_single_flight(self, mocker, client: aiordr.ordrClient) -> None:
+        async def connect(**kwargs) -> None:
+            await asyncio.sleep(0.01)
+            client.socket.connected = True
+
+        socket_connect = mocker.patch.object(
+            client.socket,
+            "connect",
+            mocker.AsyncMock(side_effect=connect),
+        )
+        sessions = await asyncio.gather(*(client._get_session() for _ in range(5)))
+        await asyncio.gather(*(client.connect() for _ in range(5)))
+
+        assert len({id(x) for x in sessions}) == 1
+        assert socket_connect.await_count == 1
+        client.socket.connected = False
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_warmup(self, client: aiordr.ordrClient) -> None:
+        requests = []
+
+        async def handler(request: web.Request) -> web.Response:
+            requests.append(request.method)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_route("*", "/", handler)
+        async with TestServer(app) as server:
+            client._base_url = str(server.make_url("/"))
+            async with client:
+                await client.warmup(connections=3)
+
+        assert requests == ["HEAD"] * 3
+
+    @pytest.mark.asyncio
+    async def test_handler_after_request(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+    ) -> None:
+        async def connect(**kwargs) -> None:
+            client.socket.connected = True
+
+        socket_connect = mocker.patch.object(
+            client.socket,
+            "connect",
+            mocker.AsyncMock(side_effect=connect),
+        )
+        await client._get_session()
+
+        @client.on_render_finish
+        async def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            pass
+
+        await client._connect_task
+        assert socket_connect.await_count == 1
+        client.socket.connected = False
+        await client.aclose()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import orjson
+import pytest
+
+from aiordr.models import CompactRender
+from aiordr.models import CompactSkin
+from aiordr.models import Render
+from aiordr.models import RenderResolution
+from aiordr.models import Skin
+from aiordr.models import StringPool
+
+
+@pytest.fixture
+def render_data(render_list: bytes) -> list[dict]:
+    return orjson.loads(render_list)["renders"]
+
+
+@pytest.fixture
+def skin_data(skins: bytes) -> list[dict]:
+    return orjson.loads(skins)["skins"]
+
+
+class TestCompact:
+    def test_render_roundtrip(self, render_data: list[dict]) -> None:
+        pool = StringPool()
+        records = [CompactRender(x, pool) for x in render_data]
+        models = [Render.model_validate(x) for x in render_data]
+
+        for record, model in zip(records, models):
+            assert record.to_model() == model
+            assert record.date == model.date
+            assert record.video_url == model.video_url
+            assert record.resolution is RenderResolution.HD_720
+            assert record.show_scoreboard is True
+            assert record.cursor_rainbow is False
+            assert CompactRender.from_model(model).to_model() == model
+
+        assert records[0].username is records[1].username
+        with pytest.raises(AttributeError):
+            records[0].username = "other"
+
+    def test_skin_roundtrip(self, skin_data: list[dict]) -> None:
+        pool = StringPool()
+        records = [CompactSkin(x, pool) for x in skin_data]
+        for record, data in zip(records, skin_data):
+            assert record.to_model() == Skin.model_validate(data)
+        assert records[0].url == "https://dl.issou.best/ordr/skins/-atmosphere-.osk"
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import aiordr
+from aiordr.models import RenderCreateResponse
+from aiordr.models import RenderOptions
+
+
+class TestRenderDedupCache:
+    def test_make_key(self) -> None:
+        options = RenderOptions()
+        key = aiordr.RenderDedupCache.make_key(
+            "default",
+            options,
+            replay_url="HTTPS://Example.com/replay/?b=2&a=1#x",
+        )
+        assert key == aiordr.RenderDedupCache.make_key(
+            "default",
+            options,
+            replay_url="https://example.com/replay?a=1&b=2",
+        )
+        assert key != aiordr.RenderDedupCache.make_key(
+            "default",
+            RenderOptions(music_volume=10),
+            replay_url="https://example.com/replay?a=1&b=2",
+        )
+
+    def test_lru_and_disk(self, tmp_path) -> None:
+        path = str(tmp_path / "dedup.sqlite")
+        cache = aiordr.RenderDedupCache(maxsize=2, path=path)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        cache.set_video_url(1, "https://link.issou.best/a")
+        cache.close()
+
+        cache = aiordr.RenderDedupCache(maxsize=2, path=path)
+        assert len(cache) == 2
+        assert cache.get("a").video_url == "https://link.issou.best/a"
+
+    @pytest.mark.asyncio
+    async def test_create_render_shared(self, mocker) -> None:
+        client = aiordr.ordrClient(developer_mode="devmode_success", dedup_cache=True)
+
+        async def submit(*args, **kwargs):
+            await asyncio.sleep(0)
+            return {"message": "Render added", "renderID": 7}
+
+        request = mocker.patch.object(aiordr.ordrClient, "_request", side_effect=submit)
+        results = await asyncio.gather(
+            *(
+                client.create_render("username", "default", replay_file=b"replay")
+                for _ in range(3)
+            ),
+        )
+        assert all(isinstance(x, RenderCreateResponse) for x in results)
+        assert {x.render_id for x in results} == {7}
+        assert request.await_count == 1
+
+        await client.create_render("username", "default", replay_file=b"replay")
+        assert request.await_count == 1
+
+        await client._on_event(
+            "render_fail_json",
+            {"renderID": 7, "errorMessage": "", "errorCode": 18},
+        )
+        await client.create_render("username", "default", replay_file=b"replay")
+        assert request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close(self, tmp_path) -> None:
+        path = str(tmp_path / "dedup.sqlite")
+        client = aiordr.ordrClient(developer_mode="devmode_success", dedup_cache=path)
+        client._dedup_cache.put("a", 1)
+        await client.aclose()
+        assert client._dedup_cache._db is None
+
+        cache = aiordr.RenderDedupCache(path=path)
+        assert cache.get("a") is not None
+        client = aiordr.ordrClient(developer_mode="devmode_success", dedup_cache=cache)
+        await client.aclose()
+        assert len(cache) == 1
+        cache.close()
+
+    def test_sync_client(self, mocker, tmp_path) -> None:
+        # Opened on this thread, used on the thread of the client's loop.
+        cache = aiordr.RenderDedupCache(path=str(tmp_path / "dedup.sqlite"))
+        mocker.patch.object(
+            aiordr.ordrClient,
+            "_request",
+            return_value={"message": "Render added", "renderID": 7},
+        )
+        client = aiordr.ordrSyncClient(
+            developer_mode="devmode_success",
+            dedup_cache=cache,
+        )
+        try:
+            client.create_render("username", "default", replay_url="url")
+            client.create_render("username", "default", replay_url="url")
+        finally:
+            client.close()
+        assert cache.get_render(7) is not None
+        cache.close()
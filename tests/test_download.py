@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import re
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import aiordr
+
+DATA = bytes(range(256)) * 4096
+
+
+def make_app(requests: list[str | None]) -> web.Application:
+    async def handler(request: web.Request) -> web.StreamResponse:
+        headers = {"Accept-Ranges": "bytes"}
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(DATA))
+            return web.Response(headers=headers)
+        range_header = request.headers.get("Range")
+        requests.append(range_header)
+        if range_header is None:
+            return web.Response(body=DATA, headers=headers)
+        start, end = re.match(r"bytes=(\d+)-(\d*)", range_header).groups()
+        start, end = int(start), int(end or len(DATA) - 1)
+        if start >= len(DATA):
+            return web.Response(status=416)
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(DATA)}"
+        return web.Response(status=206, body=DATA[start : end + 1], headers=headers)
+
+    app = web.Application()
+    app.router.add_route("*", "/video.mp4", handler)
+    return app
+
+
+class TestDownload:
+    @pytest.mark.asyncio
+    async def test_resume(self, client: aiordr.ordrClient, tmp_path) -> None:
+        requests: list[str | None] = []
+        path = str(tmp_path / "video.mp4")
+        with open(f"{path}.part", "wb") as f:
+            f.write(DATA[:1000])
+
+        async with TestServer(make_app(requests)) as server:
+            progress = []
+            await client.download_render(
+                str(server.make_url("/video.mp4")),
+                path,
+                progress=lambda done, total: progress.append((done, total)),
+            )
+        await client.aclose()
+
+        with open(path, "rb") as f:
+            assert f.read() == DATA
+        assert requests == ["bytes=1000-"]
+        assert progress[-1] == (len(DATA), len(DATA))
+
+    @pytest.mark.asyncio
+    async def test_segments(self, client: aiordr.ordrClient, tmp_path) -> None:
+        requests: list[str | None] = []
+        path = str(tmp_path / "video.mp4")
+
+        client._downloader = aiordr.RenderDownloader(
+            client._get_session,
+            segments=4,
+            segment_threshold=0,
+            chunk_size=4096,
+        )
+        state_path = f"{path}.part.json"
+        saved = []
+        async with TestServer(make_app(requests)) as server:
+            await client.download_render(
+                str(server.make_url("/video.mp4")),
+                path,
+                # The state must already be on disk in case the process is killed.
+                progress=lambda done, total: saved.append(os.path.exists(state_path)),
+            )
+        await client.aclose()
+
+        with open(path, "rb") as f:
+            assert f.read() == DATA
+        assert saved and all(saved)
+        assert not os.path.exists(state_path)
+        assert sorted(requests) == [
+            "bytes=0-262143",
+            "bytes=262144-524287",
+            "bytes=524288-786431",
+            "bytes=786432-1048575",
+        ]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+import aiordr
+from aiordr.engine import EngineConnectionError
+from aiordr.engine import NativeSocket
+from aiordr.engine import build_url
+
+from .classes import EngineIOServer
+
+EVENTS = [
+    ("render_added_json", {"renderID": 1}),
+    (
+        "render_progress_json",
+        {
+            "renderID": 1,
+            "username": "username",
+            "progress": "Rendering... 45%",
+            "renderer": "sunset",
+            "description": "",
+        },
+    ),
+    ("render_done_json", {"renderID": 1, "videoUrl": "https://link.issou.best/a"}),
+]
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    async def poll() -> None:
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def test_build_url() -> None:
+    assert (
+        build_url("https://apis.issou.best", "/ordr/ws")
+        == "wss://apis.issou.best/ordr/ws/?EIO=4&transport=websocket"
+    )
+
+
+class TestNativeSocket:
+    @pytest.mark.asyncio
+    async def test_events(self) -> None:
+        server = EngineIOServer(EVENTS)
+        async with TestServer(server.app) as test_server:
+            client = aiordr.ordrClient(
+                developer_mode="devmode_success",
+                engine="native",
+            )
+            client._base_url = str(test_server.make_url("")).rstrip("/")
+            finished = []
+
+            @client.on_render_finish
+            async def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+                finished.append(event)
+
+            events = []
+            client.add_listener(lambda event, data: events.append(event))
+            async with client:
+                assert isinstance(client.socket, NativeSocket)
+                assert client.socket.connected
+                await wait_for(lambda: len(finished) == 1)
+
+            assert events == [x[0] for x in EVENTS]
+            assert finished[0].video_url == "https://link.issou.best/a"
+            assert not client.socket.connected
+
+    @pytest.mark.asyncio
+    async def test_bad_payload(self) -> None:
+        bad = ("render_progress_json", {"renderID": 1, "progress": None})
+        server = EngineIOServer([bad, EVENTS[1]])
+        async with TestServer(server.app) as test_server:
+            client = aiordr.ordrClient(
+                developer_mode="devmode_success",
+                engine="native",
+            )
+            client._base_url = str(test_server.make_url("")).rstrip("/")
+            progress = []
+
+            @client.on_render_progress
+            async def on_render_progress(
+                event: aiordr.models.RenderProgressEvent,
+            ) -> None:
+                progress.append(event)
+
+            async with client:
+                await wait_for(lambda: len(progress) == 1)
+                assert client.socket.connected
+                assert not client.socket._task.done()
+
+            assert progress[0].progress == "Rendering... 45%"
+
+    @pytest.mark.asyncio
+    async def test_reconnect(self) -> None:
+        server = EngineIOServer([])
+        async with TestServer(server.app) as test_server:
+            socket = NativeSocket(reconnection_delay=0.01)
+            states = []
+
+            async def on_connect() -> None:
+                states.append("connect")
+
+            async def on_disconnect() -> None:
+                states.append("disconnect")
+
+            socket.on("connect", on_connect)
+            socket.on("disconnect", on_disconnect)
+            await socket.connect(str(test_server.make_url("")), "/ordr/ws")
+            await server.drop()
+            await wait_for(lambda: server.connections == 2 and socket.connected)
+            await socket.disconnect()
+
+        assert states == ["connect", "disconnect", "connect", "disconnect"]
+
+    @pytest.mark.asyncio
+    async def test_refused(self) -> None:
+        socket = NativeSocket()
+        with pytest.raises(EngineConnectionError):
+            await socket.connect("http://127.0.0.1:1", "/ordr/ws")
+        await socket.disconnect()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import pytest
+
+from aiordr.eta import ETATracker
+from aiordr.eta import RenderPhase
+from aiordr.eta import parse_progress
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def progress(render_id: int, text: str, renderer: str = "sunset") -> dict:
+    return {
+        "renderID": render_id,
+        "username": "username",
+        "progress": text,
+        "renderer": renderer,
+        "description": "",
+    }
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("In queue.", (RenderPhase.QUEUED, None)),
+        ("Preparing the render...", (RenderPhase.PREPARING, None)),
+        ("Rendering... 45%", (RenderPhase.RENDERING, 45.0)),
+        ("Finalizing...", (RenderPhase.FINALIZING, None)),
+        ("Uploading the video...", (RenderPhase.UPLOADING, None)),
+        ("Done.", (RenderPhase.DONE, None)),
+        ("Error: the replay is corrupted", (RenderPhase.FAILED, None)),
+        ("12.5%", (RenderPhase.RENDERING, 12.5)),
+        ("???", (RenderPhase.UNKNOWN, None)),
+    ],
+)
+def test_parse_progress(text: str, expected: tuple) -> None:
+    assert parse_progress(text) == expected
+
+
+class TestETATracker:
+    def test_eta(self) -> None:
+        clock = Clock()
+        tracker = ETATracker(clock=clock, alpha=0.5)
+
+        tracker.update("render_progress_json", progress(1, "Rendering... 0%"))
+        assert tracker.eta(1) is None
+        clock.now = 10
+        tracker.update("render_progress_json", progress(1, "Rendering... 20%"))
+        assert tracker.eta(1) == pytest.approx(40)
+        clock.now = 15
+        assert tracker.eta(1) == pytest.approx(35)
+
+        clock.now = 50
+        tracker.update("render_progress_json", progress(1, "Finalizing..."))
+        assert tracker.estimate(1).phase is RenderPhase.FINALIZING
+        clock.now = 60
+        tracker.update("render_done_json", {"renderID": 1, "videoUrl": ""})
+        assert tracker.eta(1) is None
+        assert tracker.renderer_rate("sunset") == pytest.approx(2)
+
+        tracker.update("render_progress_json", progress(2, "Rendering... 50%"))
+        assert tracker.eta(2) == pytest.approx(25 + 10)
+
+    def test_needs_refresh(self) -> None:
+        clock = Clock()
+        tracker = ETATracker(clock=clock)
+        tracker.update("render_progress_json", progress(1, "Rendering... 0%"))
+        assert tracker.needs_refresh(1)
+        assert not tracker.needs_refresh(1)
+
+        for i in range(1, 10):
+            clock.now = i
+            tracker.update("render_progress_json", progress(1, f"Rendering... {i}%"))
+        assert tracker.needs_refresh(1)
+        for i in range(10, 20):
+            clock.now = i
+            tracker.update("render_progress_json", progress(1, f"Rendering... {i}%"))
+            assert not tracker.needs_refresh(1, tolerance=5)
+
+        tracker.update("render_progress_json", progress(1, "Uploading..."))
+        assert tracker.needs_refresh(1)
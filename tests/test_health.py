@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+import aiordr
+from aiordr.exceptions import APIException
+from aiordr.health import HealthMonitor
+from aiordr.helpers import from_list
+from aiordr.models import ErrorCode
+from aiordr.models import RenderServer
+
+
+@pytest.fixture
+def servers(render_servers: bytes) -> list[RenderServer]:
+    data = orjson.loads(render_servers)
+    return from_list(RenderServer.model_validate, data["servers"])
+
+
+def busy(servers: list[RenderServer]) -> list[RenderServer]:
+    return [x.model_copy(update={"status": "Working"}) for x in servers]
+
+
+class TestHealthMonitor:
+    @pytest.mark.asyncio
+    async def test_check(self, mocker, client, servers) -> None:
+        monitor = HealthMonitor(client)
+        assert monitor.ready
+        count = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_server_online_count",
+            mocker.AsyncMock(side_effect=[0, 12, 12, 12]),
+        )
+        server_list = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_server_list",
+            mocker.AsyncMock(side_effect=[busy(servers), servers]),
+        )
+
+        assert not await monitor.check()
+        assert not monitor.ready
+        assert monitor.running
+        assert await monitor.check()
+        assert monitor.online_count == 12
+        assert server_list.await_count == 0
+
+        monitor.mark_unavailable()
+        assert not monitor.ready
+        assert not await monitor.check()
+        results = await asyncio.gather(monitor.check(), monitor.check())
+        assert results == [True, True]
+        assert monitor.ready
+        assert count.await_count == 4
+        assert server_list.await_count == 2
+        await monitor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_wait_until_ready(self, mocker, client) -> None:
+        client._health = HealthMonitor(client, interval=(0.01, 0.1), budget=1e4)
+        mocker.patch.object(
+            aiordr.ordrClient,
+            "get_server_online_count",
+            mocker.AsyncMock(side_effect=[0, 0, RuntimeError("boom"), 12]),
+        )
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_until_ready(timeout=0.001)
+        assert not client.health_monitor.ready
+        await asyncio.wait_for(client.wait_until_ready(), 5)
+        assert client.health_monitor.ready
+        assert not client.health_monitor.running
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_submission_retried(self, mocker, servers) -> None:
+        client = aiordr.ordrClient(
+            developer_mode="devmode_success",
+            health_monitor=True,
+        )
+        count = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_server_online_count",
+            mocker.AsyncMock(return_value=12),
+        )
+        mocker.patch.object(
+            aiordr.ordrClient,
+            "get_server_list",
+            mocker.AsyncMock(return_value=servers),
+        )
+        request = mocker.patch.object(
+            aiordr.ordrClient,
+            "_request",
+            side_effect=[
+                {"message": "Render added", "renderID": 6},
+                APIException(503, "Not ready", ErrorCode.SERVER_NOT_READY),
+                {"message": "Render added", "renderID": 7},
+            ],
+        )
+        mocker.patch.object(
+            HealthMonitor,
+            "_next_interval",
+            mocker.Mock(return_value=0),
+        )
+
+        resp = await client.create_render("username", "default", replay_file=b"x")
+        assert resp.render_id == 6
+        assert count.await_count == 0
+
+        resp = await client.create_render("username", "default", replay_file=b"x")
+        assert resp.render_id == 7
+        assert request.await_count == 3
+        assert count.await_count == 1
+        await client.aclose()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+import aiordr
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def renders(render_list: bytes) -> aiordr.models.RendersResponse:
+    return aiordr.models.RendersResponse.model_validate_json(render_list)
+
+
+class TestRenderHistory:
+    def test_queries(self, renders: aiordr.models.RendersResponse) -> None:
+        history = aiordr.RenderHistory(capacity=1)
+        assert history.append(renders) == 2
+        assert history.append(renders) == 0
+        assert len(history) == 2
+
+        assert history.group_mean("render_total_time", "renderer") == {
+            "Phil's PC 4": 60000.0,
+            "sunset": 90000.0,
+        }
+        assert history.group_count("skin") == {"default": 1, "-atmosphere-": 1}
+        assert history.percentile("upload_total_time", 50) == 7500.0
+        by_mods = history.percentile("map_length", [0, 100], by="replay_mods")
+        assert by_mods["HDDT"].tolist() == [200.0, 200.0]
+        counts, _ = history.histogram("map_length", bins=2)
+        assert counts.tolist() == [1, 1]
+
+    def test_save_load(self, renders: aiordr.models.RendersResponse, tmp_path) -> None:
+        history = aiordr.RenderHistory()
+        history.append(renders)
+        path = str(tmp_path / "history.npz")
+        history.save(path)
+
+        loaded = aiordr.RenderHistory.load(path)
+        assert len(loaded) == 2
+        assert loaded.categories("renderer") == history.categories("renderer")
+        assert np.array_equal(loaded.column("date"), history.column("date"))
+        assert loaded.append(renders) == 0
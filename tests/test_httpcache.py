@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import aiohttp
+import pytest
+
+import aiordr
+from aiordr.httpcache import HTTPCache
+
+from .classes import MockResponse
+
+
+class TestHTTPCache:
+    def test_store(self) -> None:
+        cache = HTTPCache()
+        key = cache.make_key("https://example.com/skins", {"b": 2, "a": 1})
+        assert key == "https://example.com/skins?a=1&b=2"
+
+        assert not cache.store(key, {}, "application/json", b"{}")
+        assert cache.store(key, {"ETag": '"v1"'}, "application/json", b"{}")
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.body == b"{}"
+        assert not cached.fresh
+        assert cached.validators() == {"If-None-Match": '"v1"'}
+
+        cache.refresh(key, {"Cache-Control": "public, max-age=60"})
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.fresh
+        assert cached.etag == '"v1"'
+
+    def test_evict(self) -> None:
+        cache = HTTPCache(max_size=10)
+        headers = {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        cache.store("a", headers, "text/html", b"12345")
+        cache.store("b", headers, "text/html", b"12345")
+        cache.touch("a")
+        cache.store("c", headers, "text/html", b"12345")
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.size == 10
+        assert not cache.store("d", headers, "text/html", b"x" * 11)
+
+    def test_persist(self, tmp_path) -> None:
+        path = str(tmp_path / "http.sqlite")
+        cache = HTTPCache(path)
+        cache.store("a", {"ETag": "x"}, "text/html", b"body")
+        cache.close()
+
+        cache = HTTPCache(path)
+        assert len(cache) == 1
+        assert cache.size == 4
+        cached = cache.get("a")
+        assert cached is not None
+        assert cached.body == b"body"
+
+
+class TestClientHTTPCache:
+    def test_default_path(self, monkeypatch, tmp_path) -> None:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        client = aiordr.ordrClient(developer_mode="devmode_success", http_cache=True)
+        client._http_cache.store("a", {"ETag": '"v1"'}, "text/plain", b"body")
+        client._http_cache.close()
+
+        cache = aiordr.HTTPCache(str(tmp_path / "aiordr" / "http.sqlite"))
+        assert cache.get("a") is not None
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_revalidate(self, mocker, tmp_path, skins: bytes) -> None:
+        client = aiordr.ordrClient(
+            developer_mode="devmode_success",
+            limiter=(10, 300),
+            http_cache=str(tmp_path / "http.sqlite"),
+        )
+        resp = MockResponse(skins, 200)
+        resp.headers["ETag"] = '"v1"'
+        async with client:
+            get = mocker.patch.object(client._session, "get", return_value=resp)
+            first = await client.get_skins()
+
+            get.return_value = MockResponse(b"", 304)
+            second = await client.get_skins()
+            assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+            assert second == first
+
+    @pytest.mark.asyncio
+    async def test_close(self, tmp_path) -> None:
+        owned = aiordr.ordrClient(
+            developer_mode="devmode_success",
+            http_cache=str(tmp_path / "http.sqlite"),
+        )
+        await owned.aclose()
+        with pytest.raises(RuntimeError):
+            len(owned._http_cache)
+
+        cache = HTTPCache()
+        client = aiordr.ordrClient(developer_mode="devmode_success", http_cache=cache)
+        await client.aclose()
+        assert len(cache) == 0
+
+    def test_sync_client(self, mocker, skins: bytes) -> None:
+        # Created on this thread, used on the thread of the client's loop.
+        cache = HTTPCache()
+        resp = MockResponse(skins, 200)
+        resp.headers["ETag"] = '"v1"'
+        mocker.patch.object(aiohttp.ClientSession, "get", return_value=resp)
+        client = aiordr.ordrSyncClient(
+            developer_mode="devmode_success",
+            http_cache=cache,
+        )
+        try:
+            client.get_skins()
+        finally:
+            client.close()
+        assert len(cache) == 1
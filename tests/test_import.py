@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+HEAVY_MODULES = ("aiohttp", "aiolimiter", "numpy", "orjson", "pydantic", "socketio")
+SUBMODULES = (
+    "catalog",
+    "client",
+    "dedup",
+    "download",
+    "engine",
+    "eta",
+    "exceptions",
+    "health",
+    "helpers",
+    "history",
+    "httpcache",
+    "limiter",
+    "models",
+    "offload",
+    "polling",
+    "preflight",
+    "presets",
+    "recording",
+    "stream",
+    "sync",
+)
+MODEL_SUBMODULES = (
+    "base",
+    "compact",
+    "errorcode",
+    "events",
+    "render",
+    "renderserver",
+    "skin",
+)
+
+
+def loaded_modules(code: str) -> set[str]:
+    script = (
+        "import sys\n"
+        f"{code}\n"
+        f"print(','.join(x for x in {HEAVY_MODULES!r} if x in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+class TestLazyImport:
+    def test_import_package(self) -> None:
+        assert loaded_modules("import aiordr") == set()
+
+    def test_client_without_events(self) -> None:
+        loaded = loaded_modules("import aiordr; aiordr.ordrClient()")
+        assert "socketio" not in loaded
+        assert "numpy" not in loaded
+
+    def test_socket_on_use(self) -> None:
+        loaded = loaded_modules("import aiordr; aiordr.ordrClient().socket")
+        assert "socketio" in loaded
+
+    def test_exports(self) -> None:
+        import aiordr
+        import aiordr.models
+
+        for name in aiordr.__all__:
+            assert getattr(aiordr, name) is not None
+        for name in aiordr.models.__all__:
+            assert getattr(aiordr.models, name) is not None
+
+    def test_submodules(self) -> None:
+        # In a fresh interpreter, where no submodule was imported yet.
+        code = (
+            "import aiordr\n"
+            f"for name in {SUBMODULES!r}:\n"
+            "    getattr(aiordr, name)\n"
+            f"for name in {MODEL_SUBMODULES!r}:\n"
+            "    getattr(aiordr.models, name)\n"
+            "for module in (aiordr, aiordr.models):\n"
+            "    try:\n"
+            "        module.missing\n"
+            "    except AttributeError:\n"
+            "        pass\n"
+            "    else:\n"
+            "        raise AssertionError(module)"
+        )
+        loaded_modules(code)
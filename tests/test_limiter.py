@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+import aiordr
+from aiordr.limiter import FileRateLimiter
+from aiordr.limiter import RateCoordinator
+from aiordr.limiter import RemoteRateLimiter
+from aiordr.limiter import reserve
+
+
+async def acquire_times(limiters: list, count: int) -> list[float]:
+    times = []
+
+    async def acquire(limiter) -> None:
+        async with limiter:
+            times.append(time.monotonic())
+
+    await asyncio.gather(*(acquire(limiters[i % len(limiters)]) for i in range(count)))
+    return sorted(times)
+
+
+class TestReserve:
+    def test_window(self) -> None:
+        slots: list[float] = []
+        starts = [reserve(slots, 0.0, 3, 10.0) for _ in range(7)]
+        assert starts == [0.0, 0.0, 0.0, 10.0, 10.0, 10.0, 20.0]
+        assert len(slots) == 3
+        assert reserve(slots, 35.0, 3, 10.0) == 35.0
+
+
+class TestFileRateLimiter:
+    @pytest.mark.asyncio
+    async def test_shared(self, tmp_path) -> None:
+        path = str(tmp_path / "limiter")
+        limiters = [FileRateLimiter(path, 2, 0.2) for _ in range(2)]
+        times = await acquire_times(limiters, 5)
+        assert times[2] - times[0] >= 0.19
+        assert times[4] - times[2] >= 0.19
+
+
+class TestRemoteRateLimiter:
+    @pytest.mark.asyncio
+    async def test_shared(self) -> None:
+        coordinator = RateCoordinator(2, 0.2)
+        host, port = await coordinator.start()
+        limiters = [RemoteRateLimiter(host, port) for _ in range(2)]
+        try:
+            times = await acquire_times(limiters, 5)
+            assert limiters[0].max_rate == 2
+            assert limiters[0].time_period == 0.2
+            assert times[2] - times[0] >= 0.19
+            assert times[4] - times[2] >= 0.19
+        finally:
+            for limiter in limiters:
+                await limiter.aclose()
+            await coordinator.close()
+
+    def test_client(self, tmp_path) -> None:
+        limiter = FileRateLimiter(str(tmp_path / "limiter"), 1, 60)
+        client = aiordr.ordrClient(developer_mode="devmode_success", limiter=limiter)
+        assert client._limiter is limiter
+
+    def test_client_rate(self) -> None:
+        client = aiordr.ordrClient(developer_mode="devmode_success", limiter=[2, 60])
+        assert (client._limiter.max_rate, client._limiter.time_period) == (2, 60)
+        with pytest.raises(TypeError):
+            aiordr.ordrClient(developer_mode="devmode_success", limiter=2)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import aiordr
+from aiordr.offload import LoopStallMonitor
+
+from .classes import MockResponse
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestOffload:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(("threshold", "submitted"), [(0, 1), (None, 0)])
+    async def test_threshold(
+        self,
+        mocker,
+        render_list: bytes,
+        threshold: int | None,
+        submitted: int,
+    ) -> None:
+        executor = CountingExecutor()
+        client = aiordr.ordrClient(
+            developer_mode="devmode_success",
+            offload_threshold=threshold,
+            executor=executor,
+        )
+        async with client:
+            mocker.patch.object(
+                client._session,
+                "get",
+                return_value=MockResponse(render_list, 200),
+            )
+            data = await client.get_render_list()
+        executor.shutdown()
+        assert isinstance(data, aiordr.models.RendersResponse)
+        assert [x.id for x in data.renders] == [1234, 1235]
+        assert executor.submitted == submitted
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, render_list: bytes) -> None:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            client = aiordr.ordrClient(offload_threshold=0, executor=executor)
+            data = await client._decode(
+                "application/json",
+                render_list,
+                aiordr.models.RendersResponse,
+            )
+        assert data == aiordr.models.RendersResponse.model_validate_json(render_list)
+
+
+class TestLoopStallMonitor:
+    @pytest.mark.asyncio
+    async def test_stall(self) -> None:
+        monitor = LoopStallMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.02)
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+        monitor.stop()
+        assert monitor.stalls == 1
+        assert monitor.max_stall >= 0.05
+        assert monitor.stall_time == monitor.max_stall
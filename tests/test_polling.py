@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+
+import aiohttp
+import orjson
+import pytest
+from socketio.exceptions import ConnectionError as SocketConnectionError
+
+import aiordr
+from aiordr.polling import RenderPoller
+
+
+@pytest.fixture
+def render_list_json(render_list: bytes) -> dict:
+    return orjson.loads(render_list)
+
+
+def make_response(data: dict) -> aiordr.models.RendersResponse:
+    return aiordr.models.RendersResponse.model_validate(data)
+
+
+class TestRenderPoller:
+    @pytest.mark.asyncio
+    async def test_poll_tracked(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        render_list_json: dict,
+    ) -> None:
+        poller = RenderPoller(client)
+        events = []
+        client.add_listener(lambda event, data: events.append((event, data)))
+        get_render_list = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_render_list",
+            mocker.AsyncMock(return_value=make_response(render_list_json)),
+        )
+        client._tracked[1234] = ("username", None)
+        client._tracked[1235] = ("username", None)
+
+        assert await poller.poll() == (1, 2)
+        assert [x[0] for x in events] == ["render_done_json", "render_progress_json"]
+        assert list(client._tracked) == [1235]
+
+        assert await poller.poll() == (1, 0)
+        assert get_render_list.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_watched(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        render_list_json: dict,
+    ) -> None:
+        poller = RenderPoller(client, usernames=["username"])
+        events = []
+        client.add_listener(lambda event, data: events.append((event, data)))
+        mocker.patch.object(
+            aiordr.ordrClient,
+            "get_render_list",
+            mocker.AsyncMock(
+                side_effect=lambda **kwargs: make_response(render_list_json),
+            ),
+        )
+
+        assert await poller.poll() == (1, 0)
+
+        render_list_json["renders"][1]["progress"] = "Done."
+        render_list_json["renders"][1]["videoUrl"] = "https://link.issou.best/fghij"
+        new = dict(render_list_json["renders"][1], renderID=1236, progress="In queue.")
+        new["videoUrl"] = "None"
+        render_list_json["renders"].insert(0, new)
+        assert await poller.poll() == (1, 3)
+        assert events == [
+            ("render_added_json", {"renderID": 1236}),
+            ("render_progress_json", mocker.ANY),
+            ("render_done_json", mocker.ANY),
+        ]
+        assert events[2][1]["renderID"] == 1235
+
+        assert await poller.poll() == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_poll_error(
+        self,
+        mocker,
+        client: aiordr.ordrClient,
+        render_list_json: dict,
+    ) -> None:
+        poller = RenderPoller(
+            client,
+            usernames=["username"],
+            interval=(0, 0),
+            budget=1e4,
+        )
+
+        def get_render_list(**kwargs) -> aiordr.models.RendersResponse:
+            if mock.await_count == 1:
+                raise aiohttp.ClientConnectionError("net down")
+            return make_response(render_list_json)
+
+        mock = mocker.patch.object(
+            aiordr.ordrClient,
+            "get_render_list",
+            mocker.AsyncMock(side_effect=get_render_list),
+        )
+
+        poller.start()
+        for _ in range(100):
+            if mock.await_count >= 2:
+                break
+            await asyncio.sleep(0.01)
+        assert mock.await_count >= 2
+        assert poller.running
+        await poller.aclose()
+        assert not poller.running
+
+    def test_interval(self) -> None:
+        client = aiordr.ordrClient(
+            developer_mode="devmode_success",
+            limiter=(10, 300),
+        )
+        poller = RenderPoller(client, interval=(5, 40), budget=0.5)
+        assert poller._next_interval(1, 0) == 60
+        poller._interval = 40
+        assert poller._next_interval(0, 1) == 5
+        assert poller._next_interval(0, 0) == 10
+
+    @pytest.mark.asyncio
+    async def test_fallback(self, mocker) -> None:
+        client = aiordr.ordrClient(developer_mode="devmode_success", polling=True)
+        mocker.patch.object(
+            client.socket,
+            "connect",
+            mocker.AsyncMock(side_effect=SocketConnectionError("blocked")),
+        )
+        await client.connect()
+        assert client._poller is not None
+        assert client._poller.running
+
+        await client._on_connect()
+        assert not client._poller.running
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_not_restarted_by_aclose(self, mocker) -> None:
+        client = aiordr.ordrClient(developer_mode="devmode_success", polling=True)
+        client._tracked[1234] = ("username", None)
+        mocker.patch.object(client.socket, "connect", mocker.AsyncMock())
+        # Like python-socketio and the native engine, disconnecting fires the hook.
+        mocker.patch.object(
+            client.socket,
+            "disconnect",
+            mocker.AsyncMock(side_effect=client._on_disconnect),
+        )
+        await client.connect()
+        await client._on_connect()
+
+        await client.aclose()
+        assert not client._poller.running
+        assert client._poller._task is None
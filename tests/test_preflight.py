@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import io
+import struct
+
+import pytest
+
+import aiordr
+from aiordr.models import ErrorCode
+from aiordr.models import RenderOptions
+
+
+def osr_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return b"\x0b" + bytes([len(data)]) + data
+
+
+def make_replay(mode: int = 0, mods: int = 0, frames: bytes = b"\x00" * 16) -> bytes:
+    return (
+        bytes([mode])
+        + struct.pack("<i", 20230101)
+        + osr_string("0" * 32)
+        + osr_string("player")
+        + osr_string("1" * 32)
+        + struct.pack("<6HiHBi", 300, 0, 0, 0, 0, 0, 1000000, 500, 1, mods)
+        + osr_string("")
+        + struct.pack("<qi", 0, len(frames))
+        + frames
+    )
+
+
+@pytest.fixture
+def preflight() -> aiordr.RenderPreflight:
+    return aiordr.RenderPreflight()
+
+
+class TestRenderPreflight:
+    def test_valid_replay(self, preflight: aiordr.RenderPreflight) -> None:
+        replay = io.BytesIO(make_replay())
+        preflight.check("username", "default", replay_file=replay)
+        assert replay.tell() == 0
+
+    @pytest.mark.parametrize(
+        ("replay", "error_code"),
+        [
+            (b"", ErrorCode.BAD_REPLAY_FILE),
+            (make_replay(mode=1), ErrorCode.INVALID_GAMEMODE),
+            (make_replay(mods=1 << 11), ErrorCode.REPLAY_AUTO_MODE),
+            (make_replay(frames=b""), ErrorCode.NO_REPLAY_INPUT_DATA),
+            (make_replay()[:-4], ErrorCode.REPLAY_FILE_CORRUPTED),
+            (make_replay()[:20], ErrorCode.BAD_REPLAY_FILE),
+        ],
+    )
+    def test_invalid_replay(
+        self,
+        preflight: aiordr.RenderPreflight,
+        replay: bytes,
+        error_code: ErrorCode,
+    ) -> None:
+        with pytest.raises(aiordr.exceptions.PreflightException) as exc:
+            preflight.check_replay(replay)
+        assert exc.value.error_code == error_code
+
+    def test_invalid_options(self, preflight: aiordr.RenderPreflight) -> None:
+        with pytest.raises(aiordr.exceptions.PreflightException, match="musicVolume"):
+            preflight.check_options(RenderOptions(music_volume=150))
+
+    def test_invalid_skin(self) -> None:
+        with open("tests/data/multiple_skin.json", "rb") as f:
+            skins = aiordr.models.SkinsResponse.model_validate_json(f.read())
+        catalog = aiordr.SkinCatalog()
+        catalog.update(skins.skins)
+        preflight = aiordr.RenderPreflight(skin_catalog=catalog)
+
+        preflight.check_skin("default")
+        with pytest.raises(aiordr.exceptions.PreflightException) as exc:
+            preflight.check_skin("not_a_skin")
+        assert exc.value.error_code == ErrorCode.INVALID_SKIN
+
+    @pytest.mark.asyncio
+    async def test_create_render_skips_request(self, mocker) -> None:
+        client = aiordr.ordrClient(developer_mode="devmode_success", preflight=True)
+        request = mocker.patch.object(aiordr.ordrClient, "_request")
+        with pytest.raises(aiordr.exceptions.PreflightException):
+            await client.create_render("username", "default", replay_url="ftp://x")
+        request.assert_not_called()
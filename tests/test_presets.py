@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+import aiordr
+from aiordr.models import FrozenRenderOptions
+from aiordr.models import RenderOptions
+from aiordr.models import RenderResolution
+from aiordr.presets import RenderPresets
+from aiordr.presets import encode_options
+
+
+class TestRenderPresets:
+    def test_encode_options(self) -> None:
+        options = RenderOptions(
+            resolution=RenderResolution.HD_1080,
+            music_volume=30,
+            show_pp_counter=False,
+        )
+        assert dict(encode_options(options)) == {
+            "musicVolume": "30",
+            "showPPCounter": "false",
+            "resolution": "1920x1080",
+        }
+        assert encode_options(RenderOptions()) == (("resolution", "1280x720"),)
+
+    def test_register(self) -> None:
+        presets = RenderPresets({"quiet": RenderOptions(music_volume=0)})
+        hd = presets.register(
+            "hd",
+            presets.get("quiet"),
+            resolution=RenderResolution.HD_1080,
+        )
+        assert isinstance(hd, FrozenRenderOptions)
+        assert hd.music_volume == 0
+        assert hash(hd) == hash(presets.get("hd"))
+        assert dict(presets.fields("hd"))["resolution"] == "1920x1080"
+        assert presets.names == ["quiet", "hd"]
+        with pytest.raises(ValidationError):
+            hd.music_volume = 10
+
+        presets.unregister("quiet")
+        assert "quiet" not in presets
+        with pytest.raises(KeyError):
+            presets.get("quiet")
+
+    @pytest.mark.asyncio
+    async def test_create_render(self, mocker, client: aiordr.ordrClient) -> None:
+        client.presets.register("hd", resolution=RenderResolution.HD_1080)
+        request = mocker.patch.object(
+            aiordr.ordrClient,
+            "_request",
+            return_value={"message": "Render added", "renderID": 7},
+        )
+
+        await client.create_render("username", "default", replay_url="url", preset="hd")
+        form_data = request.call_args.kwargs["data"]
+        fields = {x[0]["name"]: x[2] for x in form_data._fields}
+        assert fields["resolution"] == "1920x1080"
+        assert fields["username"] == "username"
+        assert fields["replayURL"] == "url"
+
+        with pytest.raises(ValueError):
+            await client.create_render(
+                "username",
+                "default",
+                replay_url="url",
+                preset="hd",
+                render_options=RenderOptions(),
+            )
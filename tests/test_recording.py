@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+import aiordr
+
+
+class TestRecording:
+    @pytest.mark.asyncio
+    async def test_record_and_play(self, client: aiordr.ordrClient, tmp_path) -> None:
+        path = str(tmp_path / "events.jsonl.gz")
+        async with aiordr.EventRecorder(path, batch_size=2) as recorder:
+            recorder.attach(client)
+            for i in range(5):
+                await client._on_event(
+                    "render_progress_json",
+                    {
+                        "renderID": i,
+                        "username": "username",
+                        "progress": f"Rendering... {i * 20}%",
+                        "renderer": "renderer",
+                        "description": "",
+                    },
+                )
+            await client._on_event("render_done_json", {"renderID": 4, "videoUrl": "x"})
+        assert client._listeners == []
+
+        player_client = aiordr.ordrClient(developer_mode="devmode_success")
+        progressed = []
+        finished = []
+
+        @player_client.on_render_progress
+        async def on_render_progress(event: aiordr.models.RenderProgressEvent) -> None:
+            progressed.append(event.render_id)
+
+        @player_client.on_render_finish
+        async def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            finished.append(event.video_url)
+
+        played = await aiordr.EventPlayer(path, speed=0).play(player_client)
+        assert played == 6
+        assert progressed == [0, 1, 2, 3, 4]
+        assert finished == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_listener_error(self, client: aiordr.ordrClient, caplog) -> None:
+        def broken(event: str, data: dict) -> None:
+            raise TypeError("boom")
+
+        events = []
+        finished = []
+        client.add_listener(broken)
+        client.add_listener(lambda event, data: events.append(event))
+
+        @client.on_render_finish
+        async def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            finished.append(event.video_url)
+
+        await client._on_event("render_done_json", {"renderID": 4, "videoUrl": "x"})
+        assert events == ["render_done_json"]
+        assert finished == ["x"]
+        assert "boom" in caplog.text
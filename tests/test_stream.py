@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import aiordr
+from aiordr.models import RenderFinishEvent
+from aiordr.models import RenderProgressEvent
+
+
+def progress(render_id: int, username: str) -> dict:
+    return {
+        "renderID": render_id,
+        "username": username,
+        "progress": "Rendering...",
+        "renderer": "renderer",
+        "description": "",
+    }
+
+
+class TestEventStream:
+    @pytest.mark.asyncio
+    async def test_filters(self, mocker, client: aiordr.ordrClient) -> None:
+        validate = mocker.spy(RenderProgressEvent, "model_validate")
+        async with client.events(
+            types=[RenderFinishEvent],
+            usernames=["Username"],
+        ) as stream:
+            await client._on_event("render_progress_json", progress(1, "username"))
+            await client._on_event("render_progress_json", progress(2, "other"))
+            await client._on_event("render_done_json", {"renderID": 2, "videoUrl": "b"})
+            await client._on_event("render_done_json", {"renderID": 1, "videoUrl": "a"})
+
+            event = await asyncio.wait_for(anext(stream), 1)
+            assert isinstance(event, RenderFinishEvent)
+            assert event.video_url == "a"
+        assert validate.call_count == 0
+        assert client._listeners == []
+
+        assert [x async for x in stream] == []
+
+    @pytest.mark.asyncio
+    async def test_drop_policy(self, client: aiordr.ordrClient) -> None:
+        oldest = client.events(render_ids=[1, 2, 3], maxsize=2)
+        newest = client.events(maxsize=2, drop_policy="drop_newest")
+        for render_id in (1, 2, 3, 4):
+            await client._on_event("render_added_json", {"renderID": render_id})
+        oldest.close()
+        newest.close()
+
+        assert [x.render_id async for x in oldest] == [2, 3]
+        assert oldest.dropped == 1
+        assert [x.render_id async for x in newest] == [1, 2]
+        assert newest.dropped == 2
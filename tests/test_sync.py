@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+
+import pytest
+
+import aiordr
+
+
+class TestSyncClient:
+    def test_concurrent_calls(self, mocker, skins: bytes) -> None:
+        loops = set()
+
+        async def request(*args, **kwargs):
+            loops.add(id(asyncio.get_running_loop()))
+            return kwargs["model"].model_validate_json(skins)
+
+        mocker.patch.object(aiordr.ordrClient, "_request", side_effect=request)
+        client = aiordr.ordrSyncClient(developer_mode="devmode_success")
+        try:
+            with ThreadPoolExecutor(4) as pool:
+                results = list(pool.map(lambda _: client.get_skins(), range(8)))
+        finally:
+            client.close()
+
+        assert all(isinstance(x, aiordr.models.SkinsResponse) for x in results)
+        assert len(loops) == 1
+
+    def test_callbacks(self) -> None:
+        client = aiordr.ordrSyncClient(developer_mode="devmode_success")
+        done = threading.Event()
+        received = []
+
+        @client.on_render_finish
+        def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            received.append((event.video_url, threading.current_thread().name))
+            done.set()
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                client.client._on_event(
+                    "render_done_json",
+                    {"renderID": 1, "videoUrl": "x"},
+                ),
+                client._loop,
+            ).result()
+            assert done.wait(5)
+        finally:
+            client.close()
+
+        assert received[0][0] == "x"
+        assert received[0][1].startswith("aiordr-callback")
+
+    def test_timeout_cancels(self, mocker) -> None:
+        cancelled = threading.Event()
+
+        async def request(*args, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mocker.patch.object(aiordr.ordrClient, "_request", side_effect=request)
+        client = aiordr.ordrSyncClient(developer_mode="devmode_success", timeout=0.05)
+        try:
+            with pytest.raises(TimeoutError):
+                client.get_server_online_count()
+            assert cancelled.wait(5)
+        finally:
+            client.close()
+
+    def test_callback_error_logged(self, caplog) -> None:
+        client = aiordr.ordrSyncClient(developer_mode="devmode_success")
+
+        @client.on_render_finish
+        def on_render_finish(event: aiordr.models.RenderFinishEvent) -> None:
+            raise ValueError("boom")
+
+        try:
+            with caplog.at_level(logging.ERROR, logger="aiordr.sync"):
+                asyncio.run_coroutine_threadsafe(
+                    client.client._on_event(
+                        "render_done_json",
+                        {"renderID": 1, "videoUrl": "x"},
+                    ),
+                    client._loop,
+                ).result()
+                client._executor.shutdown(wait=True)
+        finally:
+            client.close()
+
+        assert "boom" in caplog.text